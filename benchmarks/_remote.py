@@ -0,0 +1,35 @@
+"""Run an emulator in a child process so it does not share the GIL or heap with the client"""
+
+import multiprocessing
+
+
+def _serve(emulator_class, kwargs, conn) -> None:
+    with emulator_class(**kwargs) as emulator:
+        conn.send((emulator.url, emulator.credentials()))
+        while conn.recv() == "stats":
+            conn.send(emulator.stats())
+
+
+class RemoteEmulator:
+    """Emulator in a child process, with the url/credentials/stats of a local one"""
+
+    def __init__(self, emulator_class, **kwargs):
+        self._conn, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_serve, args=(emulator_class, kwargs, child),
+                                                daemon=True)
+
+    def __enter__(self):
+        self._process.start()
+        self.url, self._credentials = self._conn.recv()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._conn.send("stop")
+        self._process.join()
+
+    def credentials(self):
+        return self._credentials
+
+    def stats(self):
+        self._conn.send("stats")
+        return self._conn.recv()
@@ -0,0 +1,62 @@
+"""
+Broadcast throughput of BroadcastQueue by worker count.
+
+Broadcasts a batch of signed transactions spread over several accounts to
+the local emulator (with simulated network latency) once per worker count,
+and once with the blocking one-call-at-a-time loop for comparison. The
+emulator runs in a child process so it does not compete for the GIL.
+
+Usage:
+    python benchmarks/bench_broadcast.py [--transactions 400] [--accounts 40] [--latency 0.02]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from okxpy.auth import OKXAuth  # noqa: E402
+from okxpy.emulator import Emulator  # noqa: E402
+from okxpy.utils.http import HTTPTransport  # noqa: E402
+from okxpy.wallet import BroadcastQueue, WalletClient  # noqa: E402
+
+from _remote import RemoteEmulator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=400)
+    parser.add_argument("--accounts", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    addresses = ["0x%040x" % i for i in range(args.accounts)]
+    batch = [(f"0x{i:08x}", addresses[i % args.accounts]) for i in range(args.transactions)]
+
+    with RemoteEmulator(Emulator, latency=args.latency) as emulator:
+        credentials = emulator.credentials()
+        auth = OKXAuth(credentials["api_key"], credentials["secret_key"],
+                       credentials["passphrase"], credentials["project_id"])
+        wallet = WalletClient(auth, HTTPTransport(emulator.url, pool_maxsize=max(args.workers)))
+
+        started = time.perf_counter()
+        for signed_tx, address in batch:
+            wallet.broadcast_transaction(signed_tx, "1", address)
+        elapsed = time.perf_counter() - started
+        print(f"{'sequential':<12} {len(batch) / elapsed:8.0f} tx/s")
+
+        for workers in args.workers:
+            started = time.perf_counter()
+            with BroadcastQueue(wallet, workers=workers) as broadcasts:
+                futures = [broadcasts.submit(signed_tx, "1", address) for signed_tx, address in batch]
+                for future in futures:
+                    future.result()
+            elapsed = time.perf_counter() - started
+            print(f"{workers:3d} workers  {len(batch) / elapsed:8.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+HTTP/2 multiplexing versus the pooled HTTP/1.1 transport.
+
+Many threads issue wallet calls at once against the local emulator with
+fixed server latency: once over HTTP/1.1 with a connection pool as large
+as the concurrency, once over HTTP/2 streams on a single h2c connection
+(H2Emulator). Reports throughput, latency percentiles and the number of
+connections the server accepted. The async transport is measured the
+same way. The emulator runs in a child process so it does not compete
+with the client for the GIL.
+
+Usage:
+    python benchmarks/bench_http2.py [--requests 2000] [--concurrency 200] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from okxpy.auth import OKXAuth  # noqa: E402
+from okxpy.emulator import Emulator, H2Emulator  # noqa: E402
+from okxpy.utils.http import AsyncHTTPTransport, HTTP2Transport, HTTPTransport  # noqa: E402
+from okxpy.wallet.client import AsyncWalletClient, WalletClient  # noqa: E402
+
+from _remote import RemoteEmulator  # noqa: E402
+
+
+def _auth(emulator) -> OKXAuth:
+    credentials = emulator.credentials()
+    return OKXAuth(credentials["api_key"], credentials["secret_key"],
+                   credentials["passphrase"], credentials["project_id"])
+
+
+def _report(name: str, latencies, elapsed: float, emulator) -> None:
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{name:<14} {len(latencies) / elapsed:8.0f} req/s   p50 {p50:6.1f} ms   "
+          f"p99 {p99:6.1f} ms   connections {emulator.stats()['connections']}")
+
+
+def run_threads(name, emulator, transport, requests: int, concurrency: int) -> None:
+    wallet = WalletClient(_auth(emulator), transport)
+    wallet.get_gas_price("1")
+
+    def call(_):
+        started = time.perf_counter()
+        response = wallet.get_gas_price("1")
+        assert response["code"] == "0", response
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(call, range(requests)))
+    _report(name, latencies, time.perf_counter() - started, emulator)
+    transport.close()
+
+
+def run_async(name, emulator, http2: bool, requests: int, concurrency: int) -> None:
+    async def main():
+        transport = AsyncHTTPTransport(emulator.url, max_connections=concurrency,
+                                       pool_maxsize=concurrency, http2=http2)
+        wallet = AsyncWalletClient(_auth(emulator), transport)
+        await wallet.get_gas_price("1")
+        # Same number of callers as the thread pool of the sync runs
+        callers = asyncio.Semaphore(concurrency)
+
+        async def call():
+            async with callers:
+                started = time.perf_counter()
+                response = await wallet.get_gas_price("1")
+                assert response["code"] == "0", response
+                return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(call() for _ in range(requests)))
+        _report(name, latencies, time.perf_counter() - started, emulator)
+        await transport.aclose()
+
+    asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    print(f"{args.requests} requests, {args.concurrency} concurrent, "
+          f"{args.latency * 1000:.0f} ms server latency")
+
+    with RemoteEmulator(Emulator, latency=args.latency) as emulator:
+        transport = HTTPTransport(emulator.url, pool_maxsize=args.concurrency)
+        run_threads("sync http/1.1", emulator, transport, args.requests, args.concurrency)
+    with RemoteEmulator(H2Emulator, latency=args.latency) as emulator:
+        transport = HTTP2Transport(emulator.url, max_streams=args.concurrency)
+        run_threads("sync http/2", emulator, transport, args.requests, args.concurrency)
+    with RemoteEmulator(Emulator, latency=args.latency) as emulator:
+        run_async("async http/1.1", emulator, False, args.requests, args.concurrency)
+    with RemoteEmulator(H2Emulator, latency=args.latency) as emulator:
+        run_async("async http/2", emulator, True, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Cost of request instrumentation.
+
+Measures the bookkeeping an Instrumentation adds to one HTTP attempt
+(begin, phase laps, end with histogram and counter updates), and the
+end-to-end request rate against the local emulator with and without it.
+
+Usage:
+    python benchmarks/bench_instrumentation.py
+"""
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from okxpy.emulator import Emulator  # noqa: E402
+from okxpy.utils.http import HTTPTransport  # noqa: E402
+from okxpy.utils.metrics import Instrumentation  # noqa: E402
+from okxpy.wallet.client import WalletClient  # noqa: E402
+from okxpy.auth import OKXAuth  # noqa: E402
+
+PATH = "/api/v5/wallet/pre-transaction/gas-price"
+RESPONSE = {"code": "0", "msg": "", "data": []}
+
+
+def bookkeeping(number: int = 100000) -> float:
+    instrumentation = Instrumentation()
+
+    def attempt():
+        info = instrumentation.begin("GET", PATH, PATH + "?chainIndex=1", b"")
+        info.lap("sign")
+        info.network(0.0, 0.001)
+        info.lap("decode")
+        instrumentation.end(info, 200, RESPONSE, 512)
+
+    return timeit.timeit(attempt, number=number) / number
+
+
+def requests_per_second(instrumentation, seconds: float = 2.0) -> float:
+    with Emulator() as emulator:
+        credentials = emulator.credentials()
+        auth = OKXAuth(credentials["api_key"], credentials["secret_key"],
+                       credentials["passphrase"], credentials["project_id"])
+        transport = HTTPTransport(emulator.url, instrumentation=instrumentation)
+        wallet = WalletClient(auth, transport)
+        wallet.get_gas_price("1")
+        count, deadline = 0, time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            wallet.get_gas_price("1")
+            count += 1
+        transport.close()
+    return count / seconds
+
+
+def main():
+    print(f"bookkeeping per attempt:   {bookkeeping() * 1e6:.1f} us")
+    print(f"emulator, uninstrumented:  {requests_per_second(None):.0f} req/s")
+    print(f"emulator, instrumented:    {requests_per_second(Instrumentation()):.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
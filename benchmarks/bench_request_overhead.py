@@ -0,0 +1,80 @@
+"""
+Per-request client overhead: encoding and signing, without the network.
+
+Compares the previous path (datetime timestamp, repr-based POST signature,
+fresh HMAC key schedule, and a second serialization by requests) with the
+encode-once path used by the transports.
+
+Usage:
+    python benchmarks/bench_request_overhead.py
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from okxpy.auth import OKXAuth, encode_request  # noqa: E402
+
+SECRET = "0123456789ABCDEF0123456789ABCDEF"
+PATH = "/api/v5/dex/aggregator/quote"
+PARAMS = {
+    "chainId": "1",
+    "amount": "1000000000000000000",
+    "fromTokenAddress": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
+    "toTokenAddress": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+}
+BODY_PATH = "/api/v5/wallet/pre-transaction/sign-info"
+BODY = {
+    "chainIndex": "1",
+    "fromAddr": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+    "toAddr": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
+    "txAmount": "0",
+}
+
+
+def legacy_get():
+    timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+    query_string = "&".join([f"{key}={value}" for key, value in sorted(PARAMS.items())])
+    message = f"{timestamp}GET{PATH}?{query_string}"
+    base64.b64encode(hmac.new(SECRET.encode(), message.encode(), hashlib.sha256).digest()).decode()
+    urlencode(PARAMS)  # requests encodes the query again
+
+
+def legacy_post():
+    timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+    message = f"{timestamp}POST{BODY_PATH}{str(BODY)}"
+    base64.b64encode(hmac.new(SECRET.encode(), message.encode(), hashlib.sha256).digest()).decode()
+    json.dumps(BODY).encode()  # requests serializes the body again
+
+
+auth = OKXAuth("key", SECRET, "passphrase", "project")
+
+
+def encoded_get():
+    request_path, payload = encode_request(PATH, PARAMS)
+    auth.headers_for("GET", request_path, payload)
+
+
+def encoded_post():
+    request_path, payload = encode_request(BODY_PATH, body=BODY)
+    auth.headers_for("POST", request_path, payload)
+
+
+def main():
+    number = 50000
+    for name, fn in [("legacy GET", legacy_get), ("encoded GET", encoded_get),
+                     ("legacy POST", legacy_post), ("encoded POST", encoded_post)]:
+        best = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:<14} {best / number * 1e6:7.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Import and client construction time of short-lived processes.
+
+Each scenario runs in a fresh interpreter (so nothing is cached in
+sys.modules) and reports the median time the snippet took in-process, plus
+the median wall time of the whole process. Sub-clients are built on first
+access, so a process that only needs quotes never imports the wallet, DeFi
+or marketplace modules.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CLIENT = "okxpy.OKXClient(api_key='k', secret_key='s', passphrase='p', project_id='i')"
+
+SCENARIOS = [
+    ("interpreter only", "pass"),
+    ("import okxpy", "import okxpy"),
+    ("OKXClient()", f"import okxpy; {CLIENT}"),
+    ("OKXClient().dex", f"import okxpy; {CLIENT}.dex"),
+    ("all sub-clients", f"import okxpy; c = {CLIENT}; c.wallet; c.dex; c.marketplace; c.defi.explore"),
+    ("AsyncOKXClient().dex", "import okxpy; okxpy.AsyncOKXClient(api_key='k', secret_key='s', "
+                             "passphrase='p', project_id='i').dex"),
+]
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{snippet}
+elapsed = time.perf_counter() - started
+print(elapsed, sum(1 for name in sys.modules if name.startswith("okxpy")))
+"""
+
+
+def run(snippet: str):
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", PROBE.format(snippet=snippet)], cwd=ROOT,
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), time.perf_counter() - started, int(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<22} {'in-process':>10} {'process':>10} {'okxpy modules':>14}")
+    for name, snippet in SCENARIOS:
+        samples = [run(snippet) for _ in range(args.runs)]
+        inner = statistics.median(sample[0] for sample in samples) * 1000
+        wall = statistics.median(sample[1] for sample in samples) * 1000
+        print(f"{name:<22} {inner:8.1f} ms {wall:7.1f} ms {samples[0][2]:14d}")
+
+
+if __name__ == "__main__":
+    main()
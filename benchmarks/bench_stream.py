@@ -0,0 +1,60 @@
+"""
+Peak memory of a buffered token list versus the streaming variant.
+
+Fetches a large all-tokens list from the local emulator (padded with
+synthetic tokens) once with DexClient.get_tokens, which holds the whole
+body and its decoded list, and once with DexClient.stream_tokens, which
+parses gzip-compressed chunks one record at a time. Peak Python heap use is
+measured with tracemalloc; the emulator runs in a child process so its own
+allocations are not counted.
+
+Usage:
+    python benchmarks/bench_stream.py [--tokens 100000] [--chunk-size 65536]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from okxpy.auth import OKXAuth  # noqa: E402
+from okxpy.dex.client import DexClient  # noqa: E402
+from okxpy.emulator import Emulator  # noqa: E402
+from okxpy.emulator.fixtures import Fixtures  # noqa: E402
+from okxpy.utils.http import HTTPTransport  # noqa: E402
+
+from _remote import RemoteEmulator  # noqa: E402
+
+
+def measure(name: str, fetch) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = fetch()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<14} {count:8d} tokens   {elapsed * 1000:7.0f} ms   peak {peak / 2 ** 20:7.2f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    with RemoteEmulator(Emulator, fixtures=Fixtures(extra_tokens=args.tokens)) as emulator:
+        credentials = emulator.credentials()
+        auth = OKXAuth(credentials["api_key"], credentials["secret_key"],
+                       credentials["passphrase"], credentials["project_id"])
+        dex = DexClient(auth, HTTPTransport(emulator.url))
+        dex.get_supported_chains()
+
+        measure("get_tokens", lambda: len(dex.get_tokens("1")["data"]))
+        measure("stream_tokens", lambda: sum(1 for _ in dex.stream_tokens("1", args.chunk_size)))
+
+
+if __name__ == "__main__":
+    main()
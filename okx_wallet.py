@@ -11,22 +11,20 @@ Implements all endpoints from:
 - Transaction List API
 """
 
-import os
-import time
-import hmac
 import json
-import base64
-import hashlib
-import requests
-from datetime import datetime, timezone
 from typing import Dict, Optional, Union, List
 
-class OkxWallet:
+from okxpy.auth import OKXAuth
+from okxpy.base import BaseClient
+from okxpy.utils.http import HTTPTransport
+
+class OkxWallet(BaseClient):
     """OKX Wallet API wrapper class"""
     
-    BASE_URL = "https://www.okx.com"
+    BASE_PATH = "/api/v5/wallet"
     
-    def __init__(self, credentials_path: str = "okx_credentials.json"):
+    def __init__(self, credentials_path: str = "okx_credentials.json",
+                 transport: Optional[HTTPTransport] = None):
         """Initialize with credentials from file or environment variables"""
         with open(credentials_path) as f:
             credentials = json.load(f)
@@ -40,99 +38,8 @@ class OkxWallet:
         if not all([self.api_key, self.passphrase, self.project_id, self.secret]):
             raise ValueError("Missing required credentials")
 
-    def _get_timestamp(self) -> str:
-        """
-        生成符合OKX API要求的ISO格式时间戳
-        格式: YYYY-MM-DDThh:mm:ss.sssZ
-        """
-        return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
-
-    def _sign(self, method: str, endpoint: str, params: dict = None, body: dict = None, ts: str = None) -> tuple:
-        """Generate signature for request
-        根据 OKX API 文档要求生成签名
-        """
-        if ts is None:
-            ts = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
-            
-        # 构建签名字符串
-        request_path = f"/api/v5/wallet/{endpoint}"
-        
-        # 确保方法是大写的
-        method = method.upper()
-        
-        # 根据请求类型构建消息
-        if method == "GET" and params:
-            # 对参数按字母顺序排序
-            sorted_params = sorted(params.items())
-            query_string = "&".join([f"{key}={value}" for key, value in sorted_params])
-            request_path = f"{request_path}?{query_string}"
-            message = ts + method + request_path
-        elif method == "POST" and body:
-            # POST请求需要对body进行JSON序列化，且不能有空格
-            body_str = json.dumps(body)  # 不使用 separators 参数
-            message = ts + method + request_path + body_str
-        else:
-            message = ts + method + request_path
-            
-        print(f"\n=== 生成签名 ===")
-        print(f"Method: {method}")
-        print(f"Endpoint: {endpoint}")
-        print(f"Timestamp: {ts}")
-        print(f"Request path: {request_path}")
-        print(f"Message to sign: {message}")
-        
-        try:
-            # 使用HMAC-SHA256生成签名
-            signature = base64.b64encode(
-                hmac.new(
-                    self.secret.encode('utf-8'),
-                    message.encode('utf-8'),
-                    hashlib.sha256
-                ).digest()
-            ).decode('utf-8')
-            
-            print(f"Generated signature: {signature}")
-            return signature, ts
-            
-        except Exception as e:
-            print(f"签名生成错误: {str(e)}")
-            raise
-
-    def _request(self, method: str, endpoint: str, params: dict = None, body: dict = None) -> dict:
-        """Make authenticated request to API"""
-        ts = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
-        signature, ts = self._sign(method, endpoint, params, body, ts)
-        
-        headers = {
-            "Content-Type": "application/json",
-            "OK-ACCESS-KEY": self.api_key,
-            "OK-ACCESS-SIGN": signature,
-            "OK-ACCESS-TIMESTAMP": ts,
-            "OK-ACCESS-PASSPHRASE": self.passphrase,
-            "OK-ACCESS-PROJECT": self.project_id
-        }
-
-        url = f"{self.BASE_URL}/api/v5/wallet/{endpoint}"
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=body)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {
-                    "code": str(response.status_code),
-                    "msg": response.text
-                }
-                
-        except requests.exceptions.RequestException as e:
-            return {
-                "code": str(getattr(e.response, 'status_code', '500')),
-                "msg": str(e)
-            }
+        super().__init__(OKXAuth(self.api_key, self.secret, self.passphrase, self.project_id),
+                         transport)
 
     def get_sign_info(self, chain_index: str, from_addr: str, to_addr: str, 
                      tx_amount: str = "0", ext_json: dict = None) -> dict:
@@ -9,13 +9,30 @@ Basic usage:
     >>> client = OKXClient(api_key="your-api-key", secret_key="your-secret-key", 
     ...                    passphrase="your-passphrase", project_id="your-project-id")
     >>> chains = client.dex.get_supported_chains()
+
+Asyncio usage:
+    >>> from okxpy import AsyncOKXClient
+    >>> async with AsyncOKXClient(credentials_path="okx_credentials.json") as client:
+    ...     quote = await client.dex.get_quote("1", "1000000", from_addr, to_addr)
 """
 
-from .client import OKXClient
-from .auth import OKXAuth
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import OKXClient, AsyncOKXClient
+    from .auth import OKXAuth
+
+# Resolved on first use, so `import okxpy` does not load requests and every service
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OKXClient": ".client",
+    "AsyncOKXClient": ".client",
+    "OKXAuth": ".auth",
+})
 
 __version__ = "0.1.0"
 __author__ = "SunXin"
 __email__ = "cd_home@163.com"
 
-__all__ = ["OKXClient", "OKXAuth"] 
\ No newline at end of file
+__all__ = ["OKXClient", "AsyncOKXClient", "OKXAuth"] 
\ No newline at end of file
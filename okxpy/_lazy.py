@@ -0,0 +1,83 @@
+"""
+OKX Lazy Loading
+~~~~~~~~~~~~~~~~
+
+Helpers that defer imports until a name is first used, so ``import okxpy``
+and ``OKXClient(...)`` only load the modules (and third-party packages such
+as requests) a process actually needs.
+"""
+
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module ``__getattr__`` and ``__dir__`` of a package exporting names lazily
+
+    Args:
+        package: ``__name__`` of the exporting package
+        exports: Mapping of exported name to the relative module defining it
+
+    Example::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"DexClient": ".client"})
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name without calling __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class SubClient:
+    """
+    Service client attribute built on first access
+
+    The client's module is imported at that point and the instance is cached
+    on the parent, which provides ``auth``, ``transport`` and ``models``::
+
+        class OKXClient:
+            dex = SubClient(".dex.client", "DexClient")
+    """
+
+    def __init__(self, module: str, name: str):
+        """
+        Args:
+            module: Module defining the client, relative to the parent's package
+            name: Class name of the client
+        """
+        self.module = module
+        self.name = name
+        self.attr = name
+        self._package: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+        self._package = owner.__module__.rpartition(".")[0]
+
+    def load(self) -> type:
+        """Import and return the client class"""
+        return getattr(importlib.import_module(self.module, self._package), self.name)
+
+    def __get__(self, parent: Any, owner: Optional[type] = None) -> Any:
+        if parent is None:
+            return self
+        with self._lock:
+            client = parent.__dict__.get(self.attr)
+            if client is None:
+                client = self.load()(parent.auth, parent.transport, models=parent.models)
+                # Stored under the same name, so the descriptor is bypassed from now on
+                parent.__dict__[self.attr] = client
+        return client
@@ -1,8 +1,35 @@
 import base64
 import hmac
 import hashlib
-from datetime import datetime, timezone
+import json
+import time
 from typing import Optional, Dict, Tuple
+from urllib.parse import urlencode
+
+
+def encode_query(params: Optional[Dict]) -> str:
+    """Encode query parameters in sorted key order"""
+    if not params:
+        return ""
+    return urlencode(sorted(params.items()), safe=",")
+
+
+def encode_body(body: Optional[Dict]) -> bytes:
+    """Serialize a JSON body with sorted keys and compact separators"""
+    if body is None:
+        return b""
+    return json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def encode_request(path: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Tuple[str, bytes]:
+    """
+    Encode a request once for both signing and sending
+
+    Returns: (request path including query string, body bytes)
+    """
+    query = encode_query(params)
+    return (f"{path}?{query}" if query else path), encode_body(body)
+
 
 class OKXAuth:
     def __init__(self, api_key: str, secret_key: str, passphrase: str, project_id: str):
@@ -10,44 +37,52 @@ class OKXAuth:
         self.secret_key = secret_key
         self.passphrase = passphrase
         self.project_id = project_id
+        # Keyed HMAC state, copied per signature instead of re-keying every time
+        self._hmac = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
+        self._second: Tuple[int, str] = (-1, "")
 
     def get_timestamp(self) -> str:
         """Generate ISO format timestamp required by OKX API"""
-        return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        now = time.time()
+        seconds = int(now)
+        cached_second, prefix = self._second
+        if cached_second != seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._second = (seconds, prefix)
+        return f"{prefix}.{int((now - seconds) * 1000):03d}Z"
+
+    def sign_payload(self, method: str, request_path: str, body: bytes = b"") -> Tuple[str, str]:
+        """
+        Sign an already encoded request
+        Returns: (signature, timestamp)
+        """
+        timestamp = self.get_timestamp()
+        mac = self._hmac.copy()
+        mac.update(f"{timestamp}{method}{request_path}".encode('utf-8'))
+        if body:
+            mac.update(body)
+        return base64.b64encode(mac.digest()).decode('ascii'), timestamp
 
     def sign(self, method: str, path: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Tuple[str, str]:
         """
         Generate signature for OKX API request
         Returns: (signature, timestamp)
         """
-        timestamp = self.get_timestamp()
-        
-        # Build message to sign
-        if method == "GET" and params:
-            sorted_params = sorted(params.items())
-            query_string = "&".join([f"{key}={value}" for key, value in sorted_params])
-            message = f"{timestamp}{method}{path}?{query_string}"
-        elif method == "POST" and body:
-            body_str = str(body)  # Convert dict to string
-            message = f"{timestamp}{method}{path}{body_str}"
-        else:
-            message = f"{timestamp}{method}{path}"
-
-        # Generate signature
-        signature = base64.b64encode(
-            hmac.new(
-                self.secret_key.encode('utf-8'),
-                message.encode('utf-8'),
-                hashlib.sha256
-            ).digest()
-        ).decode('utf-8')
-
-        return signature, timestamp
+        request_path, payload = encode_request(path, params if method == "GET" else None,
+                                               body if method == "POST" else None)
+        return self.sign_payload(method, request_path, payload)
 
     def get_headers(self, method: str, path: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Dict:
         """Generate headers for OKX API request"""
         signature, timestamp = self.sign(method, path, params, body)
-        
+        return self._headers(signature, timestamp)
+
+    def headers_for(self, method: str, request_path: str, body: bytes = b"") -> Dict:
+        """Generate headers for a request encoded with encode_request"""
+        signature, timestamp = self.sign_payload(method, request_path, body)
+        return self._headers(signature, timestamp)
+
+    def _headers(self, signature: str, timestamp: str) -> Dict:
         return {
             "Content-Type": "application/json",
             "OK-ACCESS-KEY": self.api_key,
@@ -55,4 +90,4 @@ class OKXAuth:
             "OK-ACCESS-TIMESTAMP": timestamp,
             "OK-ACCESS-PASSPHRASE": self.passphrase,
             "OK-ACCESS-PROJECT": self.project_id
-        } 
\ No newline at end of file
+        }
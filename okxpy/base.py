@@ -0,0 +1,96 @@
+"""
+OKX Base Client
+~~~~~~~~~~~~~~~
+
+Shared request path of every service client. Requests go through the
+transport's middleware pipeline (``client.pipeline``), so features such as
+caching, retries and metrics are configured once on the transport.
+"""
+
+from typing import Any, Dict, Iterator, Optional
+from .auth import OKXAuth
+from .utils.codec import ApiResponse
+from .utils.http import AsyncHTTPTransport, HTTPTransport, get_default_transport
+from .utils.pipeline import Pipeline
+
+
+class BaseClient:
+    """Base class of the OKX service clients"""
+
+    BASE_PATH = ""
+
+    def __init__(self, auth: OKXAuth, transport: Optional[HTTPTransport] = None,
+                 models: bool = False):
+        """
+        Args:
+            auth: Request signer
+            transport: Optional shared transport (default: process-wide transport)
+            models: Return typed response models instead of raw dicts (a convenience
+                layer built on top of the decoded dicts)
+        """
+        self.auth = auth
+        self.transport = transport or self._default_transport()
+        self.models = models
+
+    def _default_transport(self):
+        return get_default_transport()
+
+    @property
+    def pipeline(self) -> Pipeline:
+        """Middleware pipeline of the transport, shared with its other clients"""
+        return self.transport.pipeline
+
+    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Optional[Dict] = None,
+                 model: Optional[type] = None) -> Dict:
+        """Make authenticated request to API"""
+        response = self.transport.request(method, f"{self.BASE_PATH}/{endpoint}",
+                                          params=params, body=body, auth=self.auth)
+        return self._parse(response, model)
+
+    def _stream(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                body: Optional[Dict] = None, chunk_size: int = 65536) -> Iterator[Any]:
+        """Make authenticated request to API and yield the records of its data array"""
+        return self.transport.stream(method, f"{self.BASE_PATH}/{endpoint}", params=params,
+                                     body=body, auth=self.auth, chunk_size=chunk_size)
+
+    def _parse(self, response: Dict, model: Optional[type]) -> Dict:
+        if model is not None and self.models:
+            return ApiResponse.parse(response, model)
+        return response
+
+
+class AsyncBaseClient(BaseClient):
+    """
+    Base class of the asyncio service clients
+
+    Listed first in the bases of an async client, e.g.
+    ``class AsyncWalletClient(AsyncBaseClient, WalletClient)``, so its
+    awaitable ``_request`` backs every endpoint method. A client built
+    without a transport creates its own and closes it in :meth:`aclose`.
+    """
+
+    def __init__(self, auth: OKXAuth, transport: Optional[AsyncHTTPTransport] = None,
+                 models: bool = False):
+        super().__init__(auth, transport, models)
+        self._owns_transport = transport is None
+
+    def _default_transport(self):
+        return AsyncHTTPTransport()
+
+    async def aclose(self) -> None:
+        """Release pooled connections of a transport this client created"""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Optional[Dict] = None,
+                       model: Optional[type] = None) -> Dict:
+        """Make authenticated request to API"""
+        response = await self.transport.request(method, f"{self.BASE_PATH}/{endpoint}",
+                                                params=params, body=body, auth=self.auth)
+        return self._parse(response, model)
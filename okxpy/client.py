@@ -1,22 +1,122 @@
+import importlib
 import json
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
+from ._lazy import SubClient
 from .auth import OKXAuth
-from .wallet.client import WalletClient
-from .dex.client import DexClient
-from .marketplace.client import MarketplaceClient
-from .defi.client import DefiClient
+from .utils.codec import JSONCodec
+from .utils.http import DEFAULT_BASE_URL
+
+# Transports and feature modules are imported when a client is built with them
+if TYPE_CHECKING:
+    from .utils.http import AsyncHTTPTransport, HTTP2Transport, HTTPTransport
+    from .utils.cache import QuoteCache, ResponseCache
+    from .utils.metrics import Instrumentation
+    from .utils.pipeline import Pipeline
+    from .utils.ratelimit import RateLimiter
+    from .utils.retry import RetryPolicy
+    from .utils.singleflight import SingleFlight
+    from .utils.snapshot import SnapshotStore
+
+def _make_option(option: Any, module: str, name: str) -> Any:
+    """Resolve a True/instance/None option of the client constructors"""
+    if option is True:
+        return getattr(importlib.import_module(module, __package__), name)()
+    return option or None
+
+
+def _make_snapshot(option: Union[str, "SnapshotStore", None]) -> Optional["SnapshotStore"]:
+    """Resolve the path/instance/None snapshot option of the client constructors"""
+    if isinstance(option, str):
+        from .utils.snapshot import SnapshotStore
+        return SnapshotStore(option)
+    return option
+
 
 class OKXClient:
-    """Main client class for OKX API"""
-    
+    """
+    Main client class for OKX API
+
+    The service clients (wallet, dex, marketplace, defi) are created, and
+    their modules imported, on first access.
+    """
+
+    wallet = SubClient(".wallet.client", "WalletClient")
+    dex = SubClient(".dex.client", "DexClient")
+    marketplace = SubClient(".marketplace.client", "MarketplaceClient")
+    defi = SubClient(".defi.client", "DefiClient")
+
     def __init__(self, credentials_path: Optional[str] = None, 
                  api_key: Optional[str] = None,
                  secret_key: Optional[str] = None,
                  passphrase: Optional[str] = None,
-                 project_id: Optional[str] = None):
+                 project_id: Optional[str] = None,
+                 base_url: str = DEFAULT_BASE_URL,
+                 transport: Union[str, "HTTPTransport", "HTTP2Transport", None] = None,
+                 pool_maxsize: int = 10,
+                 dns_cache_ttl: Optional[float] = 300.0,
+                 prewarm: int = 0,
+                 cache: Union[bool, "ResponseCache", None] = None,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 retry: Optional["RetryPolicy"] = None,
+                 codec: Union[str, JSONCodec] = "auto",
+                 models: bool = False,
+                 single_flight: Union[bool, "SingleFlight", None] = None,
+                 quote_cache: Union[bool, "QuoteCache", None] = None,
+                 instrumentation: Optional["Instrumentation"] = None,
+                 max_streams: int = 100,
+                 snapshot: Union[str, "SnapshotStore", None] = None):
         """
         Initialize with either credentials file or direct parameters
+
+        Args:
+            base_url: API host of the default transport (e.g. a local emulator)
+            transport: Transport shared by all service clients, or "http1" (default,
+                pooled keep-alive connections) / "http2" (multiplexed streams, requires h2)
+            pool_maxsize: Kept-alive connections per host for the default transport
+            dns_cache_ttl: Seconds to cache DNS lookups (None disables caching)
+            prewarm: Number of connections to open before the first request
+            cache: True or a ResponseCache to cache reference-data endpoints
+            rate_limiter: Optional client-side rate limiter for the default transport
+            retry: Optional retry policy for the default transport
+            codec: JSON decoder of the default transport ("auto" picks the fastest installed)
+            models: Return typed response models instead of raw dicts (a convenience
+                layer built on top of the decoded dicts)
+            single_flight: True or a SingleFlight to share identical in-flight requests
+            quote_cache: True or a QuoteCache to serve repeated quotes from memory
+            instrumentation: Optional hooks and metrics for the default transport
+            max_streams: Maximum concurrent requests (streams) with transport="http2"
+            snapshot: SnapshotStore, or the path of its SQLite file, persisting
+                reference data so restarts serve it without refetching
         """
+        self._init_auth(credentials_path, api_key, secret_key, passphrase, project_id)
+
+        # One transport shared by every service client
+        if transport is None or isinstance(transport, str):
+            options = dict(cache=_make_option(cache, ".utils.cache", "ResponseCache"),
+                           rate_limiter=rate_limiter,
+                           retry=retry,
+                           codec=codec,
+                           single_flight=_make_option(single_flight, ".utils.singleflight", "SingleFlight"),
+                           quote_cache=_make_option(quote_cache, ".utils.cache", "QuoteCache"),
+                           instrumentation=instrumentation,
+                           snapshot=_make_snapshot(snapshot))
+            if transport == "http2":
+                from .utils.http import HTTP2Transport
+                transport = HTTP2Transport(base_url, max_streams=max_streams,
+                                           prewarm=bool(prewarm), **options)
+            elif transport in (None, "http1"):
+                from .utils.http import HTTPTransport
+                transport = HTTPTransport(base_url, pool_maxsize=pool_maxsize,
+                                          dns_cache_ttl=dns_cache_ttl, prewarm=prewarm, **options)
+            else:
+                raise ValueError(f"Unknown transport: {transport!r} (expected 'http1' or 'http2')")
+        self.transport = transport
+        self.models = models
+
+    def _init_auth(self, credentials_path: Optional[str], api_key: Optional[str],
+                   secret_key: Optional[str], passphrase: Optional[str],
+                   project_id: Optional[str]) -> None:
+        """Load credentials from file or parameters and build the signer"""
         if credentials_path:
             with open(credentials_path) as f:
                 credentials = json.load(f)
@@ -41,8 +141,107 @@ class OKXClient:
             project_id=self.project_id
         )
 
-        # Initialize service clients
-        self.wallet = WalletClient(self.auth)
-        self.dex = DexClient(self.auth)
-        self.marketplace = MarketplaceClient(self.auth)
-        self.defi = DefiClient(self.auth) 
\ No newline at end of file
+    @property
+    def pipeline(self) -> "Pipeline":
+        """Middleware pipeline every request of this client passes through"""
+        return self.transport.pipeline
+
+    def close(self) -> None:
+        """Release pooled connections"""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncOKXClient:
+    """Asyncio client for OKX API with the same surface as :class:`OKXClient`"""
+
+    wallet = SubClient(".wallet.client", "AsyncWalletClient")
+    dex = SubClient(".dex.client", "AsyncDexClient")
+    marketplace = SubClient(".marketplace.client", "AsyncMarketplaceClient")
+    defi = SubClient(".defi.client", "AsyncDefiClient")
+
+    def __init__(self, credentials_path: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 secret_key: Optional[str] = None,
+                 passphrase: Optional[str] = None,
+                 project_id: Optional[str] = None,
+                 base_url: str = DEFAULT_BASE_URL,
+                 transport: Union[str, "AsyncHTTPTransport", None] = None,
+                 max_connections: int = 100,
+                 pool_maxsize: int = 20,
+                 cache: Union[bool, "ResponseCache", None] = None,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 retry: Optional["RetryPolicy"] = None,
+                 codec: Union[str, JSONCodec] = "auto",
+                 models: bool = False,
+                 single_flight: Union[bool, "SingleFlight", None] = None,
+                 quote_cache: Union[bool, "QuoteCache", None] = None,
+                 instrumentation: Optional["Instrumentation"] = None,
+                 max_streams: int = 100,
+                 snapshot: Union[str, "SnapshotStore", None] = None):
+        """
+        Initialize with either credentials file or direct parameters
+
+        Args:
+            base_url: API host of the default transport (e.g. a local emulator)
+            transport: Async transport shared by all service clients, or "http1"
+                (default) / "http2" (multiplexed streams, requires h2)
+            max_connections: Maximum concurrent connections for the default transport
+            pool_maxsize: Idle kept-alive connections for the default transport
+            cache: True or a ResponseCache to cache reference-data endpoints
+            rate_limiter: Optional client-side rate limiter for the default transport
+            retry: Optional retry policy for the default transport
+            codec: JSON decoder of the default transport ("auto" picks the fastest installed)
+            models: Return typed response models instead of raw dicts (a convenience
+                layer built on top of the decoded dicts)
+            single_flight: True or a SingleFlight to share identical in-flight requests
+            quote_cache: True or a QuoteCache to serve repeated quotes from memory
+            instrumentation: Optional hooks and metrics for the default transport
+            max_streams: Maximum concurrent requests (streams) with transport="http2"
+            snapshot: SnapshotStore, or the path of its SQLite file, persisting
+                reference data so restarts serve it without refetching
+        """
+        self._init_auth(credentials_path, api_key, secret_key, passphrase, project_id)
+
+        if transport is None or isinstance(transport, str):
+            if transport not in (None, "http1", "http2"):
+                raise ValueError(f"Unknown transport: {transport!r} (expected 'http1' or 'http2')")
+            from .utils.http import AsyncHTTPTransport
+            http2 = transport == "http2"
+            transport = AsyncHTTPTransport(base_url,
+                                           max_connections=max_connections,
+                                           pool_maxsize=pool_maxsize,
+                                           cache=_make_option(cache, ".utils.cache", "ResponseCache"),
+                                           rate_limiter=rate_limiter,
+                                           retry=retry,
+                                           codec=codec,
+                                           single_flight=_make_option(single_flight, ".utils.singleflight", "SingleFlight"),
+                                           quote_cache=_make_option(quote_cache, ".utils.cache", "QuoteCache"),
+                                           instrumentation=instrumentation,
+                                           snapshot=_make_snapshot(snapshot),
+                                           http2=http2,
+                                           max_streams=max_streams if http2 else None)
+        self.transport = transport
+        self.models = models
+
+    _init_auth = OKXClient._init_auth
+
+    @property
+    def pipeline(self) -> "Pipeline":
+        """Middleware pipeline every request of this client passes through"""
+        return self.transport.pipeline
+
+    async def aclose(self) -> None:
+        """Release pooled connections"""
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
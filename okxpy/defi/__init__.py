@@ -5,16 +5,36 @@ OKX DeFi API Module
 This module provides access to OKX DeFi API endpoints.
 """
 
-from .client import DefiClient
-from .explore import DefiExploreClient
-from .calculator import DefiCalculatorClient
-from .transaction import DefiTransactionClient
-from .user import DefiUserClient
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import DefiClient, AsyncDefiClient
+    from .explore import DefiExploreClient, AsyncDefiExploreClient
+    from .calculator import DefiCalculatorClient
+    from .transaction import DefiTransactionClient
+    from .user import DefiUserClient
+    from .models import Product, ProductToken, ProductPage
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DefiClient": ".client", "AsyncDefiClient": ".client",
+    "DefiExploreClient": ".explore", "AsyncDefiExploreClient": ".explore",
+    "DefiCalculatorClient": ".calculator",
+    "DefiTransactionClient": ".transaction",
+    "DefiUserClient": ".user",
+    "Product": ".models", "ProductToken": ".models", "ProductPage": ".models",
+})
 
 __all__ = [
     "DefiClient",
+    "AsyncDefiClient",
     "DefiExploreClient",
+    "AsyncDefiExploreClient",
     "DefiCalculatorClient", 
     "DefiTransactionClient",
-    "DefiUserClient"
+    "DefiUserClient",
+    "Product",
+    "ProductToken",
+    "ProductPage"
 ] 
\ No newline at end of file
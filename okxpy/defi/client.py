@@ -1,16 +1,40 @@
 from typing import Optional, Dict
-from .explore import ExploreClient
-from .calculator import CalculatorClient
-from .transaction import TransactionClient
-from .user import UserClient
+from .._lazy import SubClient
 from ..auth import OKXAuth
+from ..utils.http import AsyncHTTPTransport, HTTPTransport, get_default_transport
 
 class DefiClient:
-    """OKX DeFi API client"""
-    
-    def __init__(self, auth: OKXAuth):
+    """OKX DeFi API client (sub-clients are created on first access)"""
+
+    explore = SubClient(".explore", "DefiExploreClient")
+    calculator = SubClient(".calculator", "DefiCalculatorClient")
+    transaction = SubClient(".transaction", "DefiTransactionClient")
+    user = SubClient(".user", "DefiUserClient")
+
+    def __init__(self, auth: OKXAuth, transport: Optional[HTTPTransport] = None,
+                 models: bool = False):
         self.auth = auth
-        self.explore = ExploreClient(auth)
-        self.calculator = CalculatorClient(auth)
-        self.transaction = TransactionClient(auth)
-        self.user = UserClient(auth) 
\ No newline at end of file
+        self.transport = transport or get_default_transport()
+        self.models = models
+
+
+class AsyncDefiClient(DefiClient):
+    """Asyncio flavour of :class:`DefiClient` (explore is the only API with endpoints)"""
+
+    explore = SubClient(".explore", "AsyncDefiExploreClient")
+
+    def __init__(self, auth: OKXAuth, transport: Optional[AsyncHTTPTransport] = None,
+                 models: bool = False):
+        super().__init__(auth, transport or AsyncHTTPTransport(), models)
+        self._owns_transport = transport is None
+
+    async def aclose(self) -> None:
+        """Release pooled connections of a transport this client created"""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
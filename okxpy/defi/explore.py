@@ -1,38 +1,14 @@
-from typing import Optional, Dict, List
-import requests
-from ..auth import OKXAuth
+from typing import Optional, Dict, List, Iterator, AsyncIterator
+from ..exceptions import check_response
+from ..utils.paginate import offset_page, iter_prefetched, aiter_prefetched
+from ..base import AsyncBaseClient, BaseClient
+from .models import Product, ProductPage
 
-class DefiExploreClient:
+class DefiExploreClient(BaseClient):
     """OKX DeFi Explore API client"""
     
-    BASE_URL = "https://www.okx.com/api/v5/defi/explore"
+    BASE_PATH = "/api/v5/defi/explore"
     
-    def __init__(self, auth: OKXAuth):
-        self.auth = auth
-
-    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to API"""
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = self.auth.get_headers(method, f"/api/v5/defi/explore/{endpoint}", params, body)
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=body)
-            
-            if response.status_code == 200:
-                return response.json()
-            return {
-                "code": str(response.status_code),
-                "msg": response.text
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                "code": "500",
-                "msg": str(e)
-            }
-
     def get_protocol_list(self, platform_id: Optional[str] = None, 
                          platform_name: Optional[str] = None) -> Dict:
         """
@@ -104,7 +80,33 @@ class DefiExploreClient:
         if offset:
             body["offset"] = offset
             
-        return self._request("POST", "product/list", body=body)
+        return self._request("POST", "product/list", body=body, model=ProductPage)
+
+    def iter_products(self, network: str, simplify_invest_type: str,
+                      pool_version: Optional[str] = None,
+                      platform_ids: Optional[List[str]] = None,
+                      token_ids: Optional[List[str]] = None,
+                      sort: Optional[Dict] = None,
+                      limit: str = "20",
+                      max_buffered_pages: int = 2) -> Iterator[Dict]:
+        """
+        Iterate over all products, fetching the next page ahead
+
+        Args:
+            network, simplify_invest_type, pool_version, platform_ids,
+                token_ids, sort: Filters as in get_product_list
+            limit: Number of results per page (default: "20")
+            max_buffered_pages: Pages allowed to wait for the consumer
+
+        Raises:
+            OKXAPIError: A page request failed
+        """
+        def fetch(offset):
+            response = self.get_product_list(network, simplify_invest_type, pool_version,
+                                             platform_ids, token_ids, sort, offset, limit)
+            return offset_page(check_response(response), "investments", offset)
+
+        return iter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
 
     def get_product_detail(self, investment_id: str, 
                           investment_category: Optional[str] = None) -> Dict:
@@ -119,7 +121,7 @@ class DefiExploreClient:
         if investment_category:
             params["investmentCategory"] = investment_category
             
-        return self._request("GET", "product/detail", params)
+        return self._request("GET", "product/detail", params, model=Product)
 
     def get_network_list(self, network: Optional[str] = None,
                         chain_id: Optional[str] = None) -> Dict:
@@ -136,4 +138,28 @@ class DefiExploreClient:
         if chain_id:
             params["chainId"] = chain_id
             
-        return self._request("GET", "network-list", params) 
\ No newline at end of file
+        return self._request("GET", "network-list", params)
+
+
+class AsyncDefiExploreClient(AsyncBaseClient, DefiExploreClient):
+    """
+    Asyncio flavour of :class:`DefiExploreClient`
+
+    Every endpoint method returns an awaitable resolved through a
+    non-blocking :class:`~okxpy.utils.http.AsyncHTTPTransport`.
+    """
+
+    def iter_products(self, network: str, simplify_invest_type: str,
+                      pool_version: Optional[str] = None,
+                      platform_ids: Optional[List[str]] = None,
+                      token_ids: Optional[List[str]] = None,
+                      sort: Optional[Dict] = None,
+                      limit: str = "20",
+                      max_buffered_pages: int = 2) -> AsyncIterator[Dict]:
+        """Async iterator over all products, see DefiExploreClient.iter_products"""
+        async def fetch(offset):
+            response = await self.get_product_list(network, simplify_invest_type, pool_version,
+                                                   platform_ids, token_ids, sort, offset, limit)
+            return offset_page(check_response(response), "investments", offset)
+
+        return aiter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
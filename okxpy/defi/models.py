@@ -0,0 +1,49 @@
+"""
+OKX DeFi Response Models
+~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+from ..utils.codec import Model
+
+
+class ProductToken(Model):
+    """Token of a DeFi product"""
+
+    __slots__ = ("token_id", "token_symbol", "token_address", "network")
+    FIELDS = {
+        "token_id": "tokenId",
+        "token_symbol": "tokenSymbol",
+        "token_address": "tokenAddress",
+        "network": "network",
+    }
+
+
+class Product(Model):
+    """DeFi investment product"""
+
+    __slots__ = ("investment_id", "investment_name", "chain_id", "rate", "invest_type",
+                 "platform_name", "platform_id", "analysis_platform_id", "tvl",
+                 "pool_version", "underlying_token")
+    FIELDS = {
+        "investment_id": "investmentId",
+        "investment_name": "investmentName",
+        "chain_id": "chainId",
+        "rate": "rate",
+        "invest_type": "investType",
+        "platform_name": "platformName",
+        "platform_id": "platformId",
+        "analysis_platform_id": "analysisPlatformId",
+        "tvl": "tvl",
+        "pool_version": "poolVersion",
+        "underlying_token": ("underlyingToken", [ProductToken]),
+    }
+
+
+class ProductPage(Model):
+    """One page of DeFi products"""
+
+    __slots__ = ("investments", "total")
+    FIELDS = {
+        "investments": ("investments", [Product]),
+        "total": "total",
+    }
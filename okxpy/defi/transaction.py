@@ -1,10 +1,6 @@
-from typing import Optional, Dict
-from ..auth import OKXAuth
+from ..base import BaseClient
 
-class DefiTransactionClient:
+class DefiTransactionClient(BaseClient):
     """OKX DeFi Transaction API client"""
     
-    BASE_URL = "https://www.okx.com/api/v5/defi/transaction"
-    
-    def __init__(self, auth: OKXAuth):
-        self.auth = auth 
\ No newline at end of file
+    BASE_PATH = "/api/v5/defi/transaction"
@@ -5,6 +5,20 @@ OKX DEX API Module
 This module provides access to OKX DEX API endpoints.
 """
 
-from .client import DexClient
+from typing import TYPE_CHECKING
 
-__all__ = ["DexClient"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import DexClient, AsyncDexClient, QuoteResult
+    from .registry import TokenRegistry, TokenInfo
+    from .models import Quote, QuoteToken, Swap, SwapTx
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DexClient": ".client", "AsyncDexClient": ".client", "QuoteResult": ".client",
+    "TokenRegistry": ".registry", "TokenInfo": ".registry",
+    "Quote": ".models", "QuoteToken": ".models", "Swap": ".models", "SwapTx": ".models",
+})
+
+__all__ = ["DexClient", "AsyncDexClient", "QuoteResult", "TokenRegistry", "TokenInfo",
+           "Quote", "QuoteToken", "Swap", "SwapTx"] 
\ No newline at end of file
@@ -1,38 +1,34 @@
-from typing import Optional, Dict
-import requests
-from ..auth import OKXAuth
+from typing import Optional, Dict, Any, Iterable, Iterator, AsyncIterator, List, NamedTuple
+from ..utils.concurrency import iter_concurrent, aiter_concurrent
+from ..base import AsyncBaseClient, BaseClient
+from .models import Quote, Swap
 
-class DexClient:
+class QuoteResult(NamedTuple):
+    """Outcome of one quote request in a batch"""
+
+    index: int
+    request: Any
+    response: Optional[Dict]
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        """True when the API returned a quote"""
+        return self.error is None and self.response is not None and self.response.get("code") == "0"
+
+
+def _quote_args(request: Any):
+    """Split a batch entry into get_quote args and kwargs"""
+    if isinstance(request, dict):
+        return (), request
+    return tuple(request), {}
+
+
+class DexClient(BaseClient):
     """OKX DEX API client"""
     
-    BASE_URL = "https://www.okx.com/api/v5/dex/aggregator"
+    BASE_PATH = "/api/v5/dex/aggregator"
     
-    def __init__(self, auth: OKXAuth):
-        self.auth = auth
-
-    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to API"""
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = self.auth.get_headers(method, f"/api/v5/dex/aggregator/{endpoint}", params, body)
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=body)
-            
-            if response.status_code == 200:
-                return response.json()
-            return {
-                "code": str(response.status_code),
-                "msg": response.text
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                "code": "500",
-                "msg": str(e)
-            }
-
     def get_supported_chains(self, chain_id: Optional[str] = None) -> Dict:
         """
         Get supported chains for single-chain swaps
@@ -65,6 +61,37 @@ class DexClient:
         params = {"chainId": chain_id}
         return self._request("GET", "get-liquidity", params)
 
+    def stream_tokens(self, chain_id: str, chunk_size: int = 65536) -> Iterator[Dict]:
+        """
+        Yield the supported tokens of a chain one at a time
+
+        Unlike get_tokens, the list is transferred gzip-compressed and parsed
+        as it arrives, so memory use stays bounded by a single token record.
+
+        Args:
+            chain_id: Chain ID to get tokens for
+            chunk_size: Bytes read from the connection at a time
+
+        Raises:
+            OKXAPIError: The request failed or the API returned an error code
+        """
+        params = {"chainId": chain_id}
+        return self._stream("GET", "all-tokens", params, chunk_size=chunk_size)
+
+    def stream_liquidity(self, chain_id: str, chunk_size: int = 65536) -> Iterator[Dict]:
+        """
+        Yield the supported liquidity pools of a chain one at a time
+
+        Args:
+            chain_id: Chain ID to get liquidity pools for
+            chunk_size: Bytes read from the connection at a time
+
+        Raises:
+            OKXAPIError: The request failed or the API returned an error code
+        """
+        params = {"chainId": chain_id}
+        return self._stream("GET", "get-liquidity", params, chunk_size=chunk_size)
+
     def get_quote(self, 
                  chain_id: str,
                  amount: str,
@@ -99,7 +126,35 @@ class DexClient:
         if price_impact_protection:
             params["priceImpactProtectionPercentage"] = price_impact_protection
             
-        return self._request("GET", "quote", params)
+        return self._request("GET", "quote", params, model=Quote)
+
+    def iter_quotes(self, quote_requests: Iterable, max_concurrency: int = 8) -> Iterator[QuoteResult]:
+        """
+        Fetch many quotes concurrently and yield them as they arrive
+
+        Args:
+            quote_requests: Iterable of get_quote keyword dicts, or tuples of
+                its positional arguments (chain_id, amount, from, to)
+            max_concurrency: Maximum number of quotes in flight
+        """
+        def quote(request):
+            args, kwargs = _quote_args(request)
+            return self.get_quote(*args, **kwargs)
+
+        for index, request, response, error in iter_concurrent(quote, quote_requests, max_concurrency):
+            yield QuoteResult(index, request, response, error)
+
+    def get_quotes(self, quote_requests: Iterable, max_concurrency: int = 8) -> List[QuoteResult]:
+        """
+        Fetch many quotes concurrently and return them in input order
+
+        Failed items carry their error instead of failing the whole batch.
+
+        Args:
+            quote_requests: Iterable of get_quote keyword dicts or argument tuples
+            max_concurrency: Maximum number of quotes in flight
+        """
+        return sorted(self.iter_quotes(quote_requests, max_concurrency), key=lambda result: result.index)
 
     def get_approve_transaction(self,
                               chain_id: str,
@@ -185,4 +240,40 @@ class DexClient:
         if max_auto_slippage:
             params["maxAutoSlippage"] = max_auto_slippage
 
-        return self._request("GET", "swap", params) 
\ No newline at end of file
+        return self._request("GET", "swap", params, model=Swap)
+
+
+class AsyncDexClient(AsyncBaseClient, DexClient):
+    """
+    Asyncio flavour of :class:`DexClient`
+
+    Every endpoint method returns an awaitable resolved through a
+    non-blocking :class:`~okxpy.utils.http.AsyncHTTPTransport`; the
+    ``stream_*`` methods return async iterators.
+    """
+
+    async def iter_quotes(self, quote_requests: Iterable, max_concurrency: int = 32) -> AsyncIterator[QuoteResult]:
+        """
+        Fetch many quotes concurrently and yield them as they arrive
+
+        Args:
+            quote_requests: Iterable of get_quote keyword dicts or argument tuples
+            max_concurrency: Maximum number of quotes in flight
+        """
+        def quote(request):
+            args, kwargs = _quote_args(request)
+            return self.get_quote(*args, **kwargs)
+
+        async for index, request, response, error in aiter_concurrent(quote, quote_requests, max_concurrency):
+            yield QuoteResult(index, request, response, error)
+
+    async def get_quotes(self, quote_requests: Iterable, max_concurrency: int = 32) -> List[QuoteResult]:
+        """
+        Fetch many quotes concurrently and return them in input order
+
+        Args:
+            quote_requests: Iterable of get_quote keyword dicts or argument tuples
+            max_concurrency: Maximum number of quotes in flight
+        """
+        results = [result async for result in self.iter_quotes(quote_requests, max_concurrency)]
+        return sorted(results, key=lambda result: result.index)
@@ -1,17 +1,73 @@
+import copy
+from typing import Dict
+
 # 从okx_dex.py移植的CHAINS常量
 CHAINS = {
+    #https://solscan.io/leaderboard/token
     'Solana': {
         'chain_id': '501',
         'Addr': {
             'USDT_MINT_ADDR': 'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',
-            # ... 其他地址 ...
+            'USDC_MINT_ADDR': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+            'BTC_MINT_ADDR': '9n4nbM75f5Ui33ZbPYXn59EwSgE8CGsHtAeTH5YFeJ9E',
+            'ETH_MINT_ADDR': '7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs',
+            'SOL_MINT_ADDR': 'So11111111111111111111111111111111111111112',  # 原生SOL
+            'BONK_MINT_ADDR': 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263',
+            'RAY_MINT_ADDR': '4k3Dyjzvzp8eMZWUXbBCjEvwSkkk59S5iCNLY3QrkX6R',
+            'MATIC_MINT_ADDR': 'Gz7VkD4MacbEB6yC5XD3HcumEiYx2EtDYYrfikGsvopG',
+            'AVAX_MINT_ADDR': 'KgV1GvrHQmRBY8sHQQeUKwTm2r2h8t4C8qt12CHGwXB',
         }
     },
+    # Ethereum Mainnet
     'Ethereum': {
         'chain_id': '1',
         'Addr': {
-            'ETH_ADDR': '0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE',
-            # ... 其他地址 ...
+            'ETH_ADDR': '0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE',  # Native ETH
+            'WETH_ADDR': '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2',  # Wrapped ETH
+            'USDT_ADDR': '0xdAC17F958D2ee523a2206206994597C13D831ec7',  # Tether USD
+            'USDC_ADDR': '0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48',  # USD Coin
+            'WBTC_ADDR': '0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599',  # Wrapped BTC
+            'DAI_ADDR': '0x6B175474E89094C44Da98b954EedeAC495271d0F',   # Dai Stablecoin
+            'UNI_ADDR': '0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984',   # Uniswap
+            'LINK_ADDR': '0x514910771AF9Ca656af840dff83E8264EcF986CA',  # Chainlink
+            'AAVE_ADDR': '0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9',  # Aave
+            'MATIC_ADDR': '0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeBB0'  # Polygon
         }
     }
-} 
\ No newline at end of file
+}
+
+
+def load_chains(store, chains: Dict = CHAINS) -> Dict:
+    """
+    CHAINS extended with the chains and token lists of a SnapshotStore
+
+    Entries already in chains are kept; snapshot tokens are added under
+    "<SYMBOL>_ADDR" ("<SYMBOL>_MINT_ADDR" on Solana) when that name is free,
+    and supported chains without an entry get one named after chainName.
+
+    Args:
+        store: okxpy.utils.snapshot.SnapshotStore with dex reference data
+        chains: Chains to extend (not modified)
+    """
+    chains = copy.deepcopy(chains)
+    by_id = {chain["chain_id"]: chain for chain in chains.values()}
+
+    supported = store.get("/api/v5/dex/aggregator/supported/chain")
+    for item in (supported.response.get("data") or []) if supported else []:
+        chain_id = item.get("chainId")
+        if chain_id and chain_id not in by_id:
+            name = item.get("chainName") or chain_id
+            if name in chains:
+                name = f"{name}-{chain_id}"
+            chains[name] = by_id[chain_id] = {"chain_id": chain_id, "Addr": {}}
+
+    for snapshot in store.snapshots("/api/v5/dex/aggregator/all-tokens"):
+        chain = by_id.get(snapshot.params.get("chainId"))
+        if chain is None:
+            continue
+        suffix = "_MINT_ADDR" if chain["chain_id"] == "501" else "_ADDR"
+        for token in snapshot.response.get("data") or []:
+            symbol = (token.get("tokenSymbol") or "").upper()
+            if symbol and token.get("tokenContractAddress"):
+                chain["Addr"].setdefault(symbol + suffix, token["tokenContractAddress"])
+    return chains
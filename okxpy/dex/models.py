@@ -0,0 +1,67 @@
+"""
+OKX DEX Response Models
+~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+from ..utils.codec import Model
+
+
+class QuoteToken(Model):
+    """Token leg of a quote"""
+
+    __slots__ = ("decimal", "token_contract_address", "token_symbol", "token_unit_price")
+    FIELDS = {
+        "decimal": "decimal",
+        "token_contract_address": "tokenContractAddress",
+        "token_symbol": "tokenSymbol",
+        "token_unit_price": "tokenUnitPrice",
+    }
+
+
+class Quote(Model):
+    """Aggregator quote (also the routerResult of a swap)"""
+
+    __slots__ = ("chain_id", "from_token", "to_token", "from_token_amount", "to_token_amount",
+                 "estimate_gas_fee", "trade_fee", "price_impact_percentage",
+                 "dex_router_list", "quote_compare_list")
+    FIELDS = {
+        "chain_id": "chainId",
+        "from_token": ("fromToken", QuoteToken),
+        "to_token": ("toToken", QuoteToken),
+        "from_token_amount": "fromTokenAmount",
+        "to_token_amount": "toTokenAmount",
+        "estimate_gas_fee": "estimateGasFee",
+        "trade_fee": "tradeFee",
+        "price_impact_percentage": "priceImpactPercentage",
+        "dex_router_list": "dexRouterList",
+        "quote_compare_list": "quoteCompareList",
+    }
+
+
+class SwapTx(Model):
+    """Transaction to sign for a swap"""
+
+    __slots__ = ("from_address", "to_address", "data", "value", "gas", "gas_price",
+                 "max_priority_fee_per_gas", "min_receive_amount", "signature_data", "slippage")
+    FIELDS = {
+        "from_address": "from",
+        "to_address": "to",
+        "data": "data",
+        "value": "value",
+        "gas": "gas",
+        "gas_price": "gasPrice",
+        "max_priority_fee_per_gas": "maxPriorityFeePerGas",
+        "min_receive_amount": "minReceiveAmount",
+        "signature_data": "signatureData",
+        "slippage": "slippage",
+    }
+
+
+class Swap(Model):
+    """Swap route and its transaction"""
+
+    __slots__ = ("router_result", "tx")
+    FIELDS = {
+        "router_result": ("routerResult", Quote),
+        "tx": ("tx", SwapTx),
+    }
@@ -0,0 +1,220 @@
+"""
+OKX DEX Token Registry
+~~~~~~~~~~~~~~~~~~~~~~
+
+In-memory index of DEX tokens for O(1) address and symbol lookups.
+"""
+
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..exceptions import check_response
+from ..utils.snapshot import Snapshot, SnapshotStore
+from .client import DexClient
+from .constants import CHAINS
+
+TOKENS_PATH = f"{DexClient.BASE_PATH}/all-tokens"
+
+
+class TokenInfo(NamedTuple):
+    """Token metadata as returned by the all-tokens endpoint"""
+
+    chain_id: str
+    address: str
+    symbol: str
+    name: str = ""
+    decimals: Optional[int] = None
+    logo_url: str = ""
+
+    @classmethod
+    def from_api(cls, chain_id: str, item: Dict) -> "TokenInfo":
+        decimals = item.get("decimals")
+        return cls(
+            chain_id=chain_id,
+            address=item["tokenContractAddress"],
+            symbol=item.get("tokenSymbol", ""),
+            name=item.get("tokenName", ""),
+            decimals=int(decimals) if decimals not in (None, "") else None,
+            logo_url=item.get("tokenLogoUrl", ""),
+        )
+
+
+class TokenRegistry:
+    """
+    Token index filled per chain from :meth:`DexClient.get_tokens`
+
+    Tokens are indexed by (chain_id, address), by (chain_id, lower-cased
+    address) and by (chain_id, upper-cased symbol), so every lookup is a
+    dict access. Reads take no lock; refreshes apply only the difference
+    against the tokens already loaded.
+    """
+
+    def __init__(self, dex: Optional[DexClient] = None):
+        """
+        Args:
+            dex: Client used by refresh()/arefresh() to fetch token lists
+        """
+        self.dex = dex
+        self._by_address: Dict[Tuple[str, str], TokenInfo] = {}
+        self._by_lower: Dict[Tuple[str, str], TokenInfo] = {}
+        self._by_symbol: Dict[Tuple[str, str], Tuple[TokenInfo, ...]] = {}
+        self._chains: Dict[str, Dict[str, TokenInfo]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_constants(cls, dex: Optional[DexClient] = None, chains: Dict = CHAINS) -> "TokenRegistry":
+        """Build a registry seeded with the addresses in okxpy.dex.constants.CHAINS"""
+        registry = cls(dex)
+        for chain in chains.values():
+            tokens = []
+            for key, address in chain["Addr"].items():
+                symbol = key.replace("_MINT_ADDR", "").replace("_ADDR", "")
+                tokens.append(TokenInfo(chain["chain_id"], address, symbol))
+            registry.update(chain["chain_id"], tokens, replace=False)
+        return registry
+
+    @classmethod
+    def from_snapshot(cls, store: SnapshotStore, dex: Optional[DexClient] = None,
+                      follow: bool = True) -> "TokenRegistry":
+        """
+        Build a registry from the token lists saved in a SnapshotStore
+
+        Args:
+            store: Snapshot store, e.g. the one passed to OKXClient(snapshot=...)
+            dex: Client used by refresh()/arefresh() to fetch token lists
+            follow: Apply new versions of the token lists as the store refreshes them
+        """
+        registry = cls(dex)
+        if follow:
+            store.subscribe(registry._apply_snapshot)
+        for snapshot in store.snapshots(TOKENS_PATH):
+            registry._apply_snapshot(snapshot)
+        return registry
+
+    def _apply_snapshot(self, snapshot: Snapshot, diff: Optional[Dict[str, int]] = None) -> None:
+        chain_id = snapshot.params.get("chainId")
+        if snapshot.path == TOKENS_PATH and chain_id:
+            self.load(chain_id, snapshot.response.get("data") or [])
+
+    def refresh(self, chain_id: str) -> Dict[str, int]:
+        """
+        Re-fetch the token list of a chain and apply the changes
+
+        Args:
+            chain_id: Chain ID to refresh
+
+        Returns:
+            Counts of added, updated and removed tokens
+        """
+        if self.dex is None:
+            raise ValueError("TokenRegistry.refresh requires a DexClient")
+        response = check_response(self.dex.get_tokens(chain_id))
+        return self.load(chain_id, response["data"])
+
+    async def arefresh(self, chain_id: str) -> Dict[str, int]:
+        """Async variant of refresh() for registries built on an AsyncDexClient"""
+        if self.dex is None:
+            raise ValueError("TokenRegistry.arefresh requires a DexClient")
+        response = check_response(await self.dex.get_tokens(chain_id))
+        return self.load(chain_id, response["data"])
+
+    def load(self, chain_id: str, items: Iterable[Dict]) -> Dict[str, int]:
+        """Replace the tokens of a chain with raw all-tokens response items"""
+        return self.update(chain_id, (TokenInfo.from_api(chain_id, item) for item in items))
+
+    def update(self, chain_id: str, tokens: Iterable[TokenInfo], replace: bool = True) -> Dict[str, int]:
+        """
+        Apply tokens to a chain, touching only entries that changed
+
+        Args:
+            chain_id: Chain the tokens belong to
+            tokens: New token set for the chain
+            replace: Remove tokens of the chain that are not in tokens
+
+        Returns:
+            Counts of added, updated and removed tokens
+        """
+        incoming = {token.address: token for token in tokens}
+        with self._lock:
+            current = self._chains.setdefault(chain_id, {})
+            added = [t for a, t in incoming.items() if a not in current]
+            updated = [t for a, t in incoming.items() if a in current and current[a] != t]
+            removed = [t for a, t in current.items() if a not in incoming] if replace else []
+
+            dirty_symbols = set()
+            for token in removed:
+                del current[token.address]
+                self._by_address.pop((chain_id, token.address), None)
+                self._by_lower.pop((chain_id, token.address.lower()), None)
+                dirty_symbols.add(token.symbol.upper())
+            for token in updated:
+                dirty_symbols.add(current[token.address].symbol.upper())
+            for token in added + updated:
+                current[token.address] = token
+                self._by_address[(chain_id, token.address)] = token
+                self._by_lower[(chain_id, token.address.lower())] = token
+                dirty_symbols.add(token.symbol.upper())
+
+            if dirty_symbols:
+                self._reindex_symbols(chain_id, dirty_symbols)
+
+        return {"added": len(added), "updated": len(updated), "removed": len(removed)}
+
+    def _reindex_symbols(self, chain_id: str, symbols: set) -> None:
+        matches: Dict[str, List[TokenInfo]] = {symbol: [] for symbol in symbols}
+        for token in self._chains[chain_id].values():
+            bucket = matches.get(token.symbol.upper())
+            if bucket is not None:
+                bucket.append(token)
+        for symbol, tokens in matches.items():
+            if tokens:
+                self._by_symbol[(chain_id, symbol)] = tuple(tokens)
+            else:
+                self._by_symbol.pop((chain_id, symbol), None)
+
+    def get(self, chain_id: str, address: str) -> Optional[TokenInfo]:
+        """Look up a token by address, falling back to a case-insensitive match"""
+        token = self._by_address.get((chain_id, address))
+        if token is None:
+            token = self._by_lower.get((chain_id, address.lower()))
+        return token
+
+    def by_symbol(self, chain_id: str, symbol: str) -> Tuple[TokenInfo, ...]:
+        """All tokens of a chain sharing a symbol (case-insensitive)"""
+        return self._by_symbol.get((chain_id, symbol.upper()), ())
+
+    def resolve(self, chain_id: str, symbol_or_address: str) -> TokenInfo:
+        """
+        Resolve a symbol or address to a single token
+
+        Raises:
+            KeyError: No token matches, or the symbol is ambiguous
+        """
+        token = self.get(chain_id, symbol_or_address)
+        if token is not None:
+            return token
+        matches = self.by_symbol(chain_id, symbol_or_address)
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            raise KeyError(f"Symbol {symbol_or_address} is ambiguous on chain {chain_id}")
+        raise KeyError(f"Unknown token {symbol_or_address} on chain {chain_id}")
+
+    def address_of(self, chain_id: str, symbol: str) -> str:
+        """Contract address of the token with symbol"""
+        return self.resolve(chain_id, symbol).address
+
+    def decimals_of(self, chain_id: str, symbol_or_address: str) -> Optional[int]:
+        """Decimals of a token, None if not known"""
+        return self.resolve(chain_id, symbol_or_address).decimals
+
+    def tokens(self, chain_id: str) -> List[TokenInfo]:
+        """All tokens loaded for a chain"""
+        return list(self._chains.get(chain_id, {}).values())
+
+    def chains(self) -> List[str]:
+        """Chain IDs with loaded tokens"""
+        return list(self._chains)
+
+    def __len__(self) -> int:
+        return len(self._by_address)
@@ -0,0 +1,12 @@
+"""
+OKX API Emulator
+~~~~~~~~~~~~~~~~
+
+Local stand-in for the OKX Web3 API for offline load and resilience testing.
+"""
+
+from .fixtures import Fixtures, FixtureError
+from .server import Emulator, uniform, lognormal
+from .h2 import H2Emulator
+
+__all__ = ["Emulator", "H2Emulator", "Fixtures", "FixtureError", "uniform", "lognormal"]
@@ -0,0 +1,57 @@
+"""
+Run the emulator from the command line
+
+Usage:
+    python -m okxpy.emulator --port 8080 --latency 0.01 0.05 --rate-limit dex=10
+    python -m okxpy.emulator --http2 --port 8443
+"""
+
+import argparse
+
+from .fixtures import Fixtures
+from .h2 import H2Emulator
+from .server import DEFAULT_API_KEY, DEFAULT_PASSPHRASE, DEFAULT_SECRET_KEY, Emulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OKX Web3 API emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", default=DEFAULT_API_KEY)
+    parser.add_argument("--secret-key", default=DEFAULT_SECRET_KEY)
+    parser.add_argument("--passphrase", default=DEFAULT_PASSPHRASE)
+    parser.add_argument("--no-verify", action="store_true", help="accept unsigned requests")
+    parser.add_argument("--latency", type=float, nargs="+", metavar="SECONDS",
+                        help="constant latency, or a low and high bound")
+    parser.add_argument("--rate-limit", action="append", default=[], metavar="GROUP=RATE",
+                        help="requests per second for an endpoint group, e.g. dex=10")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--extra-tokens", type=int, default=0, metavar="N",
+                        help="append N synthetic tokens to every all-tokens list")
+    parser.add_argument("--http2", action="store_true", help="serve HTTP/2 with prior knowledge (h2c)")
+    args = parser.parse_args()
+
+    latency = None
+    if args.latency:
+        latency = args.latency[0] if len(args.latency) == 1 else tuple(args.latency[:2])
+    rate_limits = {}
+    for item in args.rate_limit:
+        group, _, rate = item.partition("=")
+        rate_limits[group] = float(rate)
+
+    emulator_class = H2Emulator if args.http2 else Emulator
+    emulator = emulator_class(args.host, args.port, args.api_key, args.secret_key, args.passphrase,
+                              verify_signature=not args.no_verify, latency=latency,
+                              rate_limits=rate_limits or None, error_rate=args.error_rate,
+                              seed=args.seed, fixtures=Fixtures(extra_tokens=args.extra_tokens))
+    protocol = "HTTP/2 (h2c)" if args.http2 else "HTTP/1.1"
+    print(f"OKX emulator listening on http://{args.host}:{args.port} ({protocol})")
+    try:
+        emulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+OKX API Emulator Fixtures
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Stateful fixture payloads for every route the okxpy clients call. Quotes
+are priced from a fixed price table, broadcasts create orders that settle
+after a delay, and nonces advance with every broadcast.
+"""
+
+import hashlib
+import math
+import re
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..dex.constants import CHAINS
+
+# USD prices and decimals by token symbol (unknown tokens: $1, 18 decimals)
+PRICES = {
+    "ETH": "3000", "WETH": "3000", "USDT": "1", "USDC": "1", "DAI": "1",
+    "WBTC": "60000", "BTC": "60000", "UNI": "8", "LINK": "15", "AAVE": "100",
+    "MATIC": "0.7", "SOL": "150", "BONK": "0.00002", "RAY": "2", "AVAX": "30",
+}
+DECIMALS = {"USDT": 6, "USDC": 6, "WBTC": 8, "BTC": 8, "SOL": 9, "BONK": 5, "RAY": 6}
+
+NETWORKS = {"1": "ETH", "501": "SOL", "56": "BSC", "137": "POLYGON", "42161": "ARB"}
+DEXES = [
+    {"id": "1", "name": "Uniswap V3"},
+    {"id": "2", "name": "Curve"},
+    {"id": "3", "name": "SushiSwap"},
+]
+ROUTER_ADDRESS = "0x7D0CcAa3Fac1e5A943c5168b6CEd828691b46B36"
+APPROVE_ADDRESS = "0x40aA958dd87FC8305b97f2BA922CDdCa374bcD7f"
+BLACKLISTED_ADDRESS = "0x000000000000000000000000000000000000dEaD"
+SOLANA_CHAIN = "501"
+
+_EVM_ADDRESS = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_SUI_ADDRESS = re.compile(r"^0x[0-9a-fA-F]{64}$")
+_BASE58_ADDRESS = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+
+
+class FixtureError(Exception):
+    """Business error returned with HTTP 200, like the real API"""
+
+    def __init__(self, code: str, msg: str):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+
+
+def _tokens() -> Dict[Tuple[str, str], Dict]:
+    """Token metadata keyed by (chain id, lower-case address)"""
+    tokens = {}
+    for chain in CHAINS.values():
+        for name, address in chain["Addr"].items():
+            symbol = name.split("_")[0]
+            tokens[(chain["chain_id"], address.lower())] = {
+                "decimal": str(DECIMALS.get(symbol, 18)),
+                "tokenContractAddress": address,
+                "tokenSymbol": symbol,
+                "tokenUnitPrice": PRICES.get(symbol, "1"),
+            }
+    return tokens
+
+
+def _require(params: Dict, *keys: str) -> None:
+    missing = [key for key in keys if not params.get(key)]
+    if missing:
+        raise FixtureError("51000", f"Parameter {missing[0]} error")
+
+
+def _hex(seed: str, length: int = 64) -> str:
+    return "0x" + hashlib.sha256(seed.encode("utf-8")).hexdigest()[:length]
+
+
+class Fixtures:
+    """
+    Route handlers returning the ``data`` field of a response
+
+    Handlers take (query params, JSON body) and either return the data or
+    raise :class:`FixtureError`. State is shared by all connections.
+    """
+
+    def __init__(self, confirm_after: float = 2.0, products: int = 120, sui_objects: int = 25,
+                 extra_tokens: int = 0):
+        """
+        Args:
+            confirm_after: Seconds until a broadcast order is marked successful
+            products: Number of DeFi products served by product/list
+            sui_objects: Number of SUI objects per address
+            extra_tokens: Synthetic tokens appended to every all-tokens list,
+                for exercising large responses
+        """
+        self.confirm_after = confirm_after
+        self.sui_objects = sui_objects
+        self.extra_tokens = extra_tokens
+        self.tokens = _tokens()
+        self.orders: List[Dict] = []
+        self.nonces: Dict[Tuple[str, str], int] = {}
+        self._products = [self._product(i) for i in range(products)]
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], Callable[[Dict, Dict], Any]] = {
+            ("GET", "/api/v5/dex/aggregator/supported/chain"): self.supported_chain,
+            ("GET", "/api/v5/dex/aggregator/all-tokens"): self.all_tokens,
+            ("GET", "/api/v5/dex/aggregator/get-liquidity"): self.liquidity,
+            ("GET", "/api/v5/dex/aggregator/quote"): self.quote,
+            ("GET", "/api/v5/dex/aggregator/swap"): self.swap,
+            ("GET", "/api/v5/dex/aggregator/approve-transaction"): self.approve_transaction,
+            ("POST", "/api/v5/wallet/pre-transaction/sign-info"): self.sign_info,
+            ("GET", "/api/v5/wallet/pre-transaction/gas-price"): self.gas_price,
+            ("POST", "/api/v5/wallet/pre-transaction/gas-limit"): self.gas_limit,
+            ("GET", "/api/v5/wallet/pre-transaction/nonce"): self.nonce,
+            ("POST", "/api/v5/wallet/pre-transaction/sui-object"): self.sui_object,
+            ("GET", "/api/v5/wallet/pre-transaction/validate-address"): self.validate_address,
+            ("POST", "/api/v5/wallet/pre-transaction/broadcast-transaction"): self.broadcast,
+            ("GET", "/api/v5/wallet/post-transaction/orders"): self.transaction_orders,
+            ("GET", "/api/v5/defi/explore/protocol/list"): self.protocol_list,
+            ("GET", "/api/v5/defi/explore/token/list"): self.token_list,
+            ("POST", "/api/v5/defi/explore/product/list"): self.product_list,
+            ("GET", "/api/v5/defi/explore/product/detail"): self.product_detail,
+            ("GET", "/api/v5/defi/explore/network-list"): self.network_list,
+        }
+
+    # DEX aggregator
+
+    def supported_chain(self, params: Dict, body: Dict) -> List[Dict]:
+        chains = [{"chainId": chain["chain_id"], "chainName": name,
+                   "dexTokenApproveAddress": APPROVE_ADDRESS}
+                  for name, chain in CHAINS.items()]
+        if params.get("chainId"):
+            chains = [chain for chain in chains if chain["chainId"] == params["chainId"]]
+        return chains
+
+    def all_tokens(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainId")
+        tokens = [{"decimals": token["decimal"], "tokenContractAddress": token["tokenContractAddress"],
+                   "tokenSymbol": token["tokenSymbol"], "tokenName": token["tokenSymbol"],
+                   "tokenLogoUrl": ""}
+                  for (chain_id, _), token in self.tokens.items() if chain_id == params["chainId"]]
+        tokens.extend({"decimals": "18", "tokenContractAddress": f"0x{index + 1:040x}",
+                       "tokenSymbol": f"TKN{index}", "tokenName": f"Synthetic Token {index}",
+                       "tokenLogoUrl": f"https://static.okx.com/cdn/wallet/logo/tkn{index}.png"}
+                      for index in range(self.extra_tokens))
+        return tokens
+
+    def liquidity(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainId")
+        return [{"id": dex["id"], "name": dex["name"], "logo": ""} for dex in DEXES]
+
+    def token(self, chain_id: str, address: str) -> Dict:
+        token = self.tokens.get((chain_id, address.lower()))
+        if token is None:
+            token = {"decimal": "18", "tokenContractAddress": address,
+                     "tokenSymbol": "UNKNOWN", "tokenUnitPrice": "1"}
+        return token
+
+    def quote(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainId", "amount", "fromTokenAddress", "toTokenAddress")
+        chain_id = params["chainId"]
+        amount = int(params["amount"])
+        from_token = self.token(chain_id, params["fromTokenAddress"])
+        to_token = self.token(chain_id, params["toTokenAddress"])
+
+        value = (Decimal(amount) / (10 ** int(from_token["decimal"]))
+                 * Decimal(from_token["tokenUnitPrice"]))
+        fee = Decimal(params.get("feePercent") or "0") / 100
+        out = value * (1 - Decimal("0.003") - fee) / Decimal(to_token["tokenUnitPrice"])
+        to_amount = int(out * (10 ** int(to_token["decimal"])))
+        # Larger trades move the price a little more
+        impact = -min(5.0, math.log10(max(float(value), 1.0)) / 10)
+        return [{
+            "chainId": chain_id,
+            "dexRouterList": [{
+                "router": f"{params['fromTokenAddress']}--{params['toTokenAddress']}",
+                "routerPercent": "100",
+                "subRouterList": [{"dexProtocol": [{"dexName": DEXES[0]["name"], "percent": "100"}],
+                                   "fromToken": from_token, "toToken": to_token}],
+            }],
+            "estimateGasFee": "135000",
+            "fromToken": from_token,
+            "toToken": to_token,
+            "fromTokenAmount": str(amount),
+            "toTokenAmount": str(to_amount),
+            "priceImpactPercentage": f"{impact:.2f}",
+            "quoteCompareList": [{"dexName": dex["name"], "dexLogo": "", "tradeFee": "2.1",
+                                  # Token units, not minimal units, as the API reports them
+                                  "amountOut": str((out * (1000 - 2 * i) / 1000).quantize(
+                                      Decimal("0.000001")))}
+                                 for i, dex in enumerate(DEXES)],
+            "tradeFee": "2.1",
+        }]
+
+    def swap(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "slippage", "userWalletAddress")
+        router_result = self.quote(params, body)[0]
+        slippage = Decimal(params["slippage"])
+        min_receive = int(int(router_result["toTokenAmount"]) * (1 - slippage))
+        native = params["fromTokenAddress"].lower() == CHAINS["Ethereum"]["Addr"]["ETH_ADDR"].lower()
+        return [{
+            "routerResult": router_result,
+            "tx": {
+                "from": params["userWalletAddress"],
+                "to": ROUTER_ADDRESS,
+                "data": "0x0d5f0e3b" + _hex(repr(sorted(params.items())))[2:],
+                "value": params["amount"] if native else "0",
+                "gas": params.get("gaslimit") or "210000",
+                "gasPrice": self._gas()["normal"],
+                "maxPriorityFeePerGas": self._gas()["eip1559Protocol"]["proposePriorityFee"],
+                "minReceiveAmount": str(min_receive),
+                "signatureData": [],
+                "slippage": params["slippage"],
+            },
+        }]
+
+    def approve_transaction(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainId", "tokenContractAddress", "approveAmount")
+        return [{
+            "data": "0x095ea7b3" + APPROVE_ADDRESS[2:].lower().rjust(64, "0")
+                    + format(int(params["approveAmount"]), "064x"),
+            "dexContractAddress": APPROVE_ADDRESS,
+            "gasLimit": "50000",
+            "gasPrice": self._gas()["normal"],
+        }]
+
+    # Wallet pre-transaction
+
+    def _gas(self) -> Dict:
+        """EVM gas levels drifting slowly over time"""
+        base = int(20e9 * (1 + 0.25 * math.sin((time.time() - self._started) / 30)))
+        priority = int(1.5e9)
+        return {
+            "normal": str(base + priority),
+            "min": str(base),
+            "max": str(base + 3 * priority),
+            "supporteip1559": True,
+            "eip1559Protocol": {
+                "baseFee": str(base),
+                "proposePriorityFee": str(priority),
+                "safePriorityFee": str(priority // 2),
+                "fastPriorityFee": str(priority * 2),
+            },
+        }
+
+    def sign_info(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(body, "chainIndex", "fromAddr", "toAddr")
+        if body["chainIndex"] == SOLANA_CHAIN:
+            return [{"recentBlockHash": _hex(str(int(time.time())))[2:46],
+                     "lastValidBlockHeight": str(250000000 + int(time.time() - self._started) * 2),
+                     "fee": "5000"}]
+        gas = self._gas()
+        return [{
+            "gasLimit": "65000" if body.get("inputData") else "21000",
+            "nonce": self._nonce(body["chainIndex"], body["fromAddr"])[1],
+            "gasPrice": gas,
+            "normalGasPrice": gas["normal"],
+            "eip1559Protocol": gas["eip1559Protocol"],
+        }]
+
+    def gas_price(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainIndex")
+        return [self._gas()]
+
+    def gas_limit(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(body, "chainIndex", "fromAddr", "toAddr")
+        return [{"gasLimit": "65000" if body.get("extJson") else "21000"}]
+
+    def _nonce(self, chain_index: str, address: str) -> Tuple[str, str]:
+        """(confirmed, pending) nonce of an address"""
+        self._settle()
+        with self._lock:
+            key = (chain_index, address.lower())
+            pending = self.nonces.get(key, 0)
+            confirmed = pending - sum(1 for order in self.orders
+                                      if order["txStatus"] == "1"
+                                      and (order["chainIndex"], order["address"].lower()) == key)
+        return str(confirmed), str(pending)
+
+    def nonce(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainIndex", "address")
+        confirmed, pending = self._nonce(params["chainIndex"], params["address"])
+        return [{"nonce": confirmed, "pendingNonce": pending}]
+
+    def sui_object(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(body, "chainIndex", "address", "tokenAddress")
+        start = int(body.get("cursor") or 0)
+        limit = int(body.get("limit") or 50)
+        end = min(start + limit, self.sui_objects)
+        objects = [{"objectId": _hex(f"{body['address']}:{i}"), "version": str(1000 + i),
+                    "digest": _hex(f"digest:{i}", 44)[2:], "balance": str(10 ** 9)}
+                   for i in range(start, end)]
+        return [{"cursor": str(end) if end < self.sui_objects else "", "data": objects}]
+
+    def validate_address(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(params, "chainIndex", "address")
+        address = params["address"]
+        if params["chainIndex"] == SOLANA_CHAIN:
+            valid = bool(_BASE58_ADDRESS.match(address))
+        elif params["chainIndex"] == "784":
+            valid = bool(_SUI_ADDRESS.match(address))
+        else:
+            valid = bool(_EVM_ADDRESS.match(address))
+        return [{"isValid": valid, "addressType": "1" if valid else "0",
+                 "isContract": valid and address.lower() == ROUTER_ADDRESS.lower(),
+                 "isBlackList": address.lower() == BLACKLISTED_ADDRESS.lower()}]
+
+    def broadcast(self, params: Dict, body: Dict) -> List[Dict]:
+        _require(body, "signedTx", "chainIndex", "address")
+        now = int(time.time() * 1000)
+        with self._lock:
+            key = (body["chainIndex"], body["address"].lower())
+            self.nonces[key] = self.nonces.get(key, 0) + 1
+            order_id = str(len(self.orders) + 1).rjust(12, "0")
+            self.orders.append({
+                "orderId": order_id,
+                "txHash": _hex(body["signedTx"]),
+                "chainIndex": body["chainIndex"],
+                "address": body["address"],
+                "accountId": body.get("accountId", ""),
+                "txStatus": "1",
+                "failReason": "",
+                "createdAt": str(now),
+                "updatedAt": str(now),
+            })
+        return [{"orderId": order_id}]
+
+    # Wallet post-transaction
+
+    def _settle(self) -> None:
+        """Mark orders older than confirm_after as successful"""
+        cutoff = int((time.time() - self.confirm_after) * 1000)
+        with self._lock:
+            for order in self.orders:
+                if order["txStatus"] == "1" and int(order["createdAt"]) <= cutoff:
+                    order["txStatus"] = "2"
+                    order["updatedAt"] = str(int(time.time() * 1000))
+
+    def transaction_orders(self, params: Dict, body: Dict) -> List[Dict]:
+        self._settle()
+        filters = [(key, params[key]) for key in ("address", "accountId", "chainIndex", "orderId", "txStatus")
+                   if params.get(key)]
+        with self._lock:
+            orders = [dict(order) for order in reversed(self.orders)
+                      if all(str(order[key]).lower() == str(value).lower() for key, value in filters)]
+        start = int(params.get("cursor") or 0)
+        end = start + int(params.get("limit") or 20)
+        return [{"cursor": str(end) if end < len(orders) else "", "orders": orders[start:end]}]
+
+    # DeFi explore
+
+    def _product(self, i: int) -> Dict:
+        chain_id, network = list(NETWORKS.items())[i % len(NETWORKS)]
+        symbol = ("USDT", "USDC", "ETH", "DAI", "WBTC")[i % 5]
+        return {
+            "investmentId": str(1000 + i),
+            "investmentName": f"{symbol} Pool {i}",
+            "chainId": chain_id,
+            "rate": f"{0.01 + (i % 37) / 1000:.4f}",
+            "investType": str(1 + i % 3),
+            "platformName": DEXES[i % len(DEXES)]["name"],
+            "platformId": DEXES[i % len(DEXES)]["id"],
+            "analysisPlatformId": DEXES[i % len(DEXES)]["id"],
+            "tvl": str(1000000 + 7919 * i),
+            "poolVersion": "1",
+            "underlyingToken": [{"tokenId": str(i % 5), "tokenSymbol": symbol,
+                                 "tokenAddress": _hex(symbol, 40), "network": network}],
+        }
+
+    def protocol_list(self, params: Dict, body: Dict) -> List[Dict]:
+        protocols = [{"platformId": dex["id"], "platformName": dex["name"],
+                      "platformWebSite": "", "investmentApiUrlPattern": ""} for dex in DEXES]
+        if params.get("platformId"):
+            protocols = [p for p in protocols if p["platformId"] == params["platformId"]]
+        return protocols
+
+    def token_list(self, params: Dict, body: Dict) -> List[Dict]:
+        tokens = [{"tokenId": str(i), "tokenSymbol": symbol, "tokenAddress": _hex(symbol, 40),
+                   "network": "ETH", "chainId": "1"}
+                  for i, symbol in enumerate(("USDT", "USDC", "ETH", "DAI", "WBTC"))]
+        if params.get("tokenAddress"):
+            tokens = [t for t in tokens if t["tokenAddress"].lower() == params["tokenAddress"].lower()]
+        return tokens
+
+    def product_list(self, params: Dict, body: Dict) -> Dict:
+        _require(body, "network")
+        products = [p for p in self._products
+                    if p["underlyingToken"][0]["network"] == body["network"]
+                    and (not body.get("platformIds") or p["platformId"] in body["platformIds"])]
+        start = int(body.get("offset") or 0)
+        end = start + int(body.get("limit") or 20)
+        return {"investments": products[start:end], "total": str(len(products))}
+
+    def product_detail(self, params: Dict, body: Dict) -> Dict:
+        _require(params, "investmentId")
+        for product in self._products:
+            if product["investmentId"] == params["investmentId"]:
+                return product
+        raise FixtureError("84001", "Investment not found")
+
+    def network_list(self, params: Dict, body: Dict) -> List[Dict]:
+        networks = [{"network": network, "chainId": chain_id} for chain_id, network in NETWORKS.items()]
+        if params.get("network"):
+            networks = [n for n in networks if n["network"] == params["network"]]
+        if params.get("chainId"):
+            networks = [n for n in networks if n["chainId"] == params["chainId"]]
+        return networks
+
+    def handle(self, method: str, path: str, params: Dict, body: Dict) -> Optional[Dict]:
+        """Return the full response for a route, None when the route is unknown"""
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return None
+        try:
+            return {"code": "0", "msg": "", "data": handler(params, body)}
+        except FixtureError as e:
+            return {"code": e.code, "msg": e.msg, "data": []}
+        except (ValueError, TypeError, KeyError) as e:
+            return {"code": "51000", "msg": f"Parameter error: {e}", "data": []}
@@ -0,0 +1,211 @@
+"""
+OKX API Emulator over HTTP/2
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+HTTP/2 (cleartext, prior knowledge) flavour of the emulator, serving many
+concurrent streams per connection. Requires the h2 package.
+"""
+
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from .server import Emulator, _encode_body
+
+
+def _import_h2():
+    try:
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+        import h2.settings
+    except ImportError:
+        raise ImportError(
+            "H2Emulator requires h2, install it with `pip install okxpy[http2]`"
+        ) from None
+    return h2
+
+
+class _Headers(dict):
+    """Request headers with case-insensitive get(), as HTTP/2 sends them lowercased"""
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+
+class _H2Protocol(asyncio.Protocol):
+    """One HTTP/2 connection; each stream is answered by Emulator.dispatch"""
+
+    def __init__(self, emulator: "H2Emulator"):
+        self.h2 = _import_h2()
+        self.emulator = emulator
+        self.conn = self.h2.connection.H2Connection(
+            self.h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.transport: Optional[asyncio.Transport] = None
+        self.streams: Dict[int, tuple] = {}
+        self.window_open = asyncio.Event()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.emulator._lock:
+            self.emulator.connections += 1
+        self.emulator._protocols.add(self)
+        self.conn.initiate_connection()
+        self.conn.update_settings({
+            self.h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.emulator.max_concurrent_streams})
+        self._flush()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.emulator._protocols.discard(self)
+        self.window_open.set()
+
+    def _flush(self) -> None:
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        events = self.h2.events
+        try:
+            received = self.conn.receive_data(data)
+        except self.h2.exceptions.ProtocolError:
+            self._flush()
+            self.transport.close()
+            return
+
+        for event in received:
+            if isinstance(event, events.RequestReceived):
+                self.streams[event.stream_id] = (_Headers(event.headers), bytearray())
+            elif isinstance(event, events.DataReceived):
+                stream = self.streams.get(event.stream_id)
+                if stream is not None:
+                    stream[1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, events.StreamEnded):
+                stream = self.streams.pop(event.stream_id, None)
+                if stream is not None:
+                    asyncio.ensure_future(self._respond(event.stream_id, *stream))
+            elif isinstance(event, events.StreamReset):
+                self.streams.pop(event.stream_id, None)
+            elif isinstance(event, events.WindowUpdated):
+                self.window_open.set()
+        self._flush()
+
+    async def _respond(self, stream_id: int, headers: _Headers, body: bytearray) -> None:
+        emulator = self.emulator
+        loop = asyncio.get_event_loop()
+        # dispatch() sleeps for the injected latency, so it runs off the loop
+        status, response, extra = await loop.run_in_executor(
+            emulator._executor, emulator.dispatch,
+            headers[":method"], headers[":path"], bytes(body), headers)
+        with emulator._lock:
+            emulator.statuses[status] += 1
+
+        try:
+            if status is None:
+                self.conn.reset_stream(stream_id)
+                self._flush()
+                return
+            payload, encoding = _encode_body(response, headers.get("accept-encoding"))
+            extra = dict(encoding, **extra)
+            self.conn.send_headers(stream_id, [
+                (":status", str(status)),
+                ("content-type", "application/json"),
+                ("content-length", str(len(payload))),
+            ] + [(name.lower(), value) for name, value in extra.items()])
+            await self._send_data(stream_id, payload)
+        except self.h2.exceptions.ProtocolError:
+            # The stream was reset or the connection closed meanwhile
+            pass
+
+    async def _send_data(self, stream_id: int, payload: bytes) -> None:
+        """Send a body within the peer's flow-control windows"""
+        while payload:
+            window = self.conn.local_flow_control_window(stream_id)
+            if window <= 0:
+                self.window_open.clear()
+                await self.window_open.wait()
+                if self.transport.is_closing():
+                    return
+                continue
+            size = min(window, len(payload), self.conn.max_outbound_frame_size)
+            self.conn.send_data(stream_id, payload[:size])
+            payload = payload[size:]
+            self._flush()
+        self.conn.end_stream(stream_id)
+        self._flush()
+
+
+class H2Emulator(Emulator):
+    """
+    :class:`Emulator` speaking HTTP/2 with prior knowledge (h2c)
+
+    Accepts the same options, plus the number of concurrent streams it
+    advertises per connection. Point an HTTP/2 transport at ``url``::
+
+        with H2Emulator(latency=0.02) as emulator:
+            client = OKXClient(base_url=emulator.url, transport="http2", **emulator.credentials())
+    """
+
+    def __init__(self, *args, max_concurrent_streams: int = 1000, workers: int = 256, **kwargs):
+        """
+        Args:
+            max_concurrent_streams: SETTINGS_MAX_CONCURRENT_STREAMS sent to clients
+            workers: Threads answering streams concurrently (latency sleeps there)
+            *args, **kwargs: As for Emulator
+        """
+        _import_h2()
+        super().__init__(*args, **kwargs)
+        self.max_concurrent_streams = max_concurrent_streams
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._protocols: Set[_H2Protocol] = set()
+
+    def _bind(self) -> asyncio.AbstractServer:
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            self._loop.create_server(lambda: _H2Protocol(self), self.host, self.port, backlog=1024))
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    def _serve(self, ready: Optional[threading.Event] = None) -> None:
+        self._bind()
+        if ready is not None:
+            ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            for protocol in list(self._protocols):
+                protocol.transport.close()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+            self._executor.shutdown(wait=False)
+            self._server = None
+
+    def start(self) -> "H2Emulator":
+        """Start serving in a background thread"""
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted"""
+        self._serve()
+
+    def stop(self) -> None:
+        """Stop serving and close all connections"""
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
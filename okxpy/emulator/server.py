@@ -0,0 +1,371 @@
+"""
+OKX API Emulator Server
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Local stand-in for the OKX Web3 API, for offline load and resilience
+testing. Requests are authenticated like the real API, and latency,
+rate limiting and failures can be injected.
+"""
+
+import base64
+import calendar
+import gzip
+import hashlib
+import hmac
+import json
+import math
+import random
+import socket
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+
+from ..utils.ratelimit import RATE_LIMIT_CODE, LimitSpec, RateLimiter
+from .fixtures import Fixtures
+
+# Seconds of latency: a constant, a (low, high) uniform range or a sampler
+LatencySpec = Union[None, float, Tuple[float, float], Callable[[random.Random], float]]
+
+DEFAULT_API_KEY = "emulator-api-key"
+DEFAULT_SECRET_KEY = "emulator-secret-key"
+DEFAULT_PASSPHRASE = "emulator-passphrase"
+DEFAULT_PROJECT_ID = "emulator-project"
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    """Latency drawn uniformly from [low, high] seconds"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Long-tailed latency around median seconds"""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def _parse_timestamp(value: str) -> Optional[float]:
+    """Parse the OK-ACCESS-TIMESTAMP format, e.g. 2024-01-01T00:00:00.000Z"""
+    try:
+        seconds, millis = value.rstrip("Z").split(".")
+        return calendar.timegm(time.strptime(seconds, "%Y-%m-%dT%H:%M:%S")) + int(millis) / 1000
+    except ValueError:
+        return None
+
+
+class _Fault:
+    __slots__ = ("status", "response", "delay")
+
+    def __init__(self, status: Optional[int], response: Optional[Dict], delay: float):
+        self.status = status
+        self.response = response
+        self.delay = delay
+
+
+class Emulator:
+    """
+    Local OKX Web3 API server
+
+    Serves the DEX aggregator, wallet pre/post-transaction and DeFi explore
+    routes from :class:`~okxpy.emulator.fixtures.Fixtures`. Signatures are
+    verified exactly as the API does (HMAC-SHA256 over timestamp, method,
+    request path with query string, and raw body). Rejections use the API's
+    error codes: 50111 unknown key, 50105 wrong passphrase, 50102 expired
+    timestamp, 50113 bad signature.
+
+    Example::
+
+        with Emulator(latency=uniform(0.01, 0.03), rate_limits={"dex": 10}) as emulator:
+            client = OKXClient(base_url=emulator.url, **emulator.credentials())
+            client.dex.get_quote("1", "1000000", USDT, USDC)
+    """
+
+    def __init__(self, host: str = "127.0.0.1",
+                 port: int = 0,
+                 api_key: str = DEFAULT_API_KEY,
+                 secret_key: str = DEFAULT_SECRET_KEY,
+                 passphrase: str = DEFAULT_PASSPHRASE,
+                 verify_signature: bool = True,
+                 max_clock_skew: Optional[float] = 30.0,
+                 latency: LatencySpec = None,
+                 route_latency: Optional[Dict[str, LatencySpec]] = None,
+                 rate_limits: Optional[Dict[str, LimitSpec]] = None,
+                 error_rate: float = 0.0,
+                 error_status: int = 500,
+                 fixtures: Optional[Fixtures] = None,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            api_key: API key accepted by the emulator
+            secret_key: Secret used to verify signatures
+            passphrase: Passphrase expected with api_key
+            verify_signature: Reject requests whose OK-ACCESS-SIGN does not match
+            max_clock_skew: Maximum age of OK-ACCESS-TIMESTAMP in seconds (None disables)
+            latency: Latency added to every request
+            route_latency: Latency per request path, overriding latency
+            rate_limits: Server-side limits per endpoint group, as for RateLimiter
+            error_rate: Probability of answering with error_status
+            error_status: HTTP status of randomly injected errors
+            fixtures: Optional pre-configured fixtures
+            seed: Seed for latency and error sampling
+        """
+        self.host = host
+        self.port = port
+        self.keys: Dict[str, Tuple[str, str]] = {api_key: (secret_key, passphrase)}
+        self.verify_signature = verify_signature
+        self.max_clock_skew = max_clock_skew
+        self.latency = latency
+        self.route_latency = dict(route_latency or {})
+        self.rate_limiter = RateLimiter(rate_limits) if rate_limits else None
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fixtures = fixtures or Fixtures()
+
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.auth_failures = 0
+        self.throttled = 0
+        self.injected = 0
+        self.connections = 0
+        self._faults: Dict[str, Deque[_Fault]] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to point a transport at"""
+        return f"http://{self.host}:{self.port}"
+
+    def credentials(self, api_key: Optional[str] = None) -> Dict[str, str]:
+        """OKXClient keyword arguments for a registered key"""
+        api_key = api_key or next(iter(self.keys))
+        secret_key, passphrase = self.keys[api_key]
+        return {"api_key": api_key, "secret_key": secret_key,
+                "passphrase": passphrase, "project_id": DEFAULT_PROJECT_ID}
+
+    def add_key(self, api_key: str, secret_key: str, passphrase: str) -> None:
+        """Accept another API key"""
+        self.keys[api_key] = (secret_key, passphrase)
+
+    def fail_next(self, path: str, status: Optional[int] = 500, times: int = 1,
+                  response: Optional[Dict] = None, delay: float = 0.0) -> None:
+        """
+        Script failures for the next requests to a path
+
+        Args:
+            path: Request path, e.g. "/api/v5/dex/aggregator/quote"
+            status: HTTP status to answer with, or None to drop the connection
+            times: Number of consecutive requests to fail
+            response: JSON body to send (default: an error body for status)
+            delay: Seconds to wait before failing
+        """
+        with self._lock:
+            queue = self._faults.setdefault(path, deque())
+            queue.extend(_Fault(status, response, delay) for _ in range(times))
+
+    def _next_fault(self, path: str) -> Optional[_Fault]:
+        with self._lock:
+            queue = self._faults.get(path)
+            if queue:
+                self.injected += 1
+                return queue.popleft()
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.injected += 1
+                return _Fault(self.error_status, None, 0.0)
+        return None
+
+    def _sample_latency(self, path: str) -> float:
+        spec = self.route_latency.get(path, self.latency)
+        if spec is None:
+            return 0.0
+        if isinstance(spec, tuple):
+            spec = uniform(*spec)
+        if callable(spec):
+            with self._lock:
+                return max(0.0, spec(self._rng))
+        return float(spec)
+
+    def authenticate(self, method: str, request_path: str, body: bytes, headers) -> Optional[Dict]:
+        """Return an error response when a request is not properly signed"""
+        api_key = headers.get("OK-ACCESS-KEY")
+        if api_key not in self.keys:
+            return {"code": "50111", "msg": "Invalid OK-ACCESS-KEY"}
+        secret_key, passphrase = self.keys[api_key]
+        if headers.get("OK-ACCESS-PASSPHRASE") != passphrase:
+            return {"code": "50105", "msg": "Invalid OK-ACCESS-PASSPHRASE"}
+
+        timestamp = headers.get("OK-ACCESS-TIMESTAMP") or ""
+        sent_at = _parse_timestamp(timestamp)
+        if sent_at is None or (self.max_clock_skew is not None
+                               and abs(time.time() - sent_at) > self.max_clock_skew):
+            return {"code": "50102", "msg": "Timestamp request expired"}
+
+        prehash = f"{timestamp}{method}{request_path}".encode("utf-8") + body
+        expected = base64.b64encode(
+            hmac.new(secret_key.encode("utf-8"), prehash, hashlib.sha256).digest()).decode("ascii")
+        if not hmac.compare_digest(expected, headers.get("OK-ACCESS-SIGN") or ""):
+            return {"code": "50113", "msg": "Invalid Sign"}
+        return None
+
+    def dispatch(self, method: str, request_path: str, body: bytes, headers) -> Tuple[Optional[int], Dict, Dict]:
+        """
+        Answer one request
+
+        Returns:
+            (HTTP status or None to drop the connection, JSON body, extra headers)
+        """
+        path, _, query = request_path.partition("?")
+        with self._lock:
+            self.requests[path] += 1
+
+        delay = self._sample_latency(path)
+        if delay:
+            time.sleep(delay)
+
+        if self.verify_signature:
+            error = self.authenticate(method, request_path, body, headers)
+            if error is not None:
+                with self._lock:
+                    self.auth_failures += 1
+                return 401, error, {}
+
+        if self.rate_limiter is not None:
+            bucket = self.rate_limiter.bucket(headers.get("OK-ACCESS-KEY") or "", path)
+            if bucket is not None and not bucket.acquire(blocking=False):
+                with self._lock:
+                    self.throttled += 1
+                retry_after = max(1, int(round(1 / bucket.rate)))
+                return 429, {"code": RATE_LIMIT_CODE, "msg": "Requests too frequent"}, {
+                    "Retry-After": str(retry_after)}
+
+        fault = self._next_fault(path)
+        if fault is not None:
+            if fault.delay:
+                time.sleep(fault.delay)
+            return fault.status, fault.response or {
+                "code": str(fault.status), "msg": "Injected failure"}, {}
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"code": "50002", "msg": "Invalid JSON body"}, {}
+        response = self.fixtures.handle(method, path, dict(parse_qsl(query)), payload)
+        if response is None:
+            return 404, {"code": "404", "msg": f"Unknown route {method} {path}"}, {}
+        return 200, response, {}
+
+    def stats(self) -> Dict:
+        """Request, status, failure and accepted connection counters"""
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "requests_by_path": dict(self.requests),
+                "statuses": dict(self.statuses),
+                "auth_failures": self.auth_failures,
+                "throttled": self.throttled,
+                "injected": self.injected,
+                "connections": self.connections,
+            }
+
+    def _bind(self) -> ThreadingHTTPServer:
+        handler = type("EmulatorHandler", (_Handler,), {"emulator": self})
+        self._server = _Server((self.host, self.port), handler)
+        self.port = self._server.server_address[1]
+        return self._server
+
+    def start(self) -> "Emulator":
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self._bind().serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted"""
+        self._bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+
+def _encode_body(response: Dict, accept_encoding: Optional[str]) -> Tuple[bytes, Dict[str, str]]:
+    """JSON-encode a response, gzipped when the client accepts it and it is large"""
+    payload = json.dumps(response).encode("utf-8")
+    if len(payload) >= GZIP_MIN_SIZE and "gzip" in (accept_encoding or ""):
+        return gzip.compress(payload, 5), {"Content-Encoding": "gzip"}
+    return payload, {}
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded server with a listen backlog sized for load tests"""
+
+    daemon_threads = True
+    # The default of 5 drops connection bursts, which then wait on SYN retries
+    request_queue_size = 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive request handler bound to an Emulator"""
+
+    protocol_version = "HTTP/1.1"
+    emulator: Emulator
+
+    def setup(self):
+        super().setup()
+        # Small responses would otherwise wait on delayed ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.emulator._lock:
+            self.emulator.connections += 1
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, response, headers = self.emulator.dispatch(self.command, self.path, body, self.headers)
+        with self.emulator._lock:
+            self.emulator.statuses[status] += 1
+        if status is None:
+            self.close_connection = True
+            return
+
+        payload, encoding = _encode_body(response, self.headers.get("Accept-Encoding"))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in list(encoding.items()) + list(headers.items()):
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _handle
+
+    def do_HEAD(self):
+        # Connection prewarming
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
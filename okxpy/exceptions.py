@@ -0,0 +1,31 @@
+"""
+OKX SDK Exceptions
+~~~~~~~~~~~~~~~~~~
+"""
+
+from typing import Dict, Optional
+
+
+class OKXError(Exception):
+    """Base class for errors raised by okxpy"""
+
+
+class OKXAPIError(OKXError):
+    """The API answered with a non-zero code where a result was required"""
+
+    def __init__(self, code: str, msg: str = "", response: Optional[Dict] = None):
+        super().__init__(f"OKX API error {code}: {msg}")
+        self.code = code
+        self.msg = msg
+        self.response = response
+
+    @classmethod
+    def from_response(cls, response: Dict) -> "OKXAPIError":
+        return cls(str(response.get("code")), response.get("msg", ""), response)
+
+
+def check_response(response: Dict) -> Dict:
+    """Return response if its code is "0", otherwise raise OKXAPIError"""
+    if response.get("code") != "0":
+        raise OKXAPIError.from_response(response)
+    return response
@@ -5,6 +5,15 @@ OKX Marketplace API Module
 This module provides access to OKX Marketplace API endpoints.
 """
 
-from .client import MarketplaceClient
+from typing import TYPE_CHECKING
 
-__all__ = ["MarketplaceClient"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import MarketplaceClient, AsyncMarketplaceClient
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MarketplaceClient": ".client", "AsyncMarketplaceClient": ".client",
+})
+
+__all__ = ["MarketplaceClient", "AsyncMarketplaceClient"]
@@ -0,0 +1,16 @@
+from ..base import AsyncBaseClient, BaseClient
+
+
+class MarketplaceClient(BaseClient):
+    """OKX NFT Marketplace API client"""
+
+    BASE_PATH = "/api/v5/mktplace"
+
+
+class AsyncMarketplaceClient(AsyncBaseClient, MarketplaceClient):
+    """
+    Asyncio flavour of :class:`MarketplaceClient`
+
+    Requests are resolved through a non-blocking
+    :class:`~okxpy.utils.http.AsyncHTTPTransport`.
+    """
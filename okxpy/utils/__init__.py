@@ -5,7 +5,37 @@ OKX API Utilities
 This module provides utility functions for the OKX API SDK.
 """
 
-from .http import make_request
-from .validator import validate_params
+from typing import TYPE_CHECKING
 
-__all__ = ["make_request", "validate_params"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .http import make_request
+    from .cache import ResponseCache, QuoteCache
+    from .codec import JSONCodec, OrjsonCodec, MsgspecCodec, ApiResponse, Model, get_codec
+    from .ratelimit import RateLimiter, TokenBucket
+    from .retry import RetryPolicy
+    from .singleflight import SingleFlight
+    from .metrics import Instrumentation
+    from .pipeline import Pipeline, Middleware, Request, RawResponse
+    from .snapshot import SnapshotStore, Snapshot
+    from .validator import validate_params
+
+# Importing a submodule such as .codec must not pull in requests through .http
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "make_request": ".http",
+    "ResponseCache": ".cache", "QuoteCache": ".cache",
+    "JSONCodec": ".codec", "OrjsonCodec": ".codec", "MsgspecCodec": ".codec",
+    "ApiResponse": ".codec", "Model": ".codec", "get_codec": ".codec",
+    "RateLimiter": ".ratelimit", "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "SingleFlight": ".singleflight",
+    "Instrumentation": ".metrics",
+    "Pipeline": ".pipeline", "Middleware": ".pipeline", "Request": ".pipeline", "RawResponse": ".pipeline",
+    "SnapshotStore": ".snapshot", "Snapshot": ".snapshot",
+    "validate_params": ".validator",
+})
+
+__all__ = ["make_request", "validate_params", "ResponseCache", "QuoteCache", "RateLimiter", "TokenBucket", "RetryPolicy", "SingleFlight", "Instrumentation",
+           "Pipeline", "Middleware", "Request", "RawResponse", "SnapshotStore", "Snapshot",
+           "JSONCodec", "OrjsonCodec", "MsgspecCodec", "ApiResponse", "Model", "get_codec"] 
\ No newline at end of file
@@ -0,0 +1,288 @@
+"""
+OKX Response Cache
+~~~~~~~~~~~~~~~~~~
+
+Opt-in TTL + LRU cache for reference-data endpoints whose payloads rarely change,
+and a short-lived quote cache with amount bucketing.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from decimal import ROUND_DOWN, Decimal, InvalidOperation
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+# Seconds each reference-data response stays fresh
+DEFAULT_TTLS = {
+    "/api/v5/dex/aggregator/supported/chain": 3600.0,
+    "/api/v5/dex/aggregator/all-tokens": 900.0,
+    "/api/v5/dex/aggregator/get-liquidity": 900.0,
+    "/api/v5/defi/explore/network-list": 3600.0,
+    "/api/v5/defi/explore/protocol/list": 3600.0,
+    "/api/v5/defi/explore/token/list": 900.0,
+}
+
+
+class TTLCache:
+    """Thread-safe bounded LRU mapping whose entries expire individually"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Return (stored_at, value) for key and mark it most recently used"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self):
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache:
+    """
+    Response cache keyed on endpoint path plus canonical parameters
+
+    Only successful (``code == "0"``) responses from endpoints listed in
+    ``ttls`` are cached. Once an entry is older than its TTL it is still
+    served for ``stale_ttl`` more seconds while the transport refreshes it in
+    the background. Cached responses are shared and must be treated as
+    read-only.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None,
+                 maxsize: int = 1024,
+                 stale_ttl: float = 300.0):
+        """
+        Args:
+            ttls: Mapping of request path to TTL in seconds (default: DEFAULT_TTLS)
+            maxsize: Maximum number of cached responses
+            stale_ttl: Seconds an expired entry may be served while refreshing
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._entries = TTLCache(maxsize)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def key(self, method: str, path: str, params: Optional[Dict] = None) -> Optional[Tuple]:
+        """Return the cache key for a request, or None if it is not cacheable"""
+        if method != "GET" or path not in self.ttls:
+            return None
+        return path, tuple(sorted((params or {}).items()))
+
+    def lookup(self, key: Tuple) -> Tuple[Any, str]:
+        """Return (response, state) where state is FRESH, STALE or MISS"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            ttl = self.ttls[key[0]]
+            if age < ttl:
+                self.hits += 1
+                return entry[1], FRESH
+            if age < ttl + self.stale_ttl:
+                self.stale_hits += 1
+                return entry[1], STALE
+        self.misses += 1
+        return None, MISS
+
+    def store(self, key: Tuple, response: Dict) -> None:
+        """Cache response if it is a successful API result"""
+        if isinstance(response, dict) and response.get("code") == "0":
+            self._entries.set(key, response)
+
+    def begin_refresh(self, key: Tuple) -> bool:
+        """Claim the background refresh of key; False if one is already running"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: Tuple) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached responses for path, or everything when path is None"""
+        if path is None:
+            self._entries.clear()
+            return
+        for key in self._entries.keys():
+            if key[0] == path:
+                self._entries.pop(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "evictions": self._entries.evictions,
+            "size": len(self._entries),
+        }
+
+
+QUOTE_PATH = "/api/v5/dex/aggregator/quote"
+
+
+class QuoteCache:
+    """
+    Short-lived cache for DEX quotes with amount bucketing
+
+    Quotes are keyed on chain, token pair, DEX ids, fee and price impact
+    protection plus the amount, so by default only a request for the exact
+    same amount is a hit. With ``bucket`` set, amounts are grouped into
+    fixed buckets of that width on a log scale (0.001 = 0.1%): amounts that
+    share a bucket differ by less than that width, but two close amounts on
+    either side of a bucket boundary still miss each other. A hit for a
+    different amount then has its amounts (``fromTokenAmount``,
+    ``toTokenAmount`` and each ``quoteCompareList`` ``amountOut``, integers
+    or decimal strings alike) scaled linearly to the requested amount. Price impact, fees, gas estimate and route percentages
+    stay those of the cached amount. With ``scale=False`` the quote is
+    returned as fetched; its ``fromTokenAmount`` is the amount it was priced
+    for. Every response served through the cache carries ``"cached": True``
+    or ``"cached": False``.
+    """
+
+    def __init__(self, ttl: float = 1.0,
+                 bucket: float = 0.0,
+                 scale: bool = True,
+                 maxsize: int = 4096):
+        """
+        Args:
+            ttl: Seconds a quote stays usable
+            bucket: Relative width of an amount bucket (0 matches exact amounts only)
+            scale: Scale the amounts of a bucket hit to the requested amount
+            maxsize: Maximum number of cached quotes
+        """
+        self.ttl = ttl
+        self.bucket = bucket
+        self.scale = scale
+        self.hits = 0
+        self.misses = 0
+        self.scaled = 0
+        self._log_width = math.log1p(bucket) if bucket > 0 else 0.0
+        self._entries = TTLCache(maxsize)
+
+    def amount_bucket(self, amount: int) -> int:
+        """Return the bucket index of an amount in minimal units"""
+        if not self._log_width or amount <= 0:
+            return amount
+        return int(math.log(amount) / self._log_width)
+
+    def key(self, method: str, path: str, params: Optional[Dict] = None) -> Optional[Tuple]:
+        """Return the cache key for a request, or None if it is not a cacheable quote"""
+        if method != "GET" or path != QUOTE_PATH or not params:
+            return None
+        try:
+            amount = int(params["amount"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return (
+            params.get("chainId"),
+            str(params.get("fromTokenAddress", "")).lower(),
+            str(params.get("toTokenAddress", "")).lower(),
+            params.get("dexIds") or "",
+            params.get("feePercent") or "",
+            params.get("priceImpactProtectionPercentage") or "",
+            self.amount_bucket(amount),
+        )
+
+    def lookup(self, key: Tuple, params: Dict) -> Optional[Dict]:
+        """Return a cached quote for the requested amount, or None"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        amount, response = entry[1]
+        requested = int(params["amount"])
+        if self.scale and requested != amount and amount:
+            self.scaled += 1
+            return dict(response, cached=True, data=[
+                _scale_quote(quote, requested, amount) for quote in response.get("data") or []
+            ])
+        return dict(response, cached=True)
+
+    def store(self, key: Tuple, params: Dict, response: Dict) -> Dict:
+        """Cache a successful quote and return the response marked as fresh"""
+        if isinstance(response, dict) and response.get("code") == "0":
+            self._entries.set(key, (int(params["amount"]), response))
+        return dict(response, cached=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "scaled": self.scaled,
+            "evictions": self._entries.evictions,
+            "size": len(self._entries),
+        }
+
+
+def _scale_quote(quote: Dict, requested: int, amount: int) -> Dict:
+    """Copy of a quote with its token amounts scaled from amount to requested"""
+    scaled = dict(quote, fromTokenAmount=str(requested))
+    if quote.get("toTokenAmount"):
+        scaled["toTokenAmount"] = _scale_amount(quote["toTokenAmount"], requested, amount)
+    if quote.get("quoteCompareList"):
+        scaled["quoteCompareList"] = [
+            dict(item, amountOut=_scale_amount(item["amountOut"], requested, amount))
+            if item.get("amountOut") else item
+            for item in quote["quoteCompareList"]
+        ]
+    return scaled
+
+
+def _scale_amount(value: Any, requested: int, amount: int) -> Any:
+    """Scale an amount string by requested / amount, rounding down to its own precision"""
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation:
+        return value
+    if not number.is_finite():
+        return value
+    exponent = min(number.as_tuple().exponent, 0)
+    result = (number * requested / amount).quantize(Decimal(1).scaleb(exponent), rounding=ROUND_DOWN)
+    return str(result)
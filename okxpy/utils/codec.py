@@ -0,0 +1,205 @@
+"""
+OKX Response Decoding
+~~~~~~~~~~~~~~~~~~~~~
+
+Pluggable JSON decoders and the base class of the typed response models.
+"""
+
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, Union
+
+
+class JSONCodec:
+    """Standard library decoder"""
+
+    name = "json"
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson decoder"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._loads = orjson.loads
+
+    def decode(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """msgspec decoder"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._decoder = msgspec.json.Decoder()
+
+    def decode(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS = {"msgspec": MsgspecCodec, "orjson": OrjsonCodec, "json": JSONCodec}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = "auto") -> JSONCodec:
+    """
+    Resolve a codec by name
+
+    Args:
+        codec: "auto" (fastest installed), "msgspec", "orjson", "json" or a codec instance
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec in (None, "auto"):
+        for codec_cls in _CODECS.values():
+            try:
+                return codec_cls()
+            except ImportError:
+                continue
+    try:
+        return _CODECS[codec]()
+    except KeyError:
+        raise ValueError(f"Unknown codec: {codec}") from None
+
+
+class Model:
+    """
+    Typed view of an API payload
+
+    Subclasses declare ``__slots__`` and ``FIELDS``, mapping each attribute
+    to its API key, or to ``(api key, Model)`` / ``(api key, [Model])`` for
+    nested payloads. Models also support read-only mapping access by API key
+    (``quote["toTokenAmount"]``), so code written against the raw dicts keeps
+    working when models are enabled.
+
+    Models are a convenience layer, not a performance one: they are built
+    from the already decoded dict, so they cost an extra pass over each
+    payload. Declared fields missing from the payload read as None but are
+    not mapping keys, and keys without a declared field are kept, so
+    ``to_dict()`` returns the original payload.
+    """
+
+    __slots__ = ("_absent", "_extra")
+    FIELDS: Dict[str, Union[str, Tuple[str, Any]]] = {}
+    _KEYS: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._KEYS = {_api_key(spec): attr for attr, spec in cls.FIELDS.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Model":
+        obj = cls.__new__(cls)
+        for attr, spec in cls.FIELDS.items():
+            if isinstance(spec, tuple):
+                key, model = spec
+                value = data.get(key)
+                if value is not None:
+                    if isinstance(model, list):
+                        value = [model[0].from_dict(item) for item in value]
+                    else:
+                        value = model.from_dict(value)
+            else:
+                value = data.get(spec)
+            setattr(obj, attr, value)
+        keys = cls._KEYS.keys()
+        obj._absent = keys - data.keys() or None
+        extra = data.keys() - keys
+        obj._extra = {key: data[key] for key in data if key in extra} if extra else None
+        return obj
+
+    def _present(self, key: str) -> bool:
+        """True if key is a declared field that came with the payload or was set since"""
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return False
+        return self._absent is None or key not in self._absent or getattr(self, attr) is not None
+
+    def to_dict(self) -> Dict:
+        """Convert back to the raw API payload, unknown keys included"""
+        payload = {key: _unwrap(getattr(self, attr)) for key, attr in self._KEYS.items()
+                   if self._present(key)}
+        if self._extra:
+            payload.update(self._extra)
+        return payload
+
+    def __getitem__(self, key: str) -> Any:
+        if self._present(key):
+            return getattr(self, self._KEYS[key])
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return self._extra.get(key, default) if self._extra else default
+        value = getattr(self, attr)
+        return default if value is None else value
+
+    def __contains__(self, key: str) -> bool:
+        return self._present(key) or bool(self._extra and key in self._extra)
+
+    def keys(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[Any]:
+        return (value for _, value in self.items())
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key, attr in self._KEYS.items():
+            if self._present(key):
+                yield key, getattr(self, attr)
+        if self._extra:
+            yield from self._extra.items()
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _api_key(spec: Union[str, Tuple[str, Any]]) -> str:
+    return spec[0] if isinstance(spec, tuple) else spec
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+class ApiResponse(Model):
+    """
+    Response envelope whose data holds typed models
+
+    ``cached`` is True or False for responses served through a QuoteCache
+    and None otherwise.
+    """
+
+    __slots__ = ("code", "msg", "data", "cached")
+    FIELDS = {"code": "code", "msg": "msg", "data": "data", "cached": "cached"}
+
+    @classmethod
+    def parse(cls, payload: Dict, model: Optional[Type[Model]] = None) -> "ApiResponse":
+        """Wrap a decoded response, converting its data with model"""
+        response = cls.from_dict(payload)
+        data = response.data
+        if model is not None and payload.get("code") == "0" and data is not None:
+            if isinstance(data, list):
+                response.data = [model.from_dict(item) for item in data]
+            elif isinstance(data, dict):
+                response.data = model.from_dict(data)
+        return response
@@ -0,0 +1,84 @@
+"""
+OKX Concurrency Helpers
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Bounded fan-out of blocking or async calls over an iterable of inputs.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Tuple
+
+# (input index, input item, result or None, exception or None)
+Outcome = Tuple[int, Any, Any, Any]
+
+
+def iter_concurrent(fn: Callable, items: Iterable, max_concurrency: int = 8) -> Iterator[Outcome]:
+    """
+    Call fn on every item from a thread pool and yield outcomes as they complete
+
+    At most max_concurrency calls are in flight, so items may be a lazy
+    iterable of any length. Exceptions raised by fn are yielded, not raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    items = enumerate(items)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = {}
+
+        def submit_next() -> bool:
+            for index, item in items:
+                pending[executor.submit(fn, item)] = (index, item)
+                return True
+            return False
+
+        while len(pending) < max_concurrency and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                error = future.exception()
+                yield index, item, None if error else future.result(), error
+                submit_next()
+
+
+async def aiter_concurrent(fn: Callable, items: Iterable, max_concurrency: int = 8) -> AsyncIterator[Outcome]:
+    """
+    Await fn on every item with bounded concurrency and yield outcomes as they complete
+
+    Async counterpart of :func:`iter_concurrent`; fn must return an awaitable.
+    """
+    import asyncio
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    items = enumerate(items)
+    pending = {}
+
+    async def call(item):
+        # Inside the task, so errors raised before fn's first await are captured too
+        return await fn(item)
+
+    def submit_next() -> bool:
+        for index, item in items:
+            pending[asyncio.ensure_future(call(item))] = (index, item)
+            return True
+        return False
+
+    try:
+        while len(pending) < max_concurrency and submit_next():
+            pass
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = pending.pop(task)
+                error = task.exception()
+                yield index, item, None if error else task.result(), error
+                submit_next()
+    finally:
+        # Consumer stopped early: don't leave orphaned requests running
+        for task in pending:
+            task.cancel()
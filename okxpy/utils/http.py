@@ -0,0 +1,749 @@
+"""
+OKX HTTP Transport
+~~~~~~~~~~~~~~~~~~
+
+Pooled keep-alive HTTP transports shared by all OKX service clients.
+"""
+
+import functools
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from ..auth import OKXAuth
+from ..exceptions import OKXAPIError, check_response
+from .codec import JSONCodec, get_codec
+from .jsonstream import ArrayStream
+from .pipeline import THROTTLED_RESPONSE, Pipeline, RawResponse, Request, default_pipeline
+
+# requests and urllib3 are imported when an HTTPTransport is built; feature
+# modules are only loaded by callers that pass their objects in
+if TYPE_CHECKING:
+    import requests
+    from .cache import QuoteCache, ResponseCache
+    from .metrics import Instrumentation
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .singleflight import SingleFlight
+    from .snapshot import SnapshotStore
+
+DEFAULT_BASE_URL = "https://www.okx.com"
+
+
+class DNSCache:
+    """Thread-safe TTL cache of resolved host addresses"""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> str:
+        """Return a cached address for host, resolving it when missing or expired"""
+        key = (host, port)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except OSError:
+            # Keep serving the last known address while the resolver is down
+            if entry:
+                return entry[1]
+            raise
+
+        address = infos[0][4][0]
+        with self._lock:
+            self._entries[key] = (now + self.ttl, address)
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Drop the cached address for host"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Seconds spent opening connections in the current thread, for Instrumentation
+_connect_clock = threading.local()
+
+
+def _take_connect_time() -> float:
+    seconds = getattr(_connect_clock, "seconds", 0.0)
+    _connect_clock.seconds = 0.0
+    return seconds
+
+
+class _DNSCachingConnectionMixin:
+    """Resolve the connection host through a DNSCache instead of per connect"""
+
+    dns_cache: Optional[DNSCache] = None
+
+    def connect(self):
+        # TCP connect plus TLS handshake of a new pooled connection
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            _connect_clock.seconds = (getattr(_connect_clock, "seconds", 0.0)
+                                      + time.perf_counter() - started)
+
+    def _new_conn(self):
+        if self.dns_cache is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        self._dns_host = self.dns_cache.resolve(host, self.port)
+        try:
+            return super()._new_conn()
+        except Exception:
+            self.dns_cache.invalidate(host, self.port)
+            raise
+        finally:
+            # Restore the hostname so TLS SNI and certificate checks use it
+            self._dns_host = host
+
+
+def _pool_classes(dns_cache: Optional[DNSCache]) -> Dict[str, type]:
+    """Build urllib3 pool classes whose connections resolve through dns_cache"""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    http_conn = type("DNSCachingHTTPConnection",
+                     (_DNSCachingConnectionMixin, HTTPConnection),
+                     {"dns_cache": dns_cache})
+    https_conn = type("DNSCachingHTTPSConnection",
+                      (_DNSCachingConnectionMixin, HTTPSConnection),
+                      {"dns_cache": dns_cache})
+    return {
+        "http": type("DNSCachingHTTPConnectionPool", (HTTPConnectionPool,),
+                     {"ConnectionCls": http_conn}),
+        "https": type("DNSCachingHTTPSConnectionPool", (HTTPSConnectionPool,),
+                      {"ConnectionCls": https_conn}),
+    }
+
+
+def _is_connect_error(error: "requests.exceptions.RequestException") -> bool:
+    """True if the request failed before any of it reached the server"""
+    import requests
+    from urllib3.exceptions import NewConnectionError
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+
+
+def _stream_request(method: str, path: str, params: Optional[Dict], body: Optional[Dict],
+                    auth: Optional[OKXAuth]) -> Request:
+    """
+    Sign a streamed request
+
+    Streams bypass the pipeline: a body handed to the caller record by record
+    cannot be cached, shared or replayed by a retry.
+    """
+    request = Request(method, path, params, body, auth)
+    if auth:
+        request.headers = auth.headers_for(method, request.request_path, request.payload)
+    else:
+        request.headers = {"Content-Type": "application/json"}
+    request.headers["Accept-Encoding"] = "gzip"
+    return request
+
+
+def _stream_failed(status: Optional[int], msg: str) -> OKXAPIError:
+    return OKXAPIError.from_response({"code": str(status or 500), "msg": msg})
+
+
+def _close_stream(parser: ArrayStream) -> None:
+    try:
+        envelope = parser.close()
+    except ValueError as e:
+        raise _stream_failed(500, str(e)) from None
+    check_response(envelope)
+
+
+def _iter_records(chunks: Iterable[bytes], items_key: str) -> Iterator[Any]:
+    """Yield the items_key records of a JSON body read in chunks"""
+    parser = ArrayStream(items_key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    _close_stream(parser)
+
+
+async def _aiter_records(chunks: AsyncIterator[bytes], items_key: str) -> AsyncIterator[Any]:
+    """Async variant of _iter_records()"""
+    parser = ArrayStream(items_key)
+    async for chunk in chunks:
+        for record in parser.feed(chunk):
+            yield record
+    _close_stream(parser)
+
+
+async def _httpx_chunks(transport, request: Request, chunk_size: int) -> AsyncIterator[bytes]:
+    """Decompressed body chunks of a request sent with transport's httpx client"""
+    try:
+        async with transport.client.stream(request.method, f"{transport.base_url}{request.request_path}",
+                                           headers=request.headers,
+                                           content=request.payload or None) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise _stream_failed(response.status_code, response.text)
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+    except transport._errors as e:
+        raise _stream_failed(500, str(e)) from e
+
+
+@functools.lru_cache(maxsize=None)
+def _pooled_adapter_class() -> type:
+    """Define the requests adapter on first use, so importing this module does not load requests"""
+    from requests.adapters import HTTPAdapter
+
+    class PooledHTTPAdapter(HTTPAdapter):
+        """requests adapter with per-host connection pools and cached DNS"""
+
+        def __init__(self, dns_cache: Optional[DNSCache] = None, **kwargs):
+            self.dns_cache = dns_cache
+            super().__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = _pool_classes(self.dns_cache)
+
+    return PooledHTTPAdapter
+
+
+class HTTPTransport:
+    """
+    Pooled HTTP transport shared by the service clients
+
+    One transport owns a single ``requests.Session`` so every wallet, dex and
+    defi call reuses kept-alive TCP+TLS connections to the API host.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 timeout: Optional[float] = 30.0,
+                 dns_cache_ttl: Optional[float] = 300.0,
+                 prewarm: int = 0,
+                 session: Optional["requests.Session"] = None,
+                 cache: Optional["ResponseCache"] = None,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 retry: Optional["RetryPolicy"] = None,
+                 codec: Union[str, JSONCodec] = "auto",
+                 single_flight: Optional["SingleFlight"] = None,
+                 quote_cache: Optional["QuoteCache"] = None,
+                 instrumentation: Optional["Instrumentation"] = None,
+                 snapshot: Optional["SnapshotStore"] = None,
+                 pipeline: Optional[Pipeline] = None):
+        """
+        Args:
+            base_url: API host every request path is appended to
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum kept-alive connections per host
+            timeout: Request timeout in seconds (None waits forever)
+            dns_cache_ttl: Seconds to cache resolved addresses (None disables it)
+            prewarm: Number of connections to open at construction
+            session: Optional pre-configured requests session
+            cache: Optional response cache for reference-data endpoints
+            rate_limiter: Optional client-side rate limiter
+            retry: Optional retry policy for failed requests
+            codec: JSON decoder name ("auto", "msgspec", "orjson", "json") or instance
+            single_flight: Optional coalescing of identical in-flight requests
+            quote_cache: Optional short-lived cache for DEX quotes
+            instrumentation: Optional hooks and metrics for every HTTP attempt
+            snapshot: Optional on-disk store serving reference data across restarts
+            pipeline: Optional custom pipeline (default: built from the options above)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.codec = get_codec(codec)
+        self.single_flight = single_flight
+        self.quote_cache = quote_cache
+        self.instrumentation = instrumentation
+        self.snapshot = snapshot
+        self.pipeline = pipeline or default_pipeline(self.codec, cache, quote_cache, single_flight,
+                                                     retry, rate_limiter, instrumentation,
+                                                     snapshot=snapshot)
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.dns_cache = DNSCache(dns_cache_ttl) if dns_cache_ttl else None
+
+        import requests
+        self._errors = requests.exceptions.RequestException
+        self.session = session or requests.Session()
+        adapter = _pooled_adapter_class()(dns_cache=self.dns_cache,
+                                          pool_connections=pool_connections,
+                                          pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if prewarm:
+            self.prewarm(prewarm)
+
+    def prewarm(self, connections: int = 1) -> None:
+        """Open up to pool_maxsize connections to the API host ahead of traffic"""
+        connections = min(connections, self.pool_maxsize)
+
+        def touch(_):
+            try:
+                self.session.head(self.base_url, timeout=self.timeout,
+                                  allow_redirects=False)
+            except self._errors:
+                pass
+
+        # Concurrent requests so each one checks out its own connection
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(touch, range(connections)))
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                body: Optional[Dict] = None, auth: Optional[OKXAuth] = None) -> Dict:
+        """
+        Send a request through the pipeline and return the decoded JSON response
+
+        Args:
+            method: HTTP method
+            path: Request path, e.g. "/api/v5/wallet/pre-transaction/nonce"
+            params: Optional query parameters
+            body: Optional JSON body
+            auth: Optional auth used to sign the request
+        """
+        return self.pipeline.run(Request(method, path, params, body, auth), self.send)
+
+    def send(self, request: Request) -> RawResponse:
+        """Send a signed request over the pooled session"""
+        info = request.info
+        if info is not None:
+            _take_connect_time()
+        try:
+            response = self.session.request(request.method, f"{self.base_url}{request.request_path}",
+                                            headers=request.headers,
+                                            data=request.payload or None,
+                                            timeout=self.timeout)
+        except self._errors as e:
+            raw = RawResponse(error=e, sent=not _is_connect_error(e))
+        else:
+            raw = RawResponse(response.status_code, response.headers, response.content)
+            if info is not None:
+                info.network(_take_connect_time(), response.elapsed.total_seconds())
+        request.raw = raw
+        return raw
+
+    def stream(self, method: str, path: str, params: Optional[Dict] = None,
+               body: Optional[Dict] = None, auth: Optional[OKXAuth] = None,
+               items_key: str = "data", chunk_size: int = 65536) -> Iterator[Any]:
+        """
+        Send a request and yield the records of its items_key array as they arrive
+
+        The body is requested gzip-compressed and parsed incrementally, so
+        memory use is bounded by the size of one record. Streams skip the
+        pipeline (no caching or retries) apart from the rate limiter.
+
+        Args:
+            method: HTTP method
+            path: Request path, e.g. "/api/v5/dex/aggregator/all-tokens"
+            params: Optional query parameters
+            body: Optional JSON body
+            auth: Optional auth used to sign the request
+            items_key: Top-level field holding the array to stream
+            chunk_size: Bytes read from the connection at a time
+
+        Raises:
+            OKXAPIError: The request failed or the API returned an error code
+        """
+        request = _stream_request(method, path, params, body, auth)
+        if self.rate_limiter and not self.rate_limiter.acquire(request.api_key, path):
+            raise OKXAPIError.from_response(THROTTLED_RESPONSE)
+        yield from _iter_records(self._chunks(request, chunk_size), items_key)
+
+    def _chunks(self, request: Request, chunk_size: int) -> Iterator[bytes]:
+        try:
+            with self.session.request(request.method, f"{self.base_url}{request.request_path}",
+                                      headers=request.headers,
+                                      data=request.payload or None,
+                                      timeout=self.timeout,
+                                      stream=True) as response:
+                if response.status_code != 200:
+                    raise _stream_failed(response.status_code, response.text)
+                yield from response.iter_content(chunk_size)
+        except self._errors as e:
+            raise _stream_failed(500, str(e)) from e
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _import_httpx(http2: bool = False):
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "The async and HTTP/2 transports require httpx, install it with "
+            "`pip install okxpy[async]`"
+        ) from None
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 requires h2, install it with `pip install okxpy[http2]`"
+            ) from None
+    return httpx
+
+
+def _uses_prior_knowledge(base_url: str) -> bool:
+    """Plain-http hosts cannot negotiate HTTP/2 through TLS ALPN, so it is assumed"""
+    return base_url.startswith("http://")
+
+
+class AsyncHTTPTransport:
+    """
+    Non-blocking pooled HTTP transport for asyncio clients
+
+    Mirrors :class:`HTTPTransport` on top of ``httpx.AsyncClient`` so many
+    requests can be in flight from a single event loop.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 max_connections: int = 100,
+                 pool_maxsize: int = 20,
+                 timeout: Optional[float] = 30.0,
+                 client=None,
+                 cache: Optional["ResponseCache"] = None,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 retry: Optional["RetryPolicy"] = None,
+                 codec: Union[str, JSONCodec] = "auto",
+                 single_flight: Optional["SingleFlight"] = None,
+                 quote_cache: Optional["QuoteCache"] = None,
+                 instrumentation: Optional["Instrumentation"] = None,
+                 snapshot: Optional["SnapshotStore"] = None,
+                 pipeline: Optional[Pipeline] = None,
+                 http2: bool = False,
+                 max_streams: Optional[int] = None):
+        """
+        Args:
+            base_url: API host every request path is appended to
+            max_connections: Maximum concurrent connections
+            pool_maxsize: Maximum idle kept-alive connections
+            timeout: Request timeout in seconds (None waits forever)
+            client: Optional pre-configured httpx.AsyncClient
+            cache: Optional response cache for reference-data endpoints
+            rate_limiter: Optional client-side rate limiter
+            retry: Optional retry policy for failed requests
+            codec: JSON decoder name ("auto", "msgspec", "orjson", "json") or instance
+            single_flight: Optional coalescing of identical in-flight requests
+            quote_cache: Optional short-lived cache for DEX quotes
+            instrumentation: Optional hooks and metrics for every HTTP attempt
+            snapshot: Optional on-disk store serving reference data across restarts
+            pipeline: Optional custom pipeline (default: built from the options above)
+            http2: Multiplex requests as HTTP/2 streams (requires h2)
+            max_streams: Maximum requests in flight at once; further callers wait
+                before signing (None: no cap beyond the connection pool)
+        """
+        httpx = _import_httpx(http2)
+        self._errors = httpx.HTTPError
+        self._connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.codec = get_codec(codec)
+        self.single_flight = single_flight
+        self.quote_cache = quote_cache
+        self.instrumentation = instrumentation
+        self.snapshot = snapshot
+        self.max_streams = max_streams
+        self.pipeline = pipeline or default_pipeline(self.codec, cache, quote_cache, single_flight,
+                                                     retry, rate_limiter, instrumentation, max_streams,
+                                                     snapshot)
+        self.client = client or httpx.AsyncClient(
+            http1=not (http2 and _uses_prior_knowledge(self.base_url)),
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=pool_maxsize),
+            timeout=timeout,
+        )
+
+    async def prewarm(self, connections: int = 1) -> None:
+        """Open up to max_connections connections to the API host ahead of traffic"""
+        connections = min(connections, self.max_connections)
+
+        async def touch():
+            try:
+                await self.client.head(self.base_url)
+            except self._errors:
+                pass
+
+        import asyncio
+        await asyncio.gather(*(touch() for _ in range(connections)))
+
+    async def request(self, method: str, path: str, params: Optional[Dict] = None,
+                      body: Optional[Dict] = None, auth: Optional[OKXAuth] = None) -> Dict:
+        """
+        Send a request through the pipeline and return the decoded JSON response
+
+        Args:
+            method: HTTP method
+            path: Request path, e.g. "/api/v5/wallet/pre-transaction/nonce"
+            params: Optional query parameters
+            body: Optional JSON body
+            auth: Optional auth used to sign the request
+        """
+        return await self.pipeline.arun(Request(method, path, params, body, auth), self.send)
+
+    async def send(self, request: Request) -> RawResponse:
+        """Send a signed request over the pooled client"""
+        info = request.info
+        extensions = None
+        if info is not None:
+            async def trace(event, _):
+                info.trace(event)
+            extensions = {"trace": trace}
+        try:
+            response = await self.client.request(request.method, f"{self.base_url}{request.request_path}",
+                                                 headers=request.headers,
+                                                 content=request.payload or None,
+                                                 extensions=extensions)
+        except self._errors as e:
+            raw = RawResponse(error=e, sent=not isinstance(e, self._connect_errors))
+        else:
+            raw = RawResponse(response.status_code, response.headers, response.content)
+            if info is not None:
+                info.traced_network()
+        request.raw = raw
+        return raw
+
+    async def stream(self, method: str, path: str, params: Optional[Dict] = None,
+                     body: Optional[Dict] = None, auth: Optional[OKXAuth] = None,
+                     items_key: str = "data", chunk_size: int = 65536) -> AsyncIterator[Any]:
+        """
+        Send a request and yield the records of its items_key array as they arrive
+
+        See :meth:`HTTPTransport.stream`.
+        """
+        request = _stream_request(method, path, params, body, auth)
+        if self.rate_limiter and not await self.rate_limiter.acquire_async(request.api_key, path):
+            raise OKXAPIError.from_response(THROTTLED_RESPONSE)
+        async for record in _aiter_records(_httpx_chunks(self, request, chunk_size), items_key):
+            yield record
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class HTTP2Transport:
+    """
+    Multiplexed HTTP/2 transport for the sync clients
+
+    Requests from any number of threads travel as concurrent streams over
+    one connection per host instead of each holding its own socket and TLS
+    session. The connection is driven by an ``httpx.AsyncClient`` on a
+    background event loop thread, since httpx's sync HTTP/2 connection can
+    send stream ids out of order when shared between threads. Plain
+    ``http://`` hosts, such as a local emulator, are spoken to with HTTP/2
+    prior knowledge.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL,
+                 max_streams: int = 100,
+                 timeout: Optional[float] = 30.0,
+                 prewarm: bool = False,
+                 client=None,
+                 cache: Optional["ResponseCache"] = None,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 retry: Optional["RetryPolicy"] = None,
+                 codec: Union[str, JSONCodec] = "auto",
+                 single_flight: Optional["SingleFlight"] = None,
+                 quote_cache: Optional["QuoteCache"] = None,
+                 instrumentation: Optional["Instrumentation"] = None,
+                 snapshot: Optional["SnapshotStore"] = None,
+                 pipeline: Optional[Pipeline] = None):
+        """
+        Args:
+            base_url: API host every request path is appended to
+            max_streams: Maximum requests in flight at once; further callers
+                wait before signing (httpx also honours the server's limit)
+            timeout: Request timeout in seconds (None waits forever)
+            prewarm: Open the connection at construction
+            client: Optional pre-configured httpx.AsyncClient with http2 enabled
+            cache: Optional response cache for reference-data endpoints
+            rate_limiter: Optional client-side rate limiter
+            retry: Optional retry policy for failed requests
+            codec: JSON decoder name ("auto", "msgspec", "orjson", "json") or instance
+            single_flight: Optional coalescing of identical in-flight requests
+            quote_cache: Optional short-lived cache for DEX quotes
+            instrumentation: Optional hooks and metrics for every HTTP attempt
+            snapshot: Optional on-disk store serving reference data across restarts
+            pipeline: Optional custom pipeline (default: built from the options above)
+        """
+        httpx = _import_httpx(http2=True)
+        self._errors = httpx.HTTPError
+        self._connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_streams = max_streams
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.codec = get_codec(codec)
+        self.single_flight = single_flight
+        self.quote_cache = quote_cache
+        self.instrumentation = instrumentation
+        self.snapshot = snapshot
+        self.pipeline = pipeline or default_pipeline(self.codec, cache, quote_cache, single_flight,
+                                                     retry, rate_limiter, instrumentation, max_streams,
+                                                     snapshot)
+        self.client = client or httpx.AsyncClient(
+            http1=not _uses_prior_knowledge(self.base_url),
+            http2=True,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+            timeout=timeout,
+        )
+        import asyncio
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="okxpy-http2", daemon=True)
+        self._thread.start()
+
+        if prewarm:
+            self.prewarm()
+
+    def _run(self, coroutine):
+        import asyncio
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def prewarm(self) -> None:
+        """Open the connection to the API host ahead of traffic"""
+        async def touch():
+            try:
+                await self.client.head(self.base_url)
+            except self._errors:
+                pass
+
+        self._run(touch())
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                body: Optional[Dict] = None, auth: Optional[OKXAuth] = None) -> Dict:
+        """
+        Send a request through the pipeline and return the decoded JSON response
+
+        Args:
+            method: HTTP method
+            path: Request path, e.g. "/api/v5/wallet/pre-transaction/nonce"
+            params: Optional query parameters
+            body: Optional JSON body
+            auth: Optional auth used to sign the request
+        """
+        return self.pipeline.run(Request(method, path, params, body, auth), self.send)
+
+    def send(self, request: Request) -> RawResponse:
+        """Send a signed request as a stream on the shared connection"""
+        return self._run(self._send(request))
+
+    async def _send(self, request: Request) -> RawResponse:
+        info = request.info
+        extensions = None
+        if info is not None:
+            async def trace(event, _):
+                info.trace(event)
+            extensions = {"trace": trace}
+        try:
+            response = await self.client.request(request.method, f"{self.base_url}{request.request_path}",
+                                                 headers=request.headers,
+                                                 content=request.payload or None,
+                                                 extensions=extensions)
+        except self._errors as e:
+            raw = RawResponse(error=e, sent=not isinstance(e, self._connect_errors))
+        else:
+            raw = RawResponse(response.status_code, response.headers, response.content)
+            if info is not None:
+                info.traced_network()
+        request.raw = raw
+        return raw
+
+    def stream(self, method: str, path: str, params: Optional[Dict] = None,
+               body: Optional[Dict] = None, auth: Optional[OKXAuth] = None,
+               items_key: str = "data", chunk_size: int = 65536) -> Iterator[Any]:
+        """
+        Send a request and yield the records of its items_key array as they arrive
+
+        See :meth:`HTTPTransport.stream`.
+        """
+        request = _stream_request(method, path, params, body, auth)
+        if self.rate_limiter and not self.rate_limiter.acquire(request.api_key, path):
+            raise OKXAPIError.from_response(THROTTLED_RESPONSE)
+        yield from _iter_records(self._chunks(request, chunk_size), items_key)
+
+    def _chunks(self, request: Request, chunk_size: int) -> Iterator[bytes]:
+        # Each chunk is read on the event loop thread and handed over here
+        chunks = _httpx_chunks(self, request, chunk_size)
+        try:
+            while True:
+                try:
+                    yield self._run(chunks.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(chunks.aclose())
+
+    def close(self) -> None:
+        """Close the connections and stop the event loop thread"""
+        if self._loop.is_closed():
+            return
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """Return the process-wide transport used by clients created without one"""
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def make_request(method: str, path: str, params: Optional[Dict] = None,
+                 body: Optional[Dict] = None, auth: Optional[OKXAuth] = None,
+                 transport: Optional[HTTPTransport] = None) -> Dict:
+    """Send a request through transport, or the default shared transport"""
+    transport = transport or get_default_transport()
+    return transport.request(method, path, params=params, body=body, auth=auth)
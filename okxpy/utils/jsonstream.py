@@ -0,0 +1,156 @@
+"""
+OKX Streaming JSON
+~~~~~~~~~~~~~~~~~~
+
+Incremental parser that pulls the records of one array out of a JSON
+response as its bytes arrive, so very large lists are never held in
+memory at once.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List
+
+_STRUCTURAL = re.compile(r'[",\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = frozenset(".eE+-0123456789")
+_decoder = json.JSONDecoder()
+
+
+class ArrayStream:
+    """
+    Push parser yielding the items of a top-level array field
+
+    Feed it the response body in chunks of any size; each call returns the
+    records completed by that chunk. Only the record being parsed is
+    buffered. Everything outside the array (``code``, ``msg``...) is kept
+    and returned by :meth:`close`, with the array left empty.
+
+    Example::
+
+        parser = ArrayStream("data")
+        for chunk in chunks:
+            for token in parser.feed(chunk):
+                ...
+        envelope = parser.close()  # {"code": "0", "msg": "", "data": []}
+    """
+
+    def __init__(self, key: str = "data"):
+        """
+        Args:
+            key: Field of the top-level object holding the array
+        """
+        self.key = key
+        self._key_pattern = re.compile('"' + re.escape(key) + r'"\s*:\s*$')
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._mark = 0
+        self._depth = 0
+        self._in_string = False
+        self._in_array = False
+        self._found = False
+        self._found_item = False
+        self._expect_value = True
+        self._envelope = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume the next chunk of the body and return the records it completed"""
+        buf = self._buf + self._utf8.decode(chunk)
+        items: List[Any] = []
+        pos, end = self._pos, len(buf)
+
+        while pos < end:
+            if self._in_array:
+                pos = _WHITESPACE.match(buf, pos).end()
+                if pos == end:
+                    break
+                char = buf[pos]
+                if self._expect_value and not (char == "]" and not self._found_item):
+                    try:
+                        record, stop = _decoder.raw_decode(buf, pos)
+                    except ValueError:
+                        # The record continues in the next chunk
+                        break
+                    if type(record) in (int, float) and (stop == end or buf[stop] in _NUMBER_TAIL):
+                        # The rest of the number is in the next chunk
+                        break
+                    items.append(record)
+                    self._found_item = True
+                    self._expect_value = False
+                    pos = stop
+                elif char == ",":
+                    self._expect_value = True
+                    pos += 1
+                elif char == "]":
+                    self._in_array = False
+                    self._depth -= 1
+                    self._mark = pos
+                    pos += 1
+                else:
+                    raise ValueError(f"Invalid JSON: unexpected {char!r} in array")
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                if buf[pos] == "\\":
+                    if pos + 1 >= end:
+                        # Escaped character is in the next chunk
+                        break
+                    pos += 2
+                    continue
+                self._in_string = False
+                pos += 1
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            pos = match.start()
+            char = buf[pos]
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if char == "[" and self._depth == 1 and not self._found and self._at_key(buf, pos):
+                    self._found = self._in_array = True
+                    self._envelope += buf[self._mark:pos + 1]
+                    self._mark = pos + 1
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+            pos += 1
+
+        # Drop everything that is no longer needed
+        if not self._in_array:
+            self._envelope += buf[self._mark:pos]
+        self._buf = buf[pos:]
+        self._pos = self._mark = 0
+        return items
+
+    def _at_key(self, buf: str, pos: int) -> bool:
+        """True if the array opening at pos is the value of the wanted key"""
+        tail = self._envelope[-64:] + buf[self._mark:pos]
+        return self._key_pattern.search(tail) is not None
+
+    def close(self) -> Dict:
+        """
+        Finish parsing and return the rest of the response with an empty array
+
+        Raises:
+            ValueError: The body is truncated or not valid JSON
+        """
+        self.feed(b"")
+        self._utf8.decode(b"", final=True)
+        if self._in_array and self._buf.strip():
+            # Raises the syntax error of a malformed record
+            _decoder.raw_decode(self._buf.strip())
+        if self._depth or self._in_string or self._buf.strip():
+            raise ValueError("Truncated JSON response")
+        return json.loads(self._envelope)
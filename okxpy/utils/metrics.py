@@ -0,0 +1,295 @@
+"""
+OKX Request Instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Request hooks, per-endpoint latency histograms split by phase, counters by
+response code, byte counts, a Prometheus text exporter and optional
+OpenTelemetry spans. Transports without an Instrumentation skip all of it.
+"""
+
+import bisect
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Phases of one HTTP attempt: signing, connection setup (0 on a kept-alive
+# connection), time to the response headers, JSON decode, and end to end
+PHASES = ("sign", "connect", "ttfb", "decode", "total")
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# httpx/httpcore trace events, used by the async transport
+_CONNECT_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+_SEND_EVENTS = ("http11.send_request_headers.started", "http2.send_request_headers.started")
+_HEADERS_EVENTS = ("http11.receive_response_headers.complete", "http2.receive_response_headers.complete")
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        total, pairs = 0, []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound below which a q fraction of observations fall"""
+        if not self.count:
+            return None
+        rank, total = q * self.count, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return None
+
+
+class RequestInfo:
+    """State of one HTTP attempt, passed to the hooks"""
+
+    __slots__ = ("method", "path", "request_path", "bytes_out", "bytes_in", "status",
+                 "code", "error", "timings", "span", "_started", "_mark", "_events")
+
+    def __init__(self, method: str, path: str, request_path: str, bytes_out: int):
+        self.method = method
+        self.path = path
+        self.request_path = request_path
+        self.bytes_out = bytes_out
+        self.bytes_in = 0
+        self.status: Optional[int] = None
+        self.code: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.timings: Dict[str, float] = {}
+        self.span: Any = None
+        self._started = self._mark = time.perf_counter()
+        self._events: Dict[str, float] = {}
+
+    def lap(self, phase: str) -> None:
+        """Record the time since the previous lap as phase"""
+        now = time.perf_counter()
+        self.timings[phase] = now - self._mark
+        self._mark = now
+
+    def network(self, connect: float, until_headers: float) -> None:
+        """Record connect and time to headers from a transport's own timings"""
+        self.timings["connect"] = connect
+        self.timings["ttfb"] = max(0.0, until_headers - connect)
+        self._mark = time.perf_counter()
+
+    def trace(self, event: str) -> None:
+        """Collect an httpx trace event"""
+        self._events[event] = time.perf_counter()
+
+    def traced_network(self) -> None:
+        """Record connect and time to headers from collected trace events"""
+        events = self._events
+        connect = sum(events.get(f"{name}.complete", 0.0) - events.get(f"{name}.started", 0.0)
+                      for name in _CONNECT_EVENTS if f"{name}.complete" in events)
+        sent = next((events[name] for name in _SEND_EVENTS if name in events), None)
+        headers = next((events[name] for name in _HEADERS_EVENTS if name in events), None)
+        self.timings["connect"] = connect
+        if sent is not None and headers is not None:
+            self.timings["ttfb"] = headers - sent
+        self._mark = time.perf_counter()
+
+
+Hook = Callable[..., None]
+
+
+class Instrumentation:
+    """
+    Metrics and hooks for the transports
+
+    Every HTTP attempt (retries included) calls the before hooks with a
+    :class:`RequestInfo`, and the after hooks with the info and the decoded
+    response (None on a transport error). It is recorded per endpoint path
+    as phase latencies, a request counter by response code (the API
+    ``code`` or the HTTP status), an error counter for non-zero codes, and
+    request/response body bytes.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS,
+                 tracer: Any = None,
+                 opentelemetry: bool = False):
+        """
+        Args:
+            buckets: Histogram bucket bounds in seconds
+            tracer: Optional OpenTelemetry tracer to create a span per attempt
+            opentelemetry: Create spans with the global "okxpy" tracer
+        """
+        if opentelemetry and tracer is None:
+            tracer = _import_opentelemetry().get_tracer("okxpy")
+        self.buckets = tuple(buckets)
+        self.tracer = tracer
+        self.before_hooks: List[Hook] = []
+        self.after_hooks: List[Hook] = []
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.bytes_out: Counter = Counter()
+        self.bytes_in: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def before_request(self, hook: Hook) -> Hook:
+        """Register hook(info) to run before each attempt; usable as a decorator"""
+        self.before_hooks.append(hook)
+        return hook
+
+    def after_request(self, hook: Hook) -> Hook:
+        """Register hook(info, response) to run after each attempt; usable as a decorator"""
+        self.after_hooks.append(hook)
+        return hook
+
+    def begin(self, method: str, path: str, request_path: str, payload: bytes) -> RequestInfo:
+        """Start timing an attempt"""
+        info = RequestInfo(method, path, request_path, len(payload))
+        if self.tracer is not None:
+            info.span = _start_span(self.tracer, info)
+        for hook in self.before_hooks:
+            hook(info)
+        # Hook time is not part of the sign phase
+        info._mark = time.perf_counter()
+        return info
+
+    def end(self, info: RequestInfo, status: Optional[int] = None,
+            response: Optional[Dict] = None, bytes_in: int = 0,
+            error: Optional[BaseException] = None) -> None:
+        """Finish an attempt and record it"""
+        info.timings["total"] = time.perf_counter() - info._started
+        info.status = status
+        info.bytes_in = bytes_in
+        info.error = error
+        if error is not None:
+            info.code = "error"
+        elif status == 200 and isinstance(response, dict):
+            info.code = str(response.get("code"))
+        else:
+            info.code = str(status)
+
+        with self._lock:
+            for phase, seconds in info.timings.items():
+                histogram = self.histograms.get((info.path, phase))
+                if histogram is None:
+                    histogram = self.histograms[(info.path, phase)] = Histogram(self.buckets)
+                histogram.observe(seconds)
+            self.requests[(info.path, info.method, info.code)] += 1
+            if info.code != "0":
+                self.errors[(info.path, info.code)] += 1
+            self.bytes_out[info.path] += info.bytes_out
+            self.bytes_in[info.path] += bytes_in
+
+        if info.span is not None:
+            _end_span(info)
+        for hook in self.after_hooks:
+            hook(info, response)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-endpoint request count and p50/p99 latency by phase"""
+        with self._lock:
+            summary: Dict[str, Dict] = defaultdict(dict)
+            for (path, phase), histogram in self.histograms.items():
+                summary[path][phase] = {"count": histogram.count,
+                                        "p50": histogram.quantile(0.5),
+                                        "p99": histogram.quantile(0.99)}
+            return dict(summary)
+
+    def prometheus_text(self, prefix: str = "okxpy") -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Request latency by endpoint and phase",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (path, phase), histogram in sorted(self.histograms.items()):
+                labels = f'endpoint="{_escape(path)}",phase="{phase}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines += [f"# HELP {prefix}_requests_total Requests by endpoint, method and response code",
+                      f"# TYPE {prefix}_requests_total counter"]
+            for (path, method, code), count in sorted(self.requests.items()):
+                lines.append(f'{prefix}_requests_total{{endpoint="{_escape(path)}",method="{method}",'
+                             f'code="{_escape(code)}"}} {count}')
+
+            lines += [f"# HELP {prefix}_request_errors_total Non-zero response codes and transport errors",
+                      f"# TYPE {prefix}_request_errors_total counter"]
+            for (path, code), count in sorted(self.errors.items()):
+                lines.append(f'{prefix}_request_errors_total{{endpoint="{_escape(path)}",'
+                             f'code="{_escape(code)}"}} {count}')
+
+            lines += [f"# HELP {prefix}_bytes_total Request and response body bytes",
+                      f"# TYPE {prefix}_bytes_total counter"]
+            for direction, counter in (("out", self.bytes_out), ("in", self.bytes_in)):
+                for path, count in sorted(counter.items()):
+                    lines.append(f'{prefix}_bytes_total{{endpoint="{_escape(path)}",'
+                                 f'direction="{direction}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics"""
+        with self._lock:
+            self.histograms.clear()
+            self.requests.clear()
+            self.errors.clear()
+            self.bytes_out.clear()
+            self.bytes_in.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _import_opentelemetry():
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "OpenTelemetry spans require opentelemetry-api, install it with "
+            "`pip install okxpy[otel]`"
+        ) from None
+    return trace
+
+
+def _start_span(tracer: Any, info: RequestInfo) -> Any:
+    from opentelemetry.trace import SpanKind
+    return tracer.start_span(f"{info.method} {info.path}", kind=SpanKind.CLIENT, attributes={
+        "http.method": info.method,
+        "http.target": info.request_path,
+        "okx.endpoint": info.path,
+    })
+
+
+def _end_span(info: RequestInfo) -> None:
+    from opentelemetry.trace import Status, StatusCode
+    span = info.span
+    if info.status is not None:
+        span.set_attribute("http.status_code", info.status)
+    span.set_attribute("okx.code", info.code)
+    for phase, seconds in info.timings.items():
+        span.set_attribute(f"okx.{phase}_ms", seconds * 1000)
+    if info.error is not None:
+        span.record_exception(info.error)
+        span.set_status(Status(StatusCode.ERROR))
+    elif info.code != "0":
+        span.set_status(Status(StatusCode.ERROR, f"code {info.code}"))
+    span.end()
@@ -0,0 +1,136 @@
+"""
+OKX Pagination
+~~~~~~~~~~~~~~
+
+Lazy item iterators over cursor or offset paginated endpoints. The next page
+is fetched in the background while the current one is consumed, with a cap
+on how many pages may sit in memory.
+"""
+
+import queue
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# (items of the page, token of the next page or None on the last page)
+Page = Tuple[List[Any], Optional[str]]
+
+_DONE = object()
+
+
+def cursor_page(response: Dict, items_key: Optional[str] = None) -> Page:
+    """
+    Split a cursor paginated response into items and the next cursor
+
+    Args:
+        response: Successful response whose data holds a cursor and item list
+        items_key: Field holding the items (default: first list field)
+    """
+    data = response.get("data") or {}
+    page = data[0] if isinstance(data, list) else data
+    if items_key is not None:
+        items = page.get(items_key) or []
+    else:
+        items = next((value for value in page.values() if isinstance(value, list)), [])
+    return items, (page.get("cursor") or None) if items else None
+
+
+def offset_page(response: Dict, items_key: str, offset: Optional[str]) -> Page:
+    """Split an offset/total paginated response into items and the next offset"""
+    data = response.get("data") or {}
+    items = data.get(items_key) or []
+    next_offset = int(offset or 0) + len(items)
+    total = data.get("total")
+    if not items or (total is not None and next_offset >= int(total)):
+        return items, None
+    return items, str(next_offset)
+
+
+def _put(pages: queue.Queue, entry: Any, stop: threading.Event) -> bool:
+    """Block until entry is queued or the consumer went away"""
+    while not stop.is_set():
+        try:
+            pages.put(entry, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def iter_prefetched(fetch_page: Callable[[Optional[str]], Page],
+                    start: Optional[str] = None,
+                    max_buffered_pages: int = 2) -> Iterator[Any]:
+    """
+    Yield items of consecutive pages, fetching ahead in a background thread
+
+    Args:
+        fetch_page: Returns (items, next token) for a page token
+        start: Token of the first page
+        max_buffered_pages: Fetched pages allowed to wait for the consumer
+    """
+    pages: queue.Queue = queue.Queue(maxsize=max(1, max_buffered_pages))
+    stop = threading.Event()
+
+    def worker():
+        token = start
+        try:
+            while not stop.is_set():
+                items, next_token = fetch_page(token)
+                if not _put(pages, (items, None), stop):
+                    return
+                # An unchanged token would loop forever
+                if next_token is None or next_token == token:
+                    break
+                token = next_token
+        except Exception as e:
+            _put(pages, ([], e), stop)
+            return
+        _put(pages, _DONE, stop)
+
+    threading.Thread(target=worker, daemon=True).start()
+    try:
+        while True:
+            entry = pages.get()
+            if entry is _DONE:
+                return
+            items, error = entry
+            if error is not None:
+                raise error
+            yield from items
+    finally:
+        stop.set()
+
+
+async def aiter_prefetched(fetch_page: Callable[[Optional[str]], Awaitable[Page]],
+                           start: Optional[str] = None,
+                           max_buffered_pages: int = 2) -> AsyncIterator[Any]:
+    """Async variant of :func:`iter_prefetched`, fetching ahead in a task"""
+    import asyncio
+    pages: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_buffered_pages))
+
+    async def worker():
+        token = start
+        try:
+            while True:
+                items, next_token = await fetch_page(token)
+                await pages.put((items, None))
+                if next_token is None or next_token == token:
+                    break
+                token = next_token
+        except Exception as e:
+            await pages.put(([], e))
+            return
+        await pages.put(_DONE)
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            entry = await pages.get()
+            if entry is _DONE:
+                return
+            items, error = entry
+            if error is not None:
+                raise error
+            for item in items:
+                yield item
+    finally:
+        task.cancel()
@@ -0,0 +1,587 @@
+"""
+OKX Request Pipeline
+~~~~~~~~~~~~~~~~~~~~
+
+Ordered middleware stages every request passes through on its way to the
+transport. Each stage wraps the rest of the pipeline: it may change the
+request, return early (a cache hit never reaches the network), call the
+rest more than once (retries) or post-process the response.
+
+The default order, outermost first, is::
+
+    snapshot -> cache -> quote_cache -> single_flight -> retry -> rate_limit
+             -> concurrency -> metrics -> auth -> decode -> transport
+
+Stages for features that are not configured are left out.
+"""
+
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..auth import OKXAuth, encode_request
+from .codec import JSONCodec
+
+# Feature modules are imported by the stages using them, which only exist when
+# the feature is configured
+if TYPE_CHECKING:
+    from .cache import QuoteCache, ResponseCache
+    from .metrics import Instrumentation, RequestInfo
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .singleflight import SingleFlight
+    from .snapshot import SnapshotKey, SnapshotStore
+
+# asyncio is imported inside the async code paths so sync clients start without it
+
+# Returned instead of sending when the client-side rate limit wait runs out
+THROTTLED_RESPONSE = {"code": "429", "msg": "Client-side rate limit exceeded"}
+
+
+def _spawn(tasks: set, coro: Awaitable) -> None:
+    """Run coro as a background task, kept referenced in tasks until it is done"""
+    import asyncio
+    task = asyncio.ensure_future(coro)
+    tasks.add(task)
+    task.add_done_callback(lambda done: _forget(tasks, done))
+
+
+def _forget(tasks: set, task) -> None:
+    tasks.discard(task)
+    if not task.cancelled():
+        # Retrieved so a failed refresh is not logged as unhandled; the stale entry stays
+        task.exception()
+
+
+class RawResponse:
+    """Undecoded transport response, or the transport error"""
+
+    __slots__ = ("status", "headers", "content", "error", "sent")
+
+    def __init__(self, status: Optional[int] = None, headers: Any = None, content: bytes = b"",
+                 error: Optional[BaseException] = None, sent: bool = True):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self.error = error
+        self.sent = sent
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+
+class Request:
+    """
+    One API call travelling through the pipeline
+
+    The query string and body are encoded once on creation; ``request_path``
+    and ``payload`` are the exact bytes signed and sent on every attempt.
+    ``context`` is free for custom stages.
+    """
+
+    __slots__ = ("method", "path", "params", "body", "auth", "request_path", "payload",
+                 "headers", "attempt", "raw", "info", "context")
+
+    def __init__(self, method: str, path: str, params: Optional[Dict] = None,
+                 body: Optional[Dict] = None, auth: Optional[OKXAuth] = None):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.auth = auth
+        self.request_path, self.payload = encode_request(path, params, body)
+        self.headers: Dict[str, str] = {}
+        self.attempt = 0
+        self.raw: Optional[RawResponse] = None
+        self.info: Optional["RequestInfo"] = None
+        self.context: Dict[str, Any] = {}
+
+    @property
+    def api_key(self) -> str:
+        return self.auth.api_key if self.auth else ""
+
+
+CallNext = Callable[[], Any]
+
+
+class Middleware:
+    """
+    Base class of pipeline stages
+
+    Simple stages override :meth:`before` and/or :meth:`after`, which run
+    unchanged in sync and async pipelines. Stages that need to wait, loop or
+    run work in the background override :meth:`handle` and :meth:`ahandle`.
+    """
+
+    name = "middleware"
+
+    def before(self, request: Request) -> Optional[Dict]:
+        """Inspect or change a request; return a response to short-circuit"""
+        return None
+
+    def after(self, request: Request, response: Dict) -> Dict:
+        """Inspect or replace the response of the rest of the pipeline"""
+        return response
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        response = self.before(request)
+        if response is not None:
+            return response
+        return self.after(request, call_next())
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        response = self.before(request)
+        if response is not None:
+            return response
+        return self.after(request, await call_next())
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class Pipeline:
+    """
+    Ordered, editable list of middleware stages
+
+    Edits replace the stage tuple as a whole, so requests already running
+    keep the order they started with.
+    """
+
+    def __init__(self, stages: Iterable[Middleware] = ()):
+        self._stages: Tuple[Middleware, ...] = ()
+        for stage in stages:
+            self.add(stage)
+
+    def names(self) -> List[str]:
+        return [stage.name for stage in self._stages]
+
+    def get(self, name: str) -> Middleware:
+        for stage in self._stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def _index(self, name: str) -> int:
+        return self.names().index(name) if name in self else -1
+
+    def add(self, stage: Middleware, before: Optional[str] = None,
+            after: Optional[str] = None) -> None:
+        """
+        Insert a stage, at the innermost position unless before/after is given
+
+        Args:
+            stage: Middleware with a unique name
+            before: Name of the stage the new one should wrap
+            after: Name of the stage that should wrap the new one
+        """
+        if stage.name in self:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        stages = list(self._stages)
+        if before is not None:
+            stages.insert(self.names().index(before), stage)
+        elif after is not None:
+            stages.insert(self.names().index(after) + 1, stage)
+        else:
+            stages.append(stage)
+        self._stages = tuple(stages)
+
+    def remove(self, name: str) -> Middleware:
+        """Remove and return a stage"""
+        stage = self.get(name)
+        self._stages = tuple(s for s in self._stages if s is not stage)
+        return stage
+
+    def replace(self, name: str, stage: Middleware) -> None:
+        """Swap a stage for another in the same position"""
+        old = self.get(name)
+        self._stages = tuple(stage if s is old else s for s in self._stages)
+
+    def reorder(self, names: Iterable[str]) -> None:
+        """Set a new order; every current stage must be named exactly once"""
+        names = list(names)
+        if sorted(names) != sorted(self.names()):
+            raise ValueError(f"Order must name exactly these stages: {self.names()}")
+        self._stages = tuple(self.get(name) for name in names)
+
+    def __contains__(self, name: str) -> bool:
+        return any(stage.name == name for stage in self._stages)
+
+    def __iter__(self):
+        return iter(self._stages)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f"Pipeline({' -> '.join(self.names())})"
+
+    def run(self, request: Request, send: Callable[[Request], RawResponse]) -> Dict:
+        """Run a request through every stage and the transport's send"""
+        stages = self._stages
+
+        def call(index: int) -> Any:
+            if index == len(stages):
+                return send(request)
+            return stages[index].handle(request, lambda: call(index + 1))
+
+        return call(0)
+
+    async def arun(self, request: Request, send: Callable[[Request], Awaitable[RawResponse]]) -> Dict:
+        """Async variant of run()"""
+        stages = self._stages
+
+        async def call(index: int) -> Any:
+            if index == len(stages):
+                return await send(request)
+            return await stages[index].ahandle(request, lambda: call(index + 1))
+
+        return await call(0)
+
+
+class SnapshotMiddleware(Middleware):
+    """Serve reference data from a SnapshotStore, re-checking it against the API in the background"""
+
+    name = "snapshot"
+
+    def __init__(self, store: "SnapshotStore"):
+        self.store = store
+        self._refreshes: set = set()
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        key = self.store.key(request.method, request.path, request.params)
+        if key is None:
+            return call_next()
+
+        snapshot = self.store.lookup(key)
+        if snapshot is None:
+            response = call_next()
+            self.store.store(key, response)
+            return response
+        if self.store.begin_refresh(key):
+            threading.Thread(target=self._refresh, args=(key, call_next), daemon=True).start()
+        return snapshot.response
+
+    def _refresh(self, key: "SnapshotKey", call_next: CallNext) -> None:
+        try:
+            self.store.store(key, call_next())
+        finally:
+            self.store.end_refresh(key)
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        key = self.store.key(request.method, request.path, request.params)
+        if key is None:
+            return await call_next()
+
+        snapshot = self.store.lookup(key)
+        if snapshot is None:
+            response = await call_next()
+            self.store.store(key, response)
+            return response
+        if self.store.begin_refresh(key):
+            _spawn(self._refreshes, self._arefresh(key, call_next))
+        return snapshot.response
+
+    async def _arefresh(self, key: "SnapshotKey", call_next: Callable[[], Awaitable[Dict]]) -> None:
+        try:
+            self.store.store(key, await call_next())
+        finally:
+            self.store.end_refresh(key)
+
+
+class CacheMiddleware(Middleware):
+    """Serve reference data from a ResponseCache, refreshing stale entries in the background"""
+
+    name = "cache"
+
+    def __init__(self, cache: "ResponseCache"):
+        self.cache = cache
+        self._refreshes: set = set()
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        from .cache import FRESH, STALE
+        key = self.cache.key(request.method, request.path, request.params)
+        if key is None:
+            return call_next()
+
+        cached, state = self.cache.lookup(key)
+        if state == FRESH:
+            return cached
+        if state == STALE:
+            if self.cache.begin_refresh(key):
+                threading.Thread(target=self._refresh, args=(key, call_next), daemon=True).start()
+            return cached
+
+        response = call_next()
+        self.cache.store(key, response)
+        return response
+
+    def _refresh(self, key: Tuple, call_next: CallNext) -> None:
+        try:
+            self.cache.store(key, call_next())
+        finally:
+            self.cache.end_refresh(key)
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        from .cache import FRESH, STALE
+        key = self.cache.key(request.method, request.path, request.params)
+        if key is None:
+            return await call_next()
+
+        cached, state = self.cache.lookup(key)
+        if state == FRESH:
+            return cached
+        if state == STALE:
+            if self.cache.begin_refresh(key):
+                _spawn(self._refreshes, self._arefresh(key, call_next))
+            return cached
+
+        response = await call_next()
+        self.cache.store(key, response)
+        return response
+
+    async def _arefresh(self, key: Tuple, call_next: Callable[[], Awaitable[Dict]]) -> None:
+        try:
+            self.cache.store(key, await call_next())
+        finally:
+            self.cache.end_refresh(key)
+
+
+class QuoteCacheMiddleware(Middleware):
+    """Serve repeated DEX quotes from a QuoteCache"""
+
+    name = "quote_cache"
+
+    def __init__(self, cache: "QuoteCache"):
+        self.cache = cache
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        key = self.cache.key(request.method, request.path, request.params)
+        if key is None:
+            return call_next()
+        cached = self.cache.lookup(key, request.params)
+        if cached is not None:
+            return cached
+        return self.cache.store(key, request.params, call_next())
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        key = self.cache.key(request.method, request.path, request.params)
+        if key is None:
+            return await call_next()
+        cached = self.cache.lookup(key, request.params)
+        if cached is not None:
+            return cached
+        return self.cache.store(key, request.params, await call_next())
+
+
+class SingleFlightMiddleware(Middleware):
+    """Share one call between identical concurrent idempotent requests"""
+
+    name = "single_flight"
+
+    def __init__(self, single_flight: "SingleFlight"):
+        self.single_flight = single_flight
+
+    def _key(self, request: Request) -> Optional[Tuple]:
+        return self.single_flight.key(request.method, request.path, request.request_path,
+                                      request.payload, request.api_key)
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        key = self._key(request)
+        if key is None:
+            return call_next()
+        return self.single_flight.do(key, call_next)
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        key = self._key(request)
+        if key is None:
+            return await call_next()
+        return await self.single_flight.do_async(key, call_next)
+
+
+class RetryMiddleware(Middleware):
+    """Re-run the inner stages as allowed by a RetryPolicy"""
+
+    name = "retry"
+
+    def __init__(self, policy: "RetryPolicy"):
+        self.policy = policy
+
+    def _next_delay(self, request: Request, started: float, response: Dict) -> Optional[float]:
+        raw = request.raw
+        error = raw.error if raw is not None else None
+        sent = raw.sent if raw is not None else True
+        return self.policy.next_delay(request.method, request.path, request.attempt,
+                                      started, response, error, sent)
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        started = time.monotonic()
+        while True:
+            request.attempt += 1
+            request.raw = None
+            response = call_next()
+            delay = self._next_delay(request, started, response)
+            if delay is None:
+                return response
+            time.sleep(delay)
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        import asyncio
+        started = time.monotonic()
+        while True:
+            request.attempt += 1
+            request.raw = None
+            response = await call_next()
+            delay = self._next_delay(request, started, response)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+
+
+class RateLimitMiddleware(Middleware):
+    """Take a RateLimiter token per attempt and back off when the server throttles"""
+
+    name = "rate_limit"
+
+    def __init__(self, rate_limiter: "RateLimiter"):
+        self.rate_limiter = rate_limiter
+
+    def after(self, request: Request, response: Dict) -> Dict:
+        from .ratelimit import RATE_LIMIT_CODE, parse_retry_after
+        raw = request.raw
+        if raw is not None and raw.status == 429:
+            self.rate_limiter.penalize(request.api_key, request.path,
+                                       parse_retry_after(raw.headers.get("Retry-After")))
+        elif isinstance(response, dict) and response.get("code") == RATE_LIMIT_CODE:
+            self.rate_limiter.penalize(request.api_key, request.path)
+        return response
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        if not self.rate_limiter.acquire(request.api_key, request.path):
+            return dict(THROTTLED_RESPONSE)
+        return self.after(request, call_next())
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        if not await self.rate_limiter.acquire_async(request.api_key, request.path):
+            return dict(THROTTLED_RESPONSE)
+        return self.after(request, await call_next())
+
+
+class ConcurrencyMiddleware(Middleware):
+    """
+    Cap the requests in flight, e.g. the streams of an HTTP/2 connection
+
+    Sits before auth so a request is only signed once it may be sent, and
+    its timestamp cannot go stale while it waits.
+    """
+
+    name = "concurrency"
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        # One per event loop: an asyncio.Semaphore binds to the loop it is first used on
+        self._async_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def handle(self, request: Request, call_next: CallNext) -> Dict:
+        with self._semaphore:
+            return call_next()
+
+    async def ahandle(self, request: Request, call_next: Callable[[], Awaitable[Dict]]) -> Dict:
+        import asyncio
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self.limit)
+        async with semaphore:
+            return await call_next()
+
+
+class MetricsMiddleware(Middleware):
+    """Time and count every attempt with an Instrumentation"""
+
+    name = "metrics"
+
+    def __init__(self, instrumentation: "Instrumentation"):
+        self.instrumentation = instrumentation
+
+    def before(self, request: Request) -> None:
+        request.info = self.instrumentation.begin(request.method, request.path,
+                                                  request.request_path, request.payload)
+
+    def after(self, request: Request, response: Dict) -> Dict:
+        raw = request.raw
+        if raw is None:
+            self.instrumentation.end(request.info, response=response)
+        else:
+            # Hooks get None, not decode's stand-in body, when nothing came back
+            self.instrumentation.end(request.info, raw.status, None if raw.error is not None else response,
+                                     len(raw.content), raw.error)
+        request.info = None
+        return response
+
+
+class AuthMiddleware(Middleware):
+    """Sign the encoded request with the caller's OKXAuth"""
+
+    name = "auth"
+
+    def before(self, request: Request) -> None:
+        if request.auth:
+            request.headers = request.auth.headers_for(request.method, request.request_path,
+                                                       request.payload)
+        else:
+            request.headers = {"Content-Type": "application/json"}
+        if request.info is not None:
+            request.info.lap("sign")
+
+
+class DecodeMiddleware(Middleware):
+    """Turn the transport's raw response into the API's JSON dict"""
+
+    name = "decode"
+
+    def __init__(self, codec: JSONCodec):
+        self.codec = codec
+
+    def after(self, request: Request, raw: RawResponse) -> Dict:
+        if raw.error is not None:
+            return {
+                "code": "500",
+                "msg": str(raw.error)
+            }
+        if raw.status == 200:
+            response = self.codec.decode(raw.content)
+            if request.info is not None:
+                request.info.lap("decode")
+            return response
+        return {
+            "code": str(raw.status),
+            "msg": raw.text
+        }
+
+
+def default_pipeline(codec: JSONCodec,
+                     cache: Optional["ResponseCache"] = None,
+                     quote_cache: Optional["QuoteCache"] = None,
+                     single_flight: Optional["SingleFlight"] = None,
+                     retry: Optional["RetryPolicy"] = None,
+                     rate_limiter: Optional["RateLimiter"] = None,
+                     instrumentation: Optional["Instrumentation"] = None,
+                     max_in_flight: Optional[int] = None,
+                     snapshot: Optional["SnapshotStore"] = None) -> Pipeline:
+    """Build the standard stage order from the configured features"""
+    stages = [
+        SnapshotMiddleware(snapshot) if snapshot is not None else None,
+        CacheMiddleware(cache) if cache else None,
+        QuoteCacheMiddleware(quote_cache) if quote_cache else None,
+        SingleFlightMiddleware(single_flight) if single_flight else None,
+        RetryMiddleware(retry) if retry else None,
+        RateLimitMiddleware(rate_limiter) if rate_limiter else None,
+        ConcurrencyMiddleware(max_in_flight) if max_in_flight else None,
+        MetricsMiddleware(instrumentation) if instrumentation else None,
+        AuthMiddleware(),
+        DecodeMiddleware(codec),
+    ]
+    return Pipeline(stage for stage in stages if stage is not None)
@@ -0,0 +1,196 @@
+"""
+OKX Rate Limiting
+~~~~~~~~~~~~~~~~~
+
+Client-side token buckets per API key and endpoint group, so load stays just
+under the server limits instead of bouncing off them with 429s.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+# Request path prefix -> endpoint group
+ENDPOINT_GROUPS = (
+    ("/api/v5/dex/aggregator/", "dex"),
+    ("/api/v5/wallet/pre-transaction/", "wallet-pre"),
+    ("/api/v5/wallet/post-transaction/", "wallet-post"),
+    ("/api/v5/defi/explore/", "defi-explore"),
+)
+
+# Business code OKX returns with HTTP 200 when a key is throttled
+RATE_LIMIT_CODE = "50011"
+
+
+def endpoint_group(path: str) -> str:
+    """Return the rate-limit group of a request path"""
+    for prefix, group in ENDPOINT_GROUPS:
+        if path.startswith(prefix):
+            return group
+    return "default"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Waiting callers reserve their token up front, so concurrent callers are
+    released one refill interval apart instead of stampeding together.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second worth of tokens)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # _last lies in the future while the bucket is paused
+        if now > self._last:
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+    def _reserve(self, max_wait: Optional[float]) -> Optional[float]:
+        """Take a token and return how long to wait for it, or None if too long"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._last - now + max(0.0, 1.0 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, sleeping until it is available
+
+        Args:
+            blocking: Return False instead of waiting when no token is available
+            timeout: Maximum seconds to wait (None waits as long as needed)
+        """
+        wait = self._reserve(timeout if blocking else 0.0)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Take one token without blocking the event loop"""
+        wait = self._reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            import asyncio
+            await asyncio.sleep(wait)
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds (e.g. from a Retry-After hint)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            until = now + seconds
+            if until > self._last:
+                self._tokens = min(self._tokens, 0.0)
+                self._last = until
+
+
+LimitSpec = Union[float, Tuple[float, float]]
+
+
+class RateLimiter:
+    """
+    Token buckets per (API key, endpoint group)
+
+    ``limits`` maps a group name (``"dex"``, ``"wallet-pre"``,
+    ``"wallet-post"``, ``"defi-explore"`` or ``"default"``), or an
+    ``(api_key, group)`` pair for per-key overrides, to either a rate in
+    requests per second or a ``(rate, burst)`` tuple. Groups without a limit
+    are not throttled.
+    """
+
+    def __init__(self, limits: Dict[Union[str, Tuple[str, str]], LimitSpec],
+                 timeout: Optional[float] = None,
+                 penalty: float = 1.0):
+        """
+        Args:
+            limits: Rate limits per group or (api_key, group)
+            timeout: Maximum seconds a request waits for a token
+            penalty: Pause applied on a 429 without a Retry-After hint
+        """
+        self.limits = dict(limits)
+        self.timeout = timeout
+        self.penalty = penalty
+        self.throttled = 0
+        self.rejections = 0
+        self._buckets: Dict[Tuple[str, str], Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, api_key: str, path: str) -> Optional[TokenBucket]:
+        """Return the bucket governing a request, None when it is unlimited"""
+        key = (api_key, endpoint_group(path))
+        try:
+            return self._buckets[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._buckets:
+                spec = self.limits.get(key, self.limits.get(key[1], self.limits.get("default")))
+                if spec is None:
+                    self._buckets[key] = None
+                elif isinstance(spec, tuple):
+                    self._buckets[key] = TokenBucket(*spec)
+                else:
+                    self._buckets[key] = TokenBucket(spec)
+            return self._buckets[key]
+
+    def acquire(self, api_key: str, path: str) -> bool:
+        """Wait for a token for a request; False if the timeout ran out"""
+        bucket = self.bucket(api_key, path)
+        if bucket is None:
+            return True
+        if bucket.acquire(timeout=self.timeout):
+            return True
+        self.throttled += 1
+        return False
+
+    async def acquire_async(self, api_key: str, path: str) -> bool:
+        """Async variant of acquire()"""
+        bucket = self.bucket(api_key, path)
+        if bucket is None:
+            return True
+        if await bucket.acquire_async(timeout=self.timeout):
+            return True
+        self.throttled += 1
+        return False
+
+    def penalize(self, api_key: str, path: str, retry_after: Optional[float] = None) -> None:
+        """Record a server-side rejection and pause the request's bucket"""
+        self.rejections += 1
+        bucket = self.bucket(api_key, path)
+        if bucket is not None:
+            bucket.pause(self.penalty if retry_after is None else retry_after)
+
+    def stats(self) -> Dict[str, int]:
+        return {"throttled": self.throttled, "rejections": self.rejections}
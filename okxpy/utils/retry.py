@@ -0,0 +1,136 @@
+"""
+OKX Retry Policy
+~~~~~~~~~~~~~~~~
+
+Exponential backoff with jitter that only resends requests known to be safe.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from .ratelimit import RATE_LIMIT_CODE
+
+# Response codes worth another attempt
+RETRYABLE_CODES = frozenset({"429", "500", "502", "503", "504", RATE_LIMIT_CODE})
+
+# Codes meaning the server rejected the request without processing it
+REJECTED_CODES = frozenset({"429", RATE_LIMIT_CODE})
+
+# POST endpoints that only read data and can be resent freely
+IDEMPOTENT_POSTS = frozenset({
+    "/api/v5/wallet/pre-transaction/sign-info",
+    "/api/v5/wallet/pre-transaction/gas-limit",
+    "/api/v5/wallet/pre-transaction/sui-object",
+    "/api/v5/defi/explore/product/list",
+})
+
+
+class RetryPolicy:
+    """
+    Retry decisions and backoff for the transports
+
+    GET requests and the read-only POST endpoints in ``idempotent_posts``
+    are retried on transport errors and on ``retry_codes``. Every other
+    request, ``broadcast_transaction`` included, is only retried when it
+    provably did not take effect: the connection could not be opened, or the
+    server rejected it for rate limiting. Set ``retry_unsafe=False`` to never
+    resend those.
+    """
+
+    def __init__(self, max_attempts: int = 3,
+                 backoff: float = 0.1,
+                 max_backoff: float = 2.0,
+                 jitter: bool = True,
+                 budget: Optional[float] = 10.0,
+                 retry_codes: Iterable[str] = RETRYABLE_CODES,
+                 idempotent_posts: Iterable[str] = IDEMPOTENT_POSTS,
+                 retry_unsafe: bool = True):
+        """
+        Args:
+            max_attempts: Total attempts per call, including the first
+            backoff: Base delay in seconds, doubled after every attempt
+            max_backoff: Upper bound of a single delay
+            jitter: Draw each delay uniformly from [0, backoff] ("full jitter")
+            budget: Maximum seconds one call may spend across attempts
+            retry_codes: Response codes that trigger a retry
+            idempotent_posts: POST paths that are safe to resend
+            retry_unsafe: Retry non-idempotent requests that provably did not take effect
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget = budget
+        self.retry_codes = frozenset(retry_codes)
+        self.idempotent_posts = frozenset(idempotent_posts)
+        self.retry_unsafe = retry_unsafe
+
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.retries_by_path: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def is_idempotent(self, method: str, path: str) -> bool:
+        return method == "GET" or path in self.idempotent_posts
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number attempt (starting at 1)"""
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(self, method: str, path: str, attempt: int, started: float,
+                   response: Dict, error: Optional[BaseException] = None,
+                   sent: bool = True) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt
+
+        Args:
+            method: HTTP method
+            path: Request path
+            attempt: Number of attempts made so far
+            started: time.monotonic() of the first attempt
+            response: Response dict of the attempt
+            error: Transport exception of the attempt, if any
+            sent: False when the request never left the client
+
+        Returns:
+            Seconds to wait before the next attempt, or None to stop
+        """
+        code = str(response.get("code"))
+        if error is None and code not in self.retry_codes:
+            if attempt > 1 and code == "0":
+                with self._lock:
+                    self.recovered += 1
+            return None
+
+        if not self.is_idempotent(method, path):
+            took_no_effect = not sent or (error is None and code in REJECTED_CODES)
+            if not (self.retry_unsafe and took_no_effect):
+                return None
+
+        delay = self.delay(attempt)
+        out_of_budget = self.budget is not None and time.monotonic() - started + delay > self.budget
+        if attempt >= self.max_attempts or out_of_budget:
+            with self._lock:
+                self.exhausted += 1
+            return None
+
+        with self._lock:
+            self.retries += 1
+            self.retries_by_path[path] += 1
+        return delay
+
+    def stats(self) -> Dict:
+        """Retry counters"""
+        return {
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "retries_by_path": dict(self.retries_by_path),
+        }
@@ -0,0 +1,120 @@
+"""
+OKX Request Coalescing
+~~~~~~~~~~~~~~~~~~~~~~
+
+Single-flight layer: concurrent identical idempotent requests share one
+network call and all receive its result.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from .retry import IDEMPOTENT_POSTS
+
+
+class _Call:
+    """A request in flight in another thread"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical in-flight requests
+
+    Requests are matched on API key, method and the canonical encoded request
+    (sorted query string and body bytes), so only callers that would have
+    sent byte-identical requests share a call. GET requests and the POST
+    paths in ``idempotent_posts`` are coalesced; everything else, broadcasts
+    included, always goes out on its own. Waiters receive the very same
+    response object as the caller that sent the request, so treat it as
+    read-only.
+    """
+
+    def __init__(self, idempotent_posts: Iterable[str] = IDEMPOTENT_POSTS):
+        """
+        Args:
+            idempotent_posts: POST paths that are safe to share
+        """
+        self.idempotent_posts = frozenset(idempotent_posts)
+        self.calls = 0
+        self.saved = 0
+        self.saved_by_path: Counter = Counter()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[Any, Hashable], "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def key(self, method: str, path: str, request_path: str, payload: bytes,
+            api_key: str = "") -> Optional[Tuple]:
+        """Return the coalescing key of a request, None if it must not be shared"""
+        if method != "GET" and path not in self.idempotent_posts:
+            return None
+        return (api_key, method, request_path, payload)
+
+    def _saved(self, key: Hashable) -> None:
+        self.saved += 1
+        if isinstance(key, tuple) and len(key) == 4:
+            # Request keys from key() are also counted per path
+            self.saved_by_path[key[2].split("?", 1)[0]] += 1
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the identical call already in flight and share its result"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self._saved(key)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of do(); the shared call runs as its own task
+
+        Calls are only shared between coroutines of the same event loop.
+        """
+        import asyncio
+        # A task can only be awaited from its own loop
+        task_key = (asyncio.get_running_loop(), key)
+        task = self._tasks.get(task_key)
+        if task is not None:
+            self._saved(key)
+        else:
+            task = asyncio.ensure_future(fn())
+            self._tasks[task_key] = task
+            self.calls += 1
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        # A cancelled waiter must not cancel the call the others wait on
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict:
+        """Coalescing counters"""
+        return {
+            "calls": self.calls,
+            "saved": self.saved,
+            "in_flight": len(self._calls) + len(self._tasks),
+            "saved_by_path": dict(self.saved_by_path),
+        }
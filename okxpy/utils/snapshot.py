@@ -0,0 +1,274 @@
+"""
+OKX Reference-Data Snapshots
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+SQLite store persisting reference-data responses (supported chains, token
+lists, liquidity sources, DeFi networks and protocols) across restarts. A
+new process serves them from disk straight away and re-checks each one
+against the API in the background, recording what changed.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .codec import JSONCodec, get_codec
+
+# Reference endpoints kept in snapshots, with the field identifying a record
+DEFAULT_DATASETS = {
+    "/api/v5/dex/aggregator/supported/chain": "chainId",
+    "/api/v5/dex/aggregator/all-tokens": "tokenContractAddress",
+    "/api/v5/dex/aggregator/get-liquidity": "id",
+    "/api/v5/defi/explore/network-list": "network",
+    "/api/v5/defi/explore/protocol/list": "platformId",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    checked_at REAL NOT NULL,
+    checksum TEXT NOT NULL,
+    records INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (path, params)
+)
+"""
+
+SnapshotKey = Tuple[str, str]
+
+
+def _canonical_params(params: Optional[Dict]) -> str:
+    return json.dumps(sorted((params or {}).items()), separators=(",", ":"))
+
+
+def _records(response: Dict) -> List[Any]:
+    data = response.get("data")
+    if data is None:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def diff_records(old: List[Any], new: List[Any], id_field: Optional[str] = None) -> Dict[str, int]:
+    """
+    Count the records added, updated and removed between two dataset versions
+
+    Args:
+        old: Records of the stored version
+        new: Records of the live version
+        id_field: Field identifying a record; without it records are compared whole
+    """
+    def index(records: List[Any]) -> Dict[Any, Any]:
+        if id_field:
+            return {record.get(id_field) if isinstance(record, dict) else None: record
+                    for record in records}
+        return {json.dumps(record, sort_keys=True): record for record in records}
+
+    before, after = index(old), index(new)
+    return {
+        "added": sum(1 for key in after if key not in before),
+        "updated": sum(1 for key, record in after.items() if key in before and before[key] != record),
+        "removed": sum(1 for key in before if key not in after),
+    }
+
+
+class Snapshot:
+    """One stored dataset; the response body is decoded on first access"""
+
+    __slots__ = ("path", "params", "version", "updated_at", "checked_at", "checksum", "records",
+                 "_body", "_codec", "_response")
+
+    def __init__(self, path: str, params: str, version: int, updated_at: float, checked_at: float,
+                 checksum: str, records: int, body: bytes, codec: JSONCodec,
+                 response: Optional[Dict] = None):
+        self.path = path
+        self.params: Dict = dict(json.loads(params))
+        self.version = version
+        self.updated_at = updated_at
+        self.checked_at = checked_at
+        self.checksum = checksum
+        self.records = records
+        self._body = body
+        self._codec = codec
+        self._response = response
+
+    @property
+    def response(self) -> Dict:
+        """The stored API response (shared, treat as read-only)"""
+        if self._response is None:
+            self._response = self._codec.decode(self._body)
+        return self._response
+
+    @property
+    def age(self) -> float:
+        """Seconds since the dataset was last confirmed against the API"""
+        return time.time() - self.checked_at
+
+    def metadata(self) -> Dict[str, Any]:
+        return {"path": self.path, "params": self.params, "version": self.version,
+                "updated_at": self.updated_at, "checked_at": self.checked_at,
+                "checksum": self.checksum, "records": self.records}
+
+    def __repr__(self) -> str:
+        return f"<Snapshot {self.path} {self.params} v{self.version} ({self.records} records)>"
+
+
+class SnapshotStore:
+    """
+    Versioned on-disk copies of reference-data responses
+
+    Opening a store reads every snapshot's raw bytes in one query; bodies are
+    decoded only when first used. Each dataset is due for a background
+    re-check once per process start and then every ``max_age`` seconds.
+    Re-checks that return the same bytes only touch ``checked_at``; changed
+    datasets get a new version and notify :meth:`subscribe` callbacks with
+    the record-level diff.
+
+    Example::
+
+        store = SnapshotStore("okx-reference.db")
+        client = OKXClient(credentials_path="okx_credentials.json", snapshot=store)
+        client.dex.get_tokens("1")  # from disk, re-checked in the background
+    """
+
+    def __init__(self, path: str, datasets: Optional[Dict[str, Optional[str]]] = None,
+                 max_age: float = 900.0, codec: Union[str, JSONCodec] = "auto"):
+        """
+        Args:
+            path: SQLite file holding the snapshots (":memory:" for a throwaway store)
+            datasets: Mapping of request path to its record id field (default: DEFAULT_DATASETS)
+            max_age: Seconds between background re-checks of a dataset
+            codec: JSON decoder for stored bodies
+        """
+        self.path = path
+        self.datasets = dict(DEFAULT_DATASETS if datasets is None else datasets)
+        self.max_age = max_age
+        self.codec = get_codec(codec)
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.changes = 0
+        self._lock = threading.Lock()
+        self._due: Dict[SnapshotKey, float] = {}
+        self._refreshing = set()
+        self._subscribers: List[Callable[[Snapshot, Dict[str, int]], None]] = []
+
+        import sqlite3  # only processes that use snapshots pay for the import
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        rows = self._conn.execute(
+            "SELECT path, params, version, updated_at, checked_at, checksum, records, body FROM snapshots")
+        self._snapshots: Dict[SnapshotKey, Snapshot] = {
+            (row[0], row[1]): Snapshot(*row, codec=self.codec) for row in rows}
+
+    def key(self, method: str, path: str, params: Optional[Dict] = None) -> Optional[SnapshotKey]:
+        """Return the snapshot key of a request, or None if it is not a tracked dataset"""
+        if method != "GET" or path not in self.datasets:
+            return None
+        return path, _canonical_params(params)
+
+    def lookup(self, key: SnapshotKey) -> Optional[Snapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return snapshot
+
+    def get(self, path: str, params: Optional[Dict] = None) -> Optional[Snapshot]:
+        """Stored snapshot of a request path and parameters"""
+        return self._snapshots.get((path, _canonical_params(params)))
+
+    def snapshots(self, path: Optional[str] = None) -> List[Snapshot]:
+        """All stored snapshots, optionally only those of one request path"""
+        return [snapshot for key, snapshot in list(self._snapshots.items())
+                if path is None or key[0] == path]
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """Version metadata of every stored snapshot"""
+        return [snapshot.metadata() for snapshot in self.snapshots()]
+
+    def subscribe(self, callback: Callable[[Snapshot, Dict[str, int]], None]) -> None:
+        """Call callback(snapshot, diff) whenever a dataset gets a new version"""
+        self._subscribers.append(callback)
+
+    def begin_refresh(self, key: SnapshotKey) -> bool:
+        """Claim the background re-check of a dataset if it is due and not running"""
+        now = time.monotonic()
+        with self._lock:
+            if key in self._refreshing or now < self._due.get(key, 0.0):
+                return False
+            self._refreshing.add(key)
+            self._due[key] = now + self.max_age
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: SnapshotKey) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def store(self, key: SnapshotKey, response: Dict) -> Optional[Dict[str, int]]:
+        """
+        Save a live response of a dataset
+
+        Args:
+            key: Snapshot key from key()
+            response: Decoded API response; only successful ones are stored
+
+        Returns:
+            Counts of added, updated and removed records, None if not stored
+        """
+        if not isinstance(response, dict) or response.get("code") != "0":
+            return None
+        body = json.dumps(response, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        checksum = hashlib.sha256(body).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            current = self._snapshots.get(key)
+            if current is not None and current.checksum == checksum:
+                current.checked_at = now
+                self._conn.execute("UPDATE snapshots SET checked_at = ? WHERE path = ? AND params = ?",
+                                   (now, key[0], key[1]))
+                return {"added": 0, "updated": 0, "removed": 0}
+
+            records = _records(response)
+            old = _records(current.response) if current is not None else []
+            diff = diff_records(old, records, self.datasets.get(key[0]))
+            version = current.version + 1 if current is not None else 1
+            snapshot = Snapshot(key[0], key[1], version, now, now, checksum, len(records), body,
+                                self.codec, response)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(path, params, version, updated_at, checked_at, checksum, records, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key[0], key[1], version, now, now, checksum, len(records), body))
+            self._snapshots[key] = snapshot
+            self._due.setdefault(key, time.monotonic() + self.max_age)
+            self.changes += 1
+
+        for callback in list(self._subscribers):
+            callback(snapshot, diff)
+        return diff
+
+    def clear(self) -> None:
+        """Delete every snapshot"""
+        with self._lock:
+            self._conn.execute("DELETE FROM snapshots")
+            self._snapshots.clear()
+            self._due.clear()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {"snapshots": len(self._snapshots), "hits": self.hits, "misses": self.misses,
+                "refreshes": self.refreshes, "changes": self.changes}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
@@ -0,0 +1,35 @@
+"""
+OKX Parameter Validation
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Checks applied to request parameters before they are signed and sent.
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+def validate_params(params: Optional[Dict], required: Iterable[str] = (),
+                    allowed: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Check request parameters and drop the ones left unset
+
+    Args:
+        params: Query or body parameters
+        required: Names that must be present and non-empty
+        allowed: Optional complete set of accepted names
+
+    Returns:
+        A copy of params without None values
+
+    Raises:
+        ValueError: A required parameter is missing or a name is not allowed
+    """
+    params = {key: value for key, value in (params or {}).items() if value is not None}
+    missing = [key for key in required if params.get(key) in (None, "")]
+    if missing:
+        raise ValueError(f"Missing required parameter(s): {', '.join(missing)}")
+    if allowed is not None:
+        unknown = sorted(set(params) - set(allowed))
+        if unknown:
+            raise ValueError(f"Unknown parameter(s): {', '.join(unknown)}")
+    return params
@@ -5,6 +5,35 @@ OKX Wallet API Module
 This module provides access to OKX Wallet API endpoints.
 """
 
-from .client import WalletClient
+from typing import TYPE_CHECKING
 
-__all__ = ["WalletClient"] 
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import WalletClient, AsyncWalletClient
+    from .models import (GasPrice, Eip1559Fees, Nonce, SignInfo, BroadcastResult,
+                         TransactionOrder, TransactionPage)
+    from .address import AddressValidator, AddressVerdict, check_address
+    from .broadcast import BroadcastQueue, AsyncBroadcastQueue, BroadcastDropped
+    from .gas import GasOracle
+    from .nonce import NonceManager
+    from .prepare import PreparedTransaction, PreparationError
+    from .tracker import TransactionTracker
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "WalletClient": ".client", "AsyncWalletClient": ".client",
+    "GasPrice": ".models", "Eip1559Fees": ".models", "Nonce": ".models", "SignInfo": ".models",
+    "BroadcastResult": ".models", "TransactionOrder": ".models", "TransactionPage": ".models",
+    "AddressValidator": ".address", "AddressVerdict": ".address", "check_address": ".address",
+    "BroadcastQueue": ".broadcast", "AsyncBroadcastQueue": ".broadcast",
+    "BroadcastDropped": ".broadcast",
+    "GasOracle": ".gas", "NonceManager": ".nonce",
+    "PreparedTransaction": ".prepare", "PreparationError": ".prepare",
+    "TransactionTracker": ".tracker",
+})
+
+__all__ = ["WalletClient", "AsyncWalletClient", "GasPrice", "Eip1559Fees", "Nonce", "SignInfo",
+           "BroadcastResult", "TransactionOrder", "TransactionPage", "BroadcastQueue",
+           "AsyncBroadcastQueue", "BroadcastDropped", "GasOracle", "NonceManager",
+           "PreparedTransaction", "PreparationError", "TransactionTracker", "AddressValidator",
+           "AddressVerdict", "check_address"]
\ No newline at end of file
@@ -0,0 +1,352 @@
+"""
+OKX Bulk Address Validation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Local format checks per chain family (EVM hex with EIP-55 checksum, Solana
+and Tron base58, Sui hex) that reject malformed addresses without a network
+call, and a validator streaming verdicts for large address lists with only
+the plausible ones sent to ``validate-address``.
+"""
+
+import hashlib
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..exceptions import check_response
+from ..utils.cache import TTLCache
+from ..utils.concurrency import aiter_concurrent, iter_concurrent
+from ..utils.singleflight import SingleFlight
+
+EVM = "evm"
+SOLANA = "solana"
+SUI = "sui"
+TRON = "tron"
+
+# Chain index -> address family; chains not listed are only checked by the API
+CHAIN_FAMILIES = {
+    "1": EVM, "10": EVM, "25": EVM, "56": EVM, "66": EVM, "100": EVM, "137": EVM,
+    "196": EVM, "250": EVM, "324": EVM, "1101": EVM, "5000": EVM, "8453": EVM,
+    "42161": EVM, "43114": EVM, "59144": EVM, "81457": EVM, "534352": EVM,
+    "501": SOLANA,
+    "784": SUI,
+    "195": TRON,
+}
+
+# Payload field of validate-address flagging a blacklisted address
+BLACKLIST_FIELD = "isBlackList"
+
+_EVM_ADDRESS = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_SUI_ADDRESS = re.compile(r"^0x[0-9a-fA-F]{64}$")
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: i for i, char in enumerate(_BASE58_ALPHABET)}
+
+_MASK = (1 << 64) - 1
+_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+# Rotation offset of lane (x, y), indexed [x][y]
+_ROTATIONS = (
+    (0, 36, 3, 41, 18),
+    (1, 44, 10, 45, 2),
+    (62, 6, 43, 15, 61),
+    (28, 55, 25, 21, 56),
+    (27, 20, 39, 8, 14),
+)
+# Combined rho and pi steps as (source lane, destination lane, rotation, column)
+_RHO_PI = tuple((x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), _ROTATIONS[x][y], x)
+                for x in range(5) for y in range(5))
+
+
+def _keccak_f(state: list) -> None:
+    mask = _MASK
+    b = [0] * 25
+    for round_constant in _ROUND_CONSTANTS:
+        c0 = state[0] ^ state[5] ^ state[10] ^ state[15] ^ state[20]
+        c1 = state[1] ^ state[6] ^ state[11] ^ state[16] ^ state[21]
+        c2 = state[2] ^ state[7] ^ state[12] ^ state[17] ^ state[22]
+        c3 = state[3] ^ state[8] ^ state[13] ^ state[18] ^ state[23]
+        c4 = state[4] ^ state[9] ^ state[14] ^ state[19] ^ state[24]
+        d = (c4 ^ (((c1 << 1) | (c1 >> 63)) & mask),
+             c0 ^ (((c2 << 1) | (c2 >> 63)) & mask),
+             c1 ^ (((c3 << 1) | (c3 >> 63)) & mask),
+             c2 ^ (((c4 << 1) | (c4 >> 63)) & mask),
+             c3 ^ (((c0 << 1) | (c0 >> 63)) & mask))
+        for source, target, shift, x in _RHO_PI:
+            lane = state[source] ^ d[x]
+            b[target] = ((lane << shift) | (lane >> (64 - shift))) & mask if shift else lane
+        for y in (0, 5, 10, 15, 20):
+            b0, b1, b2, b3, b4 = b[y], b[y + 1], b[y + 2], b[y + 3], b[y + 4]
+            state[y] = b0 ^ (~b1 & b2)
+            state[y + 1] = b1 ^ (~b2 & b3)
+            state[y + 2] = b2 ^ (~b3 & b4)
+            state[y + 3] = b3 ^ (~b4 & b0)
+            state[y + 4] = b4 ^ (~b0 & b1)
+        state[0] ^= round_constant
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 as used by Ethereum, which pads differently from hashlib.sha3_256"""
+    rate = 136
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % rate))
+    padded[-1] |= 0x80
+    state = [0] * 25
+    for start in range(0, len(padded), rate):
+        for i in range(rate // 8):
+            state[i] ^= int.from_bytes(padded[start + 8 * i:start + 8 * i + 8], "little")
+        _keccak_f(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+def to_checksum_address(address: str) -> str:
+    """EIP-55 mixed-case form of a 0x-prefixed 20-byte hex address"""
+    hex_address = address[2:].lower()
+    digest = keccak256(hex_address.encode("ascii")).hex()
+    return "0x" + "".join(char.upper() if int(digest[i], 16) >= 8 else char
+                          for i, char in enumerate(hex_address))
+
+
+def b58decode(value: str) -> bytes:
+    """Decode a base58 (Bitcoin alphabet) string; raises ValueError on other characters"""
+    number = 0
+    for char in value:
+        digit = _BASE58_INDEX.get(char)
+        if digit is None:
+            raise ValueError(f"invalid base58 character {char!r}")
+        number = number * 58 + digit
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big") if number else b""
+    return b"\x00" * (len(value) - len(value.lstrip("1"))) + body
+
+
+def check_address(chain_index: str, address: str, checksum: bool = True) -> Optional[str]:
+    """
+    Check the format of an address locally
+
+    Args:
+        chain_index: Chain index the address belongs to
+        address: Address to check
+        checksum: Verify the EIP-55 checksum of mixed-case EVM addresses
+
+    Returns:
+        Why the address is malformed, or None if it is plausible (or the
+        chain family is unknown and only the API can tell)
+    """
+    family = CHAIN_FAMILIES.get(chain_index)
+    if not address:
+        return "empty address"
+    if family == EVM:
+        if not _EVM_ADDRESS.match(address):
+            return "expected 0x followed by 40 hex characters"
+        digits = address[2:]
+        if checksum and digits != digits.lower() and digits != digits.upper() \
+                and to_checksum_address(address) != address:
+            return "invalid EIP-55 checksum"
+    elif family == SUI:
+        if not _SUI_ADDRESS.match(address):
+            return "expected 0x followed by 64 hex characters"
+    elif family == SOLANA:
+        try:
+            decoded = b58decode(address)
+        except ValueError as e:
+            return str(e)
+        if len(decoded) != 32:
+            return "expected 32 base58-encoded bytes"
+    elif family == TRON:
+        try:
+            decoded = b58decode(address)
+        except ValueError as e:
+            return str(e)
+        if len(decoded) != 25 or decoded[0] != 0x41:
+            return "expected a base58check address starting with T"
+        if hashlib.sha256(hashlib.sha256(decoded[:21]).digest()).digest()[:4] != decoded[21:]:
+            return "invalid base58check checksum"
+    return None
+
+
+def _truthy(value: Any) -> bool:
+    return value is True or str(value).lower() in ("true", "1")
+
+
+class AddressVerdict:
+    """
+    Outcome of validating one address
+
+    ``source`` is "local" for addresses rejected by the format checks,
+    "cache" for verdicts served from the cache and "api" for fresh ones.
+    ``valid`` is None when the API call failed (see ``error``).
+    """
+
+    __slots__ = ("index", "chain_index", "address", "valid", "blacklisted", "reason", "source",
+                 "info", "error")
+
+    def __init__(self, index: int, chain_index: str, address: str, valid: Optional[bool],
+                 source: str, reason: Optional[str] = None, blacklisted: bool = False,
+                 info: Optional[Any] = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.chain_index = chain_index
+        self.address = address
+        self.valid = valid
+        self.blacklisted = blacklisted
+        self.reason = reason
+        self.source = source
+        self.info = info
+        self.error = error
+
+    @property
+    def usable(self) -> bool:
+        """True if the address is valid and not blacklisted"""
+        return bool(self.valid) and not self.blacklisted
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"chainIndex": self.chain_index, "address": self.address, "valid": self.valid,
+                "blacklisted": self.blacklisted, "reason": self.reason, "source": self.source,
+                "error": str(self.error) if self.error is not None else None}
+
+    def __repr__(self) -> str:
+        state = "error" if self.valid is None else ("valid" if self.valid else "invalid")
+        flag = " blacklisted" if self.blacklisted else ""
+        return f"<AddressVerdict {self.chain_index}:{self.address} {state}{flag} ({self.source})>"
+
+
+class AddressValidator:
+    """
+    Validate large address lists with local pre-checks and a verdict cache
+
+    Addresses failing :func:`check_address` are rejected without a network
+    call, cached verdicts (including the blacklist flag) are reused for
+    ``ttl`` seconds, and the rest go to ``validate-address`` with at most
+    ``max_concurrency`` calls in flight. Concurrent lookups of the same
+    address share one call through a :class:`~okxpy.utils.SingleFlight`.
+    :meth:`validate_many` consumes its input lazily and yields verdicts as
+    they are ready, not in input order (use ``verdict.index``), so memory
+    stays flat on large imports.
+
+    Example::
+
+        validator = AddressValidator(client.wallet)
+        for verdict in validator.validate_many(("1", address) for address in addresses):
+            if not verdict.usable:
+                print(verdict.index, verdict.address, verdict.reason)
+    """
+
+    def __init__(self, wallet, ttl: float = 3600.0, maxsize: int = 100000,
+                 max_concurrency: int = 8, checksum: bool = True):
+        """
+        Args:
+            wallet: WalletClient or AsyncWalletClient used for API checks
+            ttl: Seconds an API verdict stays cached
+            maxsize: Maximum number of cached verdicts
+            max_concurrency: API calls in flight at once
+            checksum: Verify EIP-55 checksums of mixed-case EVM addresses
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.wallet = wallet
+        self.ttl = ttl
+        self.max_concurrency = max_concurrency
+        self.checksum = checksum
+        self.cache = TTLCache(maxsize)
+        self.single_flight = SingleFlight()
+        self.local_rejects = 0
+        self.cache_hits = 0
+        self.api_calls = 0
+
+    @staticmethod
+    def _key(chain_index: str, address: str) -> Tuple[str, str]:
+        # Hex addresses are case-insensitive, base58 ones are not
+        if CHAIN_FAMILIES.get(chain_index) in (EVM, SUI):
+            address = address.lower()
+        return chain_index, address
+
+    def _precheck(self, chain_index: str, address: str) -> Optional[AddressVerdict]:
+        """Verdict available without a network call, if any"""
+        reason = check_address(chain_index, address, self.checksum)
+        if reason is not None:
+            self.local_rejects += 1
+            return AddressVerdict(0, chain_index, address, False, "local", reason)
+        entry = self.cache.get(self._key(chain_index, address))
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self.cache_hits += 1
+            valid, blacklisted, info = entry[1]
+            return AddressVerdict(0, chain_index, address, valid, "cache",
+                                  None if valid else "rejected by the API", blacklisted, info)
+        return None
+
+    def _verdict(self, chain_index: str, address: str, response: Any = None,
+                 error: Optional[BaseException] = None) -> AddressVerdict:
+        """Build the verdict of an API call and cache it"""
+        if error is None:
+            try:
+                info = check_response(response)["data"][0]
+            except Exception as e:
+                error = e
+        if error is not None:
+            return AddressVerdict(0, chain_index, address, None, "api", str(error), error=error)
+        valid = _truthy(info.get("isValid"))
+        blacklisted = _truthy(info.get(BLACKLIST_FIELD))
+        self.cache.set(self._key(chain_index, address), (valid, blacklisted, info))
+        return AddressVerdict(0, chain_index, address, valid, "api",
+                              None if valid else "rejected by the API", blacklisted, info)
+
+    def validate(self, chain_index: str, address: str) -> AddressVerdict:
+        """Validate one address"""
+        verdict = self._precheck(chain_index, address)
+        if verdict is not None:
+            return verdict
+
+        def call():
+            self.api_calls += 1
+            return self.wallet.validate_address(chain_index, address)
+
+        try:
+            response = self.single_flight.do(self._key(chain_index, address), call)
+        except Exception as e:
+            return self._verdict(chain_index, address, error=e)
+        return self._verdict(chain_index, address, response)
+
+    async def avalidate(self, chain_index: str, address: str) -> AddressVerdict:
+        """Validate one address with an AsyncWalletClient"""
+        verdict = self._precheck(chain_index, address)
+        if verdict is not None:
+            return verdict
+
+        def call():
+            self.api_calls += 1
+            return self.wallet.validate_address(chain_index, address)
+
+        try:
+            response = await self.single_flight.do_async(self._key(chain_index, address), call)
+        except Exception as e:
+            return self._verdict(chain_index, address, error=e)
+        return self._verdict(chain_index, address, response)
+
+    def validate_many(self, addresses: Iterable[Tuple[str, str]]) -> Iterator[AddressVerdict]:
+        """
+        Validate (chain_index, address) pairs, yielding verdicts as they are ready
+
+        Args:
+            addresses: Iterable of (chain_index, address); consumed lazily
+        """
+        for index, _, verdict, _ in iter_concurrent(lambda item: self.validate(*item), addresses,
+                                                    self.max_concurrency):
+            verdict.index = index
+            yield verdict
+
+    async def avalidate_many(self, addresses: Iterable[Tuple[str, str]]) -> AsyncIterator[AddressVerdict]:
+        """Async variant of validate_many() for an AsyncWalletClient"""
+        async for index, _, verdict, _ in aiter_concurrent(lambda item: self.avalidate(*item), addresses,
+                                                            self.max_concurrency):
+            verdict.index = index
+            yield verdict
+
+    def stats(self) -> Dict[str, int]:
+        return {"local_rejects": self.local_rejects, "cache_hits": self.cache_hits,
+                "api_calls": self.api_calls, "coalesced": self.single_flight.saved,
+                "cached": len(self.cache)}
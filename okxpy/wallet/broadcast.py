@@ -0,0 +1,486 @@
+"""
+OKX Broadcast Queue
+~~~~~~~~~~~~~~~~~~~
+
+Worker pool for broadcasting many signed transactions, with priority
+lanes, bounded-queue backpressure and in-order delivery per account.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..exceptions import OKXError, check_response
+
+# Priority lanes; lower values are broadcast first
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+AccountKey = Tuple[str, str]
+
+
+class BroadcastDropped(OKXError):
+    """A queued broadcast was not sent because an earlier one of its account did not go through"""
+
+    def __init__(self, cause: BaseException):
+        super().__init__(f"Broadcast dropped after an earlier broadcast of the account failed: {cause!r}")
+        self.cause = cause
+        self.__cause__ = cause
+
+
+class _Broadcast:
+    """One queued broadcast_transaction call"""
+
+    __slots__ = ("key", "signed_tx", "chain_index", "address", "extra", "priority", "seq",
+                 "nonce", "future")
+
+    def __init__(self, signed_tx: str, chain_index: str, address: str, extra: Tuple,
+                 priority: int, seq: int, nonce: Optional[int], future: Any):
+        self.key: AccountKey = (chain_index, address.lower())
+        self.signed_tx = signed_tx
+        self.chain_index = chain_index
+        self.address = address
+        self.extra = extra
+        self.priority = priority
+        self.seq = seq
+        self.nonce = nonce
+        self.future = future
+
+
+class _Lanes:
+    """
+    Pending broadcasts grouped per account
+
+    Only the head of an account's queue is schedulable and an account has at
+    most one broadcast in flight, so its transactions go out in submission
+    order. Ready accounts are served by the priority, then age, of their head.
+    Not thread-safe: callers hold their queue's lock.
+    """
+
+    def __init__(self, stop_account_on_error: bool):
+        self.stop_account_on_error = stop_account_on_error
+        self.accounts: Dict[AccountKey, Deque[_Broadcast]] = {}
+        self.ready: List[Tuple[int, int, AccountKey]] = []
+        self.busy = set()
+        self.pending = 0
+
+    def push(self, job: _Broadcast) -> None:
+        lane = self.accounts.get(job.key)
+        if lane is None:
+            lane = self.accounts[job.key] = deque()
+        lane.append(job)
+        self.pending += 1
+        if len(lane) == 1 and job.key not in self.busy:
+            heapq.heappush(self.ready, (job.priority, job.seq, job.key))
+
+    def pop(self) -> Optional[_Broadcast]:
+        if not self.ready:
+            return None
+        _, _, key = heapq.heappop(self.ready)
+        self.busy.add(key)
+        return self.accounts[key].popleft()
+
+    def done(self, job: _Broadcast, failed: bool) -> List[_Broadcast]:
+        """Finish a broadcast and return the queued ones of its account that are dropped"""
+        self.busy.discard(job.key)
+        self.pending -= 1
+        lane = self.accounts[job.key]
+        dropped = []
+        if failed and self.stop_account_on_error:
+            # Later nonces of this account would only open a gap
+            dropped = list(lane)
+            lane.clear()
+            self.pending -= len(dropped)
+        if lane:
+            head = lane[0]
+            heapq.heappush(self.ready, (head.priority, head.seq, job.key))
+        else:
+            del self.accounts[job.key]
+        return dropped
+
+    def drain(self) -> List[_Broadcast]:
+        """Remove and return every queued broadcast; in-flight ones stay tracked"""
+        jobs = []
+        for key in list(self.accounts):
+            jobs.extend(self.accounts[key])
+            if key in self.busy:
+                self.accounts[key].clear()
+            else:
+                del self.accounts[key]
+        self.ready = []
+        self.pending -= len(jobs)
+        return jobs
+
+
+def _order_id(response: Dict) -> str:
+    return check_response(response)["data"][0]["orderId"]
+
+
+def _cancelled() -> CancelledError:
+    return CancelledError("Broadcast cancelled before it was sent")
+
+
+def _claim_future(future: Future) -> bool:
+    return future.set_running_or_notify_cancel()
+
+
+def _claim_async_future(future: Any) -> bool:
+    return not future.done()
+
+
+class _BroadcastQueueBase:
+    """Lanes, counters and settlement shared by the thread and asyncio queues"""
+
+    def __init__(self, wallet, workers: int, max_pending: int, nonces,
+                 stop_account_on_error: bool, claim: Callable[[Any], bool]):
+        """
+        Args:
+            claim: Take a pending future for settling; False if the caller
+                cancelled it
+        """
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers and max_pending must be at least 1")
+        self.wallet = wallet
+        self.workers = workers
+        self.max_pending = max_pending
+        self.nonces = nonces
+        self.submitted = 0
+        self.sent = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self._claim = claim
+        self._lanes = _Lanes(stop_account_on_error)
+        self._seq = itertools.count()
+        self._closed = False
+
+    def stats(self) -> Dict[str, int]:
+        return {"submitted": self.submitted, "sent": self.sent, "failed": self.failed,
+                "cancelled": self.cancelled, "dropped": self.dropped, "pending": self._lanes.pending,
+                "in_flight": len(self._lanes.busy), "accounts": len(self._lanes.accounts)}
+
+    def _report(self, job: _Broadcast, response: Any, error: Optional[BaseException]) -> None:
+        if self.nonces is None or job.nonce is None:
+            return
+        if isinstance(error, CancelledError):
+            self.nonces.release(job.chain_index, job.address, job.nonce)
+        else:
+            self.nonces.report(job.chain_index, job.address, job.nonce, response, error)
+
+    def _done(self, job: _Broadcast, error: Optional[BaseException]) -> List[_Broadcast]:
+        """Count the outcome of job and return the broadcasts dropped with it; callers hold the lock"""
+        dropped = self._lanes.done(job, error is not None)
+        if error is None:
+            self.sent += 1
+        elif isinstance(error, CancelledError):
+            self.cancelled += 1
+        else:
+            self.failed += 1
+        self.dropped += len(dropped)
+        return dropped
+
+    def _drop(self, dropped: List[_Broadcast], cause: BaseException) -> None:
+        """Fail broadcasts that were never sent and hand their nonces back"""
+        for job in dropped:
+            if self._claim(job.future):
+                job.future.set_exception(BroadcastDropped(cause))
+            if self.nonces is not None and job.nonce is not None:
+                self.nonces.release(job.chain_index, job.address, job.nonce)
+
+    def _drain(self) -> List[_Broadcast]:
+        """Take the queued broadcasts off the lanes on close; callers hold the lock"""
+        jobs = self._lanes.drain()
+        self.cancelled += len(jobs)
+        return jobs
+
+    def _cancel(self, jobs: List[_Broadcast]) -> None:
+        """Cancel drained broadcasts and hand their nonces back"""
+        for job in jobs:
+            job.future.cancel()
+            self._report(job, None, _cancelled())
+
+
+class BroadcastQueue(_BroadcastQueueBase):
+    """
+    Broadcast signed transactions from a pool of worker threads
+
+    :meth:`submit` returns a :class:`concurrent.futures.Future` resolving to
+    the orderId, or failing with the broadcast's OKXAPIError. Broadcasts of
+    one (chainIndex, address) are sent one at a time in submission order so
+    their nonces land in order. When one fails or is cancelled before it was
+    sent, the account's queued broadcasts fail with :class:`BroadcastDropped`
+    (see ``stop_account_on_error``). Different accounts go out in parallel,
+    ``HIGH`` priority first. Once ``max_pending`` broadcasts are queued or in
+    flight, submit() blocks. The transport's rate limiter paces the workers.
+
+    Example::
+
+        with BroadcastQueue(client.wallet, workers=16) as broadcasts:
+            futures = [broadcasts.submit(tx, "1", address) for tx in signed]
+            order_ids = [future.result() for future in futures]
+    """
+
+    def __init__(self, wallet, workers: int = 8, max_pending: int = 1000, nonces=None,
+                 stop_account_on_error: bool = True):
+        """
+        Args:
+            wallet: WalletClient used to broadcast
+            workers: Number of worker threads
+            max_pending: Queued plus in-flight broadcasts before submit() blocks
+            nonces: Optional NonceManager told about the outcome of broadcasts
+                submitted with a nonce; nonces of unsent broadcasts are released
+            stop_account_on_error: Fail the account's queued broadcasts when one
+                of its broadcasts fails or is cancelled, since their nonces can
+                no longer land
+        """
+        super().__init__(wallet, workers, max_pending, nonces, stop_account_on_error, _claim_future)
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, signed_tx: str, chain_index: str, address: str, priority: int = NORMAL,
+               nonce: Optional[int] = None, base_fee: Optional[str] = None,
+               priority_fee: Optional[str] = None, recent_block_hash: Optional[str] = None,
+               last_valid_block_height: Optional[str] = None, block: bool = True,
+               timeout: Optional[float] = None) -> Future:
+        """
+        Queue a signed transaction for broadcasting
+
+        Args:
+            signed_tx, chain_index, address, base_fee, priority_fee,
+                recent_block_hash, last_valid_block_height: As in
+                WalletClient.broadcast_transaction
+            priority: HIGH, NORMAL or LOW
+            nonce: Nonce the transaction was signed with, reported to ``nonces``
+            block: Wait for room when the queue is full
+            timeout: Seconds to wait for room
+
+        Returns:
+            Future resolving to the orderId
+
+        Raises:
+            queue.Full: No room within timeout, or block is False
+            RuntimeError: The queue is closed
+        """
+        future = Future()
+        extra = (base_fee, priority_fee, recent_block_hash, last_valid_block_height)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BroadcastQueue is closed")
+            if self._lanes.pending >= self.max_pending:
+                if not block or not self._cond.wait_for(
+                        lambda: self._closed or self._lanes.pending < self.max_pending, timeout):
+                    raise queue.Full
+                if self._closed:
+                    raise RuntimeError("BroadcastQueue is closed")
+            job = _Broadcast(signed_tx, chain_index, address, extra, priority, next(self._seq),
+                             nonce, future)
+            self._lanes.push(job)
+            self.submitted += 1
+            self._start_workers()
+            self._cond.notify_all()
+        return future
+
+    def _start_workers(self) -> None:
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name="okxpy-broadcast", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._lanes.pop()
+                while job is None:
+                    if self._closed and not self._lanes.pending:
+                        return
+                    self._cond.wait()
+                    job = self._lanes.pop()
+            self._finish(job, self._send(job))
+
+    def _send(self, job: _Broadcast) -> Optional[BaseException]:
+        """
+        Broadcast one transaction and settle its future
+
+        Returns:
+            None if it was sent, CancelledError if the caller cancelled it
+            first, otherwise the broadcast's error
+        """
+        if not self._claim(job.future):
+            error = _cancelled()
+            self._report(job, None, error)
+            return error
+        response = error = None
+        try:
+            response = self.wallet.broadcast_transaction(job.signed_tx, job.chain_index,
+                                                         job.address, *job.extra)
+            job.future.set_result(_order_id(response))
+        except Exception as e:
+            error = e
+            job.future.set_exception(e)
+        self._report(job, response, error)
+        return error
+
+    def _finish(self, job: _Broadcast, error: Optional[BaseException]) -> None:
+        with self._cond:
+            dropped = self._done(job, error)
+            self._cond.notify_all()
+        self._drop(dropped, error)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted broadcast is settled; False on timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._lanes.pending, timeout)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting broadcasts
+
+        With wait, send the queued broadcasts and stop the workers. Otherwise
+        cancel the queued ones and return; broadcasts already in flight
+        finish in the background.
+        """
+        with self._cond:
+            self._closed = True
+            jobs = [] if wait else self._drain()
+            self._cond.notify_all()
+        self._cancel(jobs)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "BroadcastQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AsyncBroadcastQueue(_BroadcastQueueBase):
+    """
+    Asyncio flavour of :class:`BroadcastQueue` for an AsyncWalletClient
+
+    Workers are tasks on the running loop, :meth:`submit` is a coroutine
+    waiting for room and returns an :class:`asyncio.Future` resolving to
+    the orderId.
+    """
+
+    def __init__(self, wallet, workers: int = 8, max_pending: int = 1000, nonces=None,
+                 stop_account_on_error: bool = True):
+        super().__init__(wallet, workers, max_pending, nonces, stop_account_on_error,
+                         _claim_async_future)
+        self._cond = None
+        self._tasks: List[Any] = []
+
+    def _condition(self):
+        if self._cond is None:
+            import asyncio
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def submit(self, signed_tx: str, chain_index: str, address: str, priority: int = NORMAL,
+                     nonce: Optional[int] = None, base_fee: Optional[str] = None,
+                     priority_fee: Optional[str] = None, recent_block_hash: Optional[str] = None,
+                     last_valid_block_height: Optional[str] = None):
+        """Queue a signed transaction, waiting while the queue is full; see BroadcastQueue.submit"""
+        import asyncio
+        cond = self._condition()
+        future = asyncio.get_running_loop().create_future()
+        extra = (base_fee, priority_fee, recent_block_hash, last_valid_block_height)
+        async with cond:
+            if self._closed:
+                raise RuntimeError("AsyncBroadcastQueue is closed")
+            await cond.wait_for(lambda: self._closed or self._lanes.pending < self.max_pending)
+            if self._closed:
+                raise RuntimeError("AsyncBroadcastQueue is closed")
+            self._lanes.push(_Broadcast(signed_tx, chain_index, address, extra, priority,
+                                        next(self._seq), nonce, future))
+            self.submitted += 1
+            while len(self._tasks) < self.workers:
+                self._tasks.append(asyncio.ensure_future(self._work()))
+            cond.notify_all()
+        return future
+
+    async def _work(self) -> None:
+        import asyncio
+        cond = self._condition()
+        while True:
+            async with cond:
+                job = self._lanes.pop()
+                while job is None:
+                    if self._closed and not self._lanes.pending:
+                        return
+                    await cond.wait()
+                    job = self._lanes.pop()
+            cancelled = None
+            try:
+                error = await self._send(job)
+            except asyncio.CancelledError as e:
+                cancelled = e
+                error = CancelledError("Broadcast cancelled while in flight")
+            async with cond:
+                dropped = self._done(job, error)
+                cond.notify_all()
+            self._drop(dropped, error)
+            if cancelled is not None:
+                raise cancelled
+
+    async def _send(self, job: _Broadcast) -> Optional[BaseException]:
+        import asyncio
+        if not self._claim(job.future):
+            error = _cancelled()
+            self._report(job, None, error)
+            return error
+        response = error = None
+        try:
+            response = await self.wallet.broadcast_transaction(job.signed_tx, job.chain_index,
+                                                               job.address, *job.extra)
+            order_id = _order_id(response)
+            if not job.future.cancelled():
+                job.future.set_result(order_id)
+        except asyncio.CancelledError:
+            # The request may have gone out, so its nonce is not handed back
+            job.future.cancel()
+            raise
+        except Exception as e:
+            error = e
+            if not job.future.cancelled():
+                job.future.set_exception(e)
+        self._report(job, response, error)
+        return error
+
+    async def join(self) -> None:
+        """Wait until every submitted broadcast is settled"""
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: not self._lanes.pending)
+
+    async def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting broadcasts
+
+        With wait, send the queued broadcasts first. Otherwise cancel the
+        queued ones and the broadcasts in flight; the nonces of the queued
+        ones are released.
+        """
+        import asyncio
+        cond = self._condition()
+        async with cond:
+            self._closed = True
+            jobs = [] if wait else self._drain()
+            cond.notify_all()
+        self._cancel(jobs)
+        if not wait:
+            for task in self._tasks:
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=not wait)
+
+    async def __aenter__(self) -> "AsyncBroadcastQueue":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -1,38 +1,16 @@
-from typing import Optional, Dict
-import requests
-from ..auth import OKXAuth
+from typing import Optional, Dict, Iterator, AsyncIterator
+from ..exceptions import check_response
+from ..utils.concurrency import iter_concurrent, aiter_concurrent
+from ..utils.paginate import cursor_page, iter_prefetched, aiter_prefetched
+from ..base import AsyncBaseClient, BaseClient
+from .models import GasPrice, Nonce, SignInfo, BroadcastResult, TransactionPage
+from .prepare import PreparedTransaction, merge_results, preparation_calls
 
-class WalletClient:
+class WalletClient(BaseClient):
     """OKX Wallet API client"""
     
-    BASE_URL = "https://www.okx.com/api/v5/wallet"
+    BASE_PATH = "/api/v5/wallet"
     
-    def __init__(self, auth: OKXAuth):
-        self.auth = auth
-
-    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to API"""
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = self.auth.get_headers(method, f"/api/v5/wallet/{endpoint}", params, body)
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=body)
-            
-            if response.status_code == 200:
-                return response.json()
-            return {
-                "code": str(response.status_code),
-                "msg": response.text
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                "code": "500",
-                "msg": str(e)
-            }
-
     def get_sign_info(self, chain_index: str, from_addr: str, to_addr: str, 
                      tx_amount: str = "0", ext_json: Optional[Dict] = None) -> Dict:
         """
@@ -54,7 +32,7 @@ class WalletClient:
         if ext_json:
             body["extJson"] = ext_json
             
-        return self._request("POST", "pre-transaction/sign-info", body=body)
+        return self._request("POST", "pre-transaction/sign-info", body=body, model=SignInfo)
 
     def get_gas_price(self, chain_index: str) -> Dict:
         """
@@ -64,7 +42,7 @@ class WalletClient:
             chain_index: Chain index to get gas price for
         """
         params = {"chainIndex": chain_index}
-        return self._request("GET", "pre-transaction/gas-price", params=params)
+        return self._request("GET", "pre-transaction/gas-price", params=params, model=GasPrice)
 
     def get_gas_limit(self, chain_index: str, from_addr: str, to_addr: str,
                      tx_amount: str = "0", ext_json: Optional[Dict] = None) -> Dict:
@@ -101,7 +79,44 @@ class WalletClient:
             "address": address,
             "chainIndex": chain_index
         }
-        return self._request("GET", "pre-transaction/nonce", params=params)
+        return self._request("GET", "pre-transaction/nonce", params=params, model=Nonce)
+
+    def prepare_transaction(self, chain_index: str, from_addr: str, to_addr: str,
+                            amount: str = "0", ext_json: Optional[Dict] = None,
+                            nonces=None, gas_oracle=None) -> PreparedTransaction:
+        """
+        Fetch sign info, gas price, gas limit and nonce concurrently
+
+        The four pre-transaction calls are independent, so they are issued
+        together and the transaction is ready to sign after about one round
+        trip instead of four. Failed calls are recorded in the bundle's
+        ``errors`` rather than raised; call ``raise_for_errors()`` to fail fast.
+
+        Args:
+            chain_index: Chain index for the transaction
+            from_addr: Sender address
+            to_addr: Recipient address
+            amount: Transaction amount (default: "0")
+            ext_json: Optional additional parameters
+            nonces: Optional NonceManager allocating the nonce locally instead
+                of calling get_nonce; it is released again if another call
+                fails, otherwise release it if the transaction is not sent
+            gas_oracle: Optional GasOracle whose latest price replaces the
+                get_gas_price call once it has one for the chain
+        """
+        gas_price = gas_oracle.latest(chain_index) if gas_oracle is not None else None
+        calls = preparation_calls(self, chain_index, from_addr, to_addr, amount, ext_json, nonces,
+                                  gas_price=gas_price is None)
+        results, errors = {}, {}
+        for _, (name, _), result, error in iter_concurrent(lambda call: call[1](), calls,
+                                                           max_concurrency=len(calls)):
+            if error is None:
+                results[name] = result
+            else:
+                errors[name] = error
+        prepared = PreparedTransaction(chain_index, from_addr, to_addr, amount, ext_json)
+        prepared.gas_price = gas_price
+        return merge_results(prepared, results, errors, nonces)
 
     def get_sui_objects(self, chain_index: str, address: str, token_address: str,
                        limit: str = "50", cursor: Optional[str] = None) -> Dict:
@@ -172,7 +187,7 @@ class WalletClient:
         if last_valid_block_height:
             body["lastValidBlockHeight"] = last_valid_block_height
             
-        return self._request("POST", "pre-transaction/broadcast-transaction", body=body)
+        return self._request("POST", "pre-transaction/broadcast-transaction", body=body, model=BroadcastResult)
 
     def get_transaction_list(self, address: Optional[str] = None, 
                            account_id: Optional[str] = None,
@@ -211,4 +226,102 @@ class WalletClient:
         if tx_status:
             params["txStatus"] = tx_status
             
-        return self._request("GET", "post-transaction/orders", params=params) 
\ No newline at end of file
+        return self._request("GET", "post-transaction/orders", params=params, model=TransactionPage)
+
+    def iter_transactions(self, address: Optional[str] = None,
+                          account_id: Optional[str] = None,
+                          chain_index: Optional[str] = None,
+                          tx_status: Optional[str] = None,
+                          order_id: Optional[str] = None,
+                          limit: str = "20",
+                          max_buffered_pages: int = 2) -> Iterator[Dict]:
+        """
+        Iterate over all broadcasted transactions, fetching the next page ahead
+
+        Args:
+            address, account_id, chain_index, tx_status, order_id: Filters as
+                in get_transaction_list
+            limit: Number of results per page (default: "20")
+            max_buffered_pages: Pages allowed to wait for the consumer
+
+        Raises:
+            OKXAPIError: A page request failed
+        """
+        def fetch(cursor):
+            response = self.get_transaction_list(address, account_id, chain_index,
+                                                 tx_status, order_id, cursor, limit)
+            return cursor_page(check_response(response), "orders")
+
+        return iter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
+
+    def iter_sui_objects(self, chain_index: str, address: str, token_address: str,
+                         limit: str = "50", max_buffered_pages: int = 2) -> Iterator[Dict]:
+        """
+        Iterate over all SUI objects of an address, fetching the next page ahead
+
+        Args:
+            chain_index: Chain index
+            address: Wallet address
+            token_address: Token contract address
+            limit: Number of results per page (default: "50")
+            max_buffered_pages: Pages allowed to wait for the consumer
+
+        Raises:
+            OKXAPIError: A page request failed
+        """
+        def fetch(cursor):
+            response = self.get_sui_objects(chain_index, address, token_address, limit, cursor)
+            return cursor_page(check_response(response))
+
+        return iter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
+
+
+class AsyncWalletClient(AsyncBaseClient, WalletClient):
+    """
+    Asyncio flavour of :class:`WalletClient`
+
+    Every endpoint method returns an awaitable resolved through a
+    non-blocking :class:`~okxpy.utils.http.AsyncHTTPTransport`.
+    """
+
+    async def prepare_transaction(self, chain_index: str, from_addr: str, to_addr: str,
+                                  amount: str = "0", ext_json: Optional[Dict] = None,
+                                  nonces=None, gas_oracle=None) -> PreparedTransaction:
+        """Concurrent pre-transaction calls as one bundle, see WalletClient.prepare_transaction"""
+        gas_price = gas_oracle.latest(chain_index) if gas_oracle is not None else None
+        calls = preparation_calls(self, chain_index, from_addr, to_addr, amount, ext_json, nonces,
+                                  gas_price=gas_price is None, is_async=True)
+        results, errors = {}, {}
+        async for _, (name, _), result, error in aiter_concurrent(lambda call: call[1](), calls,
+                                                                  max_concurrency=len(calls)):
+            if error is None:
+                results[name] = result
+            else:
+                errors[name] = error
+        prepared = PreparedTransaction(chain_index, from_addr, to_addr, amount, ext_json)
+        prepared.gas_price = gas_price
+        return merge_results(prepared, results, errors, nonces)
+
+    def iter_transactions(self, address: Optional[str] = None,
+                          account_id: Optional[str] = None,
+                          chain_index: Optional[str] = None,
+                          tx_status: Optional[str] = None,
+                          order_id: Optional[str] = None,
+                          limit: str = "20",
+                          max_buffered_pages: int = 2) -> AsyncIterator[Dict]:
+        """Async iterator over all broadcasted transactions, see WalletClient.iter_transactions"""
+        async def fetch(cursor):
+            response = await self.get_transaction_list(address, account_id, chain_index,
+                                                       tx_status, order_id, cursor, limit)
+            return cursor_page(check_response(response), "orders")
+
+        return aiter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
+
+    def iter_sui_objects(self, chain_index: str, address: str, token_address: str,
+                         limit: str = "50", max_buffered_pages: int = 2) -> AsyncIterator[Dict]:
+        """Async iterator over all SUI objects of an address, see WalletClient.iter_sui_objects"""
+        async def fetch(cursor):
+            response = await self.get_sui_objects(chain_index, address, token_address, limit, cursor)
+            return cursor_page(check_response(response))
+
+        return aiter_prefetched(fetch, max_buffered_pages=max_buffered_pages)
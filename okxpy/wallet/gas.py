@@ -0,0 +1,308 @@
+"""
+OKX Gas Oracle
+~~~~~~~~~~~~~~
+
+Background refresh of gas prices per chain. Senders read the latest value
+from memory, so gas-price traffic scales with the number of chains rather
+than with transaction volume.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..exceptions import check_response
+from ..utils.concurrency import aiter_concurrent, iter_concurrent
+
+# callback(chain_index, previous gas price payload, new gas price payload)
+GasCallback = Callable[[str, Any, Any], None]
+
+
+class _ChainGas:
+    """Latest price and refresh schedule of one chain"""
+
+    __slots__ = ("value", "price", "updated_at", "interval", "due", "refreshes", "errors", "last_error")
+
+    def __init__(self, interval: float):
+        self.value: Any = None
+        self.price: Optional[int] = None
+        self.updated_at: Optional[float] = None
+        self.interval = interval
+        self.due = 0.0
+        self.refreshes = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+
+
+class _Subscription:
+    __slots__ = ("callback", "chains", "threshold", "baseline")
+
+    def __init__(self, callback: GasCallback, chains: Optional[Iterable[str]], threshold: float):
+        self.callback = callback
+        self.chains = set(chains) if chains is not None else None
+        self.threshold = threshold
+        # Price each chain had when this subscriber was last notified
+        self.baseline: Dict[str, int] = {}
+
+
+def _relative_change(old: Optional[int], new: Optional[int]) -> float:
+    if old is None or new is None:
+        return 0.0
+    if old == 0:
+        return 0.0 if new == 0 else float("inf")
+    return abs(new - old) / old
+
+
+class GasOracle:
+    """
+    Keep the gas price of a set of chains fresh in the background
+
+    Each chain is refreshed on its own schedule: the interval halves (down to
+    ``min_interval``) while the price moves by ``volatility`` or more between
+    refreshes and grows by half (up to ``max_interval``) while it is flat.
+    Failed refreshes keep the last value and back off like a flat price.
+    :meth:`latest` never touches the network. Run it in a daemon thread with
+    :meth:`start` (or as a context manager) for a WalletClient, or as an
+    asyncio task with :meth:`astart` for an AsyncWalletClient.
+
+    Example::
+
+        oracle = GasOracle(client.wallet, ["1", "56"])
+        oracle.subscribe(lambda chain, old, new: print(chain, new["normal"]), threshold=0.1)
+        with oracle:
+            gas = oracle.latest("1")
+    """
+
+    def __init__(self, wallet, chains: Iterable[str] = (), min_interval: float = 2.0,
+                 max_interval: float = 30.0, volatility: float = 0.01, field: str = "normal"):
+        """
+        Args:
+            wallet: WalletClient or AsyncWalletClient used to fetch prices
+            chains: Chain indexes to track
+            min_interval: Shortest seconds between refreshes of a moving chain
+            max_interval: Longest seconds between refreshes of a flat chain
+            volatility: Relative price change counting as movement
+            field: Gas price field compared between refreshes
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        self.wallet = wallet
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.volatility = volatility
+        self.field = field
+        self.callback_errors = 0
+        self._chains: Dict[str, _ChainGas] = {}
+        self._subscriptions: List[_Subscription] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task = None
+        for chain_index in chains:
+            self.add_chain(chain_index)
+
+    def add_chain(self, chain_index: str) -> None:
+        """Start tracking a chain; it is refreshed on the next tick"""
+        with self._lock:
+            if chain_index not in self._chains:
+                self._chains[chain_index] = _ChainGas(self.min_interval)
+        self._wake.set()
+
+    def remove_chain(self, chain_index: str) -> None:
+        with self._lock:
+            self._chains.pop(chain_index, None)
+
+    @property
+    def chains(self) -> List[str]:
+        return list(self._chains)
+
+    def latest(self, chain_index: str) -> Optional[Any]:
+        """Last fetched gas price payload of a chain, None before the first refresh"""
+        state = self._chains.get(chain_index)
+        return state.value if state is not None else None
+
+    def price(self, chain_index: str) -> Optional[int]:
+        """Last fetched value of the tracked field as an integer"""
+        state = self._chains.get(chain_index)
+        return state.price if state is not None else None
+
+    def age(self, chain_index: str) -> Optional[float]:
+        """Seconds since the chain's price was last refreshed"""
+        state = self._chains.get(chain_index)
+        if state is None or state.updated_at is None:
+            return None
+        return time.monotonic() - state.updated_at
+
+    def subscribe(self, callback: GasCallback, chains: Optional[Iterable[str]] = None,
+                  threshold: float = 0.05) -> Callable[[], None]:
+        """
+        Call callback(chain_index, old, new) when a price moves by threshold or more
+
+        The change is measured against the price the subscriber was last
+        notified of, so slow drift also fires once it adds up.
+
+        Args:
+            callback: Receives the chain index and the previous and new payloads
+            chains: Only notify for these chains (default: all)
+            threshold: Relative change that triggers a notification
+
+        Returns:
+            Function removing the subscription
+        """
+        subscription = _Subscription(callback, chains, threshold)
+        with self._lock:
+            for chain_index, state in self._chains.items():
+                if state.price is not None:
+                    subscription.baseline[chain_index] = state.price
+            self._subscriptions.append(subscription)
+
+        def unsubscribe():
+            with self._lock:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+        return unsubscribe
+
+    def _parse(self, response: Dict) -> Any:
+        return check_response(response)["data"][0]
+
+    def _price(self, value: Any) -> Optional[int]:
+        raw = value.get(self.field) if value is not None else None
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            return None
+
+    def _update(self, chain_index: str, value: Any = None, error: Optional[BaseException] = None) -> None:
+        """Record a refresh outcome, reschedule the chain and notify subscribers"""
+        now = time.monotonic()
+        notify = []
+        with self._lock:
+            state = self._chains.get(chain_index)
+            if state is None:
+                return
+            state.refreshes += 1
+            if error is not None:
+                state.errors += 1
+                state.last_error = error
+                state.interval = min(self.max_interval, state.interval * 1.5)
+                state.due = now + state.interval
+                return
+
+            previous, old_price = state.value, state.price
+            price = self._price(value)
+            if old_price is not None and _relative_change(old_price, price) >= self.volatility:
+                state.interval = max(self.min_interval, state.interval / 2)
+            else:
+                state.interval = min(self.max_interval, state.interval * 1.5)
+            state.value, state.price, state.updated_at = value, price, now
+            state.due = now + state.interval
+
+            for subscription in self._subscriptions:
+                if subscription.chains is not None and chain_index not in subscription.chains:
+                    continue
+                baseline = subscription.baseline.get(chain_index)
+                if baseline is None or price is None:
+                    if price is not None:
+                        subscription.baseline[chain_index] = price
+                    continue
+                if _relative_change(baseline, price) >= subscription.threshold:
+                    subscription.baseline[chain_index] = price
+                    notify.append(subscription.callback)
+
+        for callback in notify:
+            try:
+                callback(chain_index, previous, value)
+            except Exception:
+                # A failing subscriber must not stop the refresh loop
+                self.callback_errors += 1
+
+    def _due(self) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            return [chain_index for chain_index, state in self._chains.items() if state.due <= now]
+
+    def _wait_time(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            if not self._chains:
+                return self.max_interval
+            return max(0.0, min(state.due for state in self._chains.values()) - now)
+
+    def refresh(self, chain_indexes: Optional[Iterable[str]] = None) -> None:
+        """Fetch the price of the given chains (default: those due) concurrently"""
+        chain_indexes = list(self._due() if chain_indexes is None else chain_indexes)
+        if not chain_indexes:
+            return
+        fetch = lambda chain_index: self._parse(self.wallet.get_gas_price(chain_index))
+        for _, chain_index, value, error in iter_concurrent(fetch, chain_indexes,
+                                                            max_concurrency=len(chain_indexes)):
+            self._update(chain_index, value, error)
+
+    async def arefresh(self, chain_indexes: Optional[Iterable[str]] = None) -> None:
+        """Async variant of refresh() for an AsyncWalletClient"""
+        chain_indexes = list(self._due() if chain_indexes is None else chain_indexes)
+        if not chain_indexes:
+            return
+
+        async def fetch(chain_index):
+            return self._parse(await self.wallet.get_gas_price(chain_index))
+
+        async for _, chain_index, value, error in aiter_concurrent(fetch, chain_indexes,
+                                                                   max_concurrency=len(chain_indexes)):
+            self._update(chain_index, value, error)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._wake.wait(self._wait_time())
+            self._wake.clear()
+
+    def start(self) -> "GasOracle":
+        """Refresh in a daemon thread until stop()"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="okxpy-gas-oracle", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread or task"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        """Refresh loop for an AsyncWalletClient; runs until cancelled or stop()"""
+        import asyncio
+        while not self._stop.is_set():
+            await self.arefresh()
+            # Wake at least every min_interval so added chains and stop() are noticed
+            await asyncio.sleep(min(self._wait_time(), self.min_interval))
+
+    def astart(self):
+        """Schedule run() as an asyncio task on the running loop and return it"""
+        import asyncio
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            chains = {chain_index: {"price": state.price, "interval": state.interval,
+                                    "refreshes": state.refreshes, "errors": state.errors}
+                      for chain_index, state in self._chains.items()}
+        return {"chains": chains, "subscriptions": len(self._subscriptions),
+                "callback_errors": self.callback_errors}
+
+    def __enter__(self) -> "GasOracle":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,94 @@
+"""
+OKX Wallet Response Models
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+from ..utils.codec import Model
+
+
+class Eip1559Fees(Model):
+    """EIP-1559 fee levels"""
+
+    __slots__ = ("base_fee", "propose_priority_fee", "safe_priority_fee", "fast_priority_fee")
+    FIELDS = {
+        "base_fee": "baseFee",
+        "propose_priority_fee": "proposePriorityFee",
+        "safe_priority_fee": "safePriorityFee",
+        "fast_priority_fee": "fastPriorityFee",
+    }
+
+
+class GasPrice(Model):
+    """Gas price levels of a chain"""
+
+    __slots__ = ("normal", "min", "max", "support_eip1559", "eip1559_protocol")
+    FIELDS = {
+        "normal": "normal",
+        "min": "min",
+        "max": "max",
+        "support_eip1559": "supporteip1559",
+        "eip1559_protocol": ("eip1559Protocol", Eip1559Fees),
+    }
+
+
+class Nonce(Model):
+    """Confirmed and pending nonce of an address"""
+
+    __slots__ = ("nonce", "pending_nonce")
+    FIELDS = {
+        "nonce": "nonce",
+        "pending_nonce": "pendingNonce",
+    }
+
+
+class SignInfo(Model):
+    """Data needed to sign a transaction"""
+
+    __slots__ = ("gas_limit", "nonce", "gas_price", "normal_gas_price", "eip1559_protocol",
+                 "recent_block_hash", "last_valid_block_height", "fee", "extra")
+    FIELDS = {
+        "gas_limit": "gasLimit",
+        "nonce": "nonce",
+        "gas_price": ("gasPrice", GasPrice),
+        "normal_gas_price": "normalGasPrice",
+        "eip1559_protocol": ("eip1559Protocol", Eip1559Fees),
+        "recent_block_hash": "recentBlockHash",
+        "last_valid_block_height": "lastValidBlockHeight",
+        "fee": "fee",
+        "extra": "extra",
+    }
+
+
+class BroadcastResult(Model):
+    """Result of broadcasting a signed transaction"""
+
+    __slots__ = ("order_id",)
+    FIELDS = {"order_id": "orderId"}
+
+
+class TransactionOrder(Model):
+    """Broadcasted transaction order"""
+
+    __slots__ = ("order_id", "tx_hash", "chain_index", "address", "account_id",
+                 "tx_status", "fail_reason", "created_at", "updated_at")
+    FIELDS = {
+        "order_id": "orderId",
+        "tx_hash": "txHash",
+        "chain_index": "chainIndex",
+        "address": "address",
+        "account_id": "accountId",
+        "tx_status": "txStatus",
+        "fail_reason": "failReason",
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+    }
+
+
+class TransactionPage(Model):
+    """One page of broadcasted transaction orders"""
+
+    __slots__ = ("cursor", "orders")
+    FIELDS = {
+        "cursor": "cursor",
+        "orders": ("orders", [TransactionOrder]),
+    }
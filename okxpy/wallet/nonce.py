@@ -0,0 +1,288 @@
+"""
+OKX Nonce Manager
+~~~~~~~~~~~~~~~~~
+
+Local nonce allocation per (chainIndex, address): the account nonce is
+fetched once, then every send takes the next one without a round trip.
+"""
+
+import heapq
+import sys
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from ..exceptions import OKXAPIError, check_response
+
+
+# Broadcast error messages meaning the local counter no longer matches the chain
+NONCE_ERROR_MARKERS = (
+    "nonce too low",
+    "nonce too high",
+    "nonce gap",
+    "invalid nonce",
+    "already known",
+    "known transaction",
+    "replacement transaction underpriced",
+)
+
+# Response codes that leave open whether the broadcast was accepted
+UNKNOWN_OUTCOME_CODES = frozenset({"500", "502", "503", "504"})
+
+
+def _transport_error(error: BaseException) -> Optional[bool]:
+    """
+    Classify a transport exception
+
+    Returns:
+        True if it was raised before the request was sent, False if the
+        request may have gone out, None if error is not a transport error
+    """
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(error, requests.exceptions.RequestException):
+        from ..utils.http import _is_connect_error
+        return _is_connect_error(error)
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+    return None
+
+
+def is_nonce_error(response: Any = None, error: Optional[BaseException] = None) -> bool:
+    """True if a failed broadcast was rejected because of its nonce"""
+    if error is not None:
+        message = str(error)
+    elif response is not None and response.get("code") != "0":
+        message = str(response.get("msg", ""))
+    else:
+        return False
+    message = message.lower()
+    return any(marker in message for marker in NONCE_ERROR_MARKERS)
+
+
+def _outcome_unknown(response: Any = None, error: Optional[BaseException] = None) -> bool:
+    """True if a failed broadcast may still have been accepted"""
+    if error is not None:
+        if isinstance(error, OKXAPIError):
+            return error.code in UNKNOWN_OUTCOME_CODES
+        return _transport_error(error) is False
+    return response is not None and str(response.get("code")) in UNKNOWN_OUTCOME_CODES
+
+
+class _AccountNonces:
+    """Counter and released nonces of one (chainIndex, address)"""
+
+    __slots__ = ("next", "free", "reserved", "fetch_lock", "async_fetch_lock")
+
+    def __init__(self):
+        self.next: Optional[int] = None
+        self.free: List[int] = []
+        # Nonces held by reserve() blocks, True once their outcome was reported
+        self.reserved: Dict[int, bool] = {}
+        self.fetch_lock = threading.Lock()
+        self.async_fetch_lock = None
+
+
+class NonceManager:
+    """
+    Hand out increasing nonces per (chainIndex, address) from a local counter
+
+    The first request for an account fetches its pending nonce with
+    :meth:`WalletClient.get_nonce`; later ones are served from memory, so
+    concurrent senders of one hot wallet never collide. Nonces of sends that
+    were rejected or never went out are released and handed out again before
+    the counter advances. Only a rejection naming the nonce (too low, gap,
+    already known) drops the account's state so the next request resyncs
+    from the API: a refetched pending nonce does not count nonces other
+    senders hold but have not broadcast yet. Timeouts and 5xx responses may
+    hide an accepted transaction, so their nonce stays used; if it was not,
+    the next broadcast reports the gap. Safe to share between threads; use
+    the ``a``-prefixed methods with an AsyncWalletClient.
+
+    Example::
+
+        nonces = NonceManager(client.wallet)
+        with nonces.reserve("1", address) as nonce:
+            signed = sign(tx, nonce)
+            response = client.wallet.broadcast_transaction(signed, "1", address)
+            nonces.report("1", address, nonce, response)
+    """
+
+    def __init__(self, wallet, use_pending: bool = True):
+        """
+        Args:
+            wallet: WalletClient or AsyncWalletClient used to fetch nonces
+            use_pending: Start from the pending nonce (counting mempool
+                transactions) rather than the confirmed one
+        """
+        self.wallet = wallet
+        self.use_pending = use_pending
+        self.fetches = 0
+        self.resyncs = 0
+        self._accounts: Dict[Tuple[str, str], _AccountNonces] = {}
+        self._lock = threading.Lock()
+
+    def _account(self, chain_index: str, address: str) -> _AccountNonces:
+        key = (chain_index, address.lower())
+        account = self._accounts.get(key)
+        if account is None:
+            with self._lock:
+                account = self._accounts.setdefault(key, _AccountNonces())
+        return account
+
+    def _parse(self, response: Dict) -> int:
+        data = check_response(response)["data"][0]
+        value = data.get("pendingNonce") if self.use_pending else None
+        return int(value if value not in (None, "") else data["nonce"])
+
+    def _take(self, account: _AccountNonces) -> Optional[int]:
+        """Next nonce of a synced account, None if it must be fetched first"""
+        with self._lock:
+            if account.next is None:
+                return None
+            if account.free:
+                return heapq.heappop(account.free)
+            nonce = account.next
+            account.next += 1
+            return nonce
+
+    def _synced(self, account: _AccountNonces, nonce: int) -> int:
+        with self._lock:
+            self.fetches += 1
+            if account.next is None:
+                account.next = nonce
+                account.free = []
+        return self._take(account)
+
+    def next(self, chain_index: str, address: str) -> int:
+        """
+        Allocate the next nonce of an account
+
+        Raises:
+            OKXAPIError: The initial get_nonce call failed
+        """
+        account = self._account(chain_index, address)
+        nonce = self._take(account)
+        while nonce is None:
+            # One caller fetches; the others wait and then take from the counter
+            with account.fetch_lock:
+                nonce = self._take(account)
+                if nonce is None:
+                    nonce = self._synced(account, self._parse(self.wallet.get_nonce(chain_index, address)))
+        return nonce
+
+    async def anext(self, chain_index: str, address: str) -> int:
+        """Async variant of next() for an AsyncWalletClient"""
+        import asyncio
+        account = self._account(chain_index, address)
+        nonce = self._take(account)
+        while nonce is None:
+            if account.async_fetch_lock is None:
+                account.async_fetch_lock = asyncio.Lock()
+            async with account.async_fetch_lock:
+                nonce = self._take(account)
+                if nonce is None:
+                    response = await self.wallet.get_nonce(chain_index, address)
+                    nonce = self._synced(account, self._parse(response))
+        return nonce
+
+    def release(self, chain_index: str, address: str, nonce: int) -> None:
+        """Return the nonce of a send that did not go through, to be handed out again"""
+        account = self._account(chain_index, address)
+        with self._lock:
+            if account.next is not None and nonce < account.next and nonce not in account.free:
+                heapq.heappush(account.free, nonce)
+
+    def resync(self, chain_index: str, address: str) -> None:
+        """Forget the local counter so the next allocation fetches it from the API"""
+        account = self._account(chain_index, address)
+        with self._lock:
+            account.next = None
+            account.free = []
+            self.resyncs += 1
+
+    def report(self, chain_index: str, address: str, nonce: int,
+               response: Any = None, error: Optional[BaseException] = None) -> bool:
+        """
+        Account for the outcome of a broadcast that used nonce
+
+        Nonce errors resync the account. Failures that may hide an accepted
+        transaction (timeouts, 5xx) keep the nonce used; every other failure
+        releases it.
+
+        Args:
+            chain_index: Chain index of the transaction
+            address: Sender address
+            nonce: Nonce the transaction was signed with
+            response: broadcast_transaction response, a dict or an ApiResponse
+            error: Exception raised instead of a response
+
+        Returns:
+            True if the broadcast succeeded
+        """
+        account = self._account(chain_index, address)
+        with self._lock:
+            if nonce in account.reserved:
+                account.reserved[nonce] = True
+        if error is None and response is not None and response.get("code") == "0":
+            return True
+        if is_nonce_error(response, error):
+            self.resync(chain_index, address)
+        elif not _outcome_unknown(response, error):
+            self.release(chain_index, address, nonce)
+        return False
+
+    def _reserved(self, chain_index: str, address: str, nonce: int) -> None:
+        account = self._account(chain_index, address)
+        with self._lock:
+            account.reserved[nonce] = False
+
+    def _unreserve(self, chain_index: str, address: str, nonce: int,
+                   error: Optional[BaseException]) -> None:
+        """End a reserve() block; an unreported nonce is accounted for by the error it raised"""
+        account = self._account(chain_index, address)
+        with self._lock:
+            reported = account.reserved.pop(nonce, True)
+        if error is not None and not reported:
+            self.report(chain_index, address, nonce, error=error)
+
+    @contextmanager
+    def reserve(self, chain_index: str, address: str) -> Iterator[int]:
+        """
+        Allocate a nonce for a block that signs and broadcasts with it
+
+        If the block raises before report() was called, the error decides:
+        a failure before the broadcast (signing, validation) releases the
+        nonce, a failed broadcast is handled as by report().
+        """
+        nonce = self.next(chain_index, address)
+        self._reserved(chain_index, address, nonce)
+        error = None
+        try:
+            yield nonce
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._unreserve(chain_index, address, nonce, error)
+
+    @asynccontextmanager
+    async def areserve(self, chain_index: str, address: str) -> AsyncIterator[int]:
+        """Async variant of reserve()"""
+        nonce = await self.anext(chain_index, address)
+        self._reserved(chain_index, address, nonce)
+        error = None
+        try:
+            yield nonce
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._unreserve(chain_index, address, nonce, error)
+
+    def peek(self, chain_index: str, address: str) -> Optional[int]:
+        """Nonce the counter would hand out next (ignoring released ones), None if not synced"""
+        return self._account(chain_index, address).next
+
+    def stats(self) -> Dict[str, Any]:
+        return {"accounts": len(self._accounts), "fetches": self.fetches, "resyncs": self.resyncs}
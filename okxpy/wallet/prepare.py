@@ -0,0 +1,174 @@
+"""
+OKX Transaction Preparation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Bundle of everything needed to sign a transaction, gathered from the
+pre-transaction endpoints in one concurrent round.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions import OKXAPIError, OKXError
+
+# Pre-transaction calls made by prepare_transaction, in bundle order
+PREPARE_CALLS = ("sign_info", "gas_price", "gas_limit", "nonce")
+
+
+class PreparationError(OKXError):
+    """One or more pre-transaction calls failed"""
+
+    def __init__(self, prepared: "PreparedTransaction"):
+        failures = ", ".join(f"{name}: {error}" for name, error in prepared.errors.items())
+        super().__init__(f"Transaction preparation failed ({failures})")
+        self.prepared = prepared
+        self.errors = prepared.errors
+
+
+class PreparedTransaction:
+    """
+    Merged results of sign-info, gas-price, gas-limit and nonce for one transfer
+
+    ``gas_price``, ``gas_limit`` and ``nonce`` prefer their dedicated
+    endpoints and fall back to the sign-info payload, so a bundle can still be
+    ``complete`` when one of those calls failed. ``errors`` maps each failed
+    call to its exception.
+    """
+
+    __slots__ = ("chain_index", "from_addr", "to_addr", "amount", "ext_json",
+                 "sign_info", "gas_price", "gas_limit", "nonce", "errors")
+
+    def __init__(self, chain_index: str, from_addr: str, to_addr: str, amount: str,
+                 ext_json: Optional[Dict] = None):
+        self.chain_index = chain_index
+        self.from_addr = from_addr
+        self.to_addr = to_addr
+        self.amount = amount
+        self.ext_json = ext_json
+        self.sign_info: Optional[Any] = None
+        self.gas_price: Optional[Any] = None
+        self.gas_limit: Optional[str] = None
+        self.nonce: Optional[int] = None
+        self.errors: Dict[str, BaseException] = {}
+
+    @property
+    def ok(self) -> bool:
+        """True if every call succeeded"""
+        return not self.errors
+
+    @property
+    def complete(self) -> bool:
+        """True if gas price, gas limit and nonce are all known"""
+        return self.gas_price is not None and self.gas_limit is not None and self.nonce is not None
+
+    @property
+    def failed(self) -> List[str]:
+        """Names of the calls that failed"""
+        return list(self.errors)
+
+    def raise_for_errors(self) -> "PreparedTransaction":
+        """Return self, or raise PreparationError if any call failed"""
+        if self.errors:
+            raise PreparationError(self)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"chainIndex": self.chain_index, "fromAddr": self.from_addr, "toAddr": self.to_addr,
+                "txAmount": self.amount, "gasLimit": self.gas_limit, "nonce": self.nonce,
+                "gasPrice": _unwrap(self.gas_price), "signInfo": _unwrap(self.sign_info),
+                "errors": {name: str(error) for name, error in self.errors.items()}}
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else f"failed={self.failed}"
+        return (f"<PreparedTransaction chain={self.chain_index} nonce={self.nonce} "
+                f"gas_limit={self.gas_limit} {state}>")
+
+
+def _unwrap(value: Any) -> Any:
+    return value.to_dict() if hasattr(value, "to_dict") else value
+
+
+def _first(response: Any) -> Any:
+    """First data item of a response, raising for errors and empty payloads"""
+    if response.get("code") != "0":
+        raise OKXAPIError.from_response(response)
+    data = response.get("data")
+    if not data:
+        raise OKXAPIError(str(response.get("code")), "empty data", response)
+    return data[0]
+
+
+def _int(value: Any) -> Optional[int]:
+    return int(value) if value not in (None, "") else None
+
+
+def preparation_calls(wallet, chain_index: str, from_addr: str, to_addr: str, amount: str,
+                      ext_json: Optional[Dict], nonces=None, gas_price: bool = True,
+                      is_async: bool = False) -> List[Tuple[str, Callable]]:
+    """(name, zero-argument call) pairs issued by prepare_transaction"""
+    if nonces is None:
+        nonce_call = lambda: wallet.get_nonce(chain_index, from_addr)
+    elif is_async:
+        nonce_call = lambda: nonces.anext(chain_index, from_addr)
+    else:
+        nonce_call = lambda: nonces.next(chain_index, from_addr)
+    calls = [
+        ("sign_info", lambda: wallet.get_sign_info(chain_index, from_addr, to_addr, amount, ext_json)),
+        ("gas_price", lambda: wallet.get_gas_price(chain_index)),
+        ("gas_limit", lambda: wallet.get_gas_limit(chain_index, from_addr, to_addr, amount, ext_json)),
+        ("nonce", nonce_call),
+    ]
+    return calls if gas_price else [call for call in calls if call[0] != "gas_price"]
+
+
+def merge_results(prepared: PreparedTransaction, results: Dict[str, Any],
+                  errors: Dict[str, BaseException], nonces=None) -> PreparedTransaction:
+    """
+    Fill a bundle from the outcome of each preparation call
+
+    Args:
+        prepared: Bundle to fill
+        results: Response (or allocated nonce) of each successful call
+        errors: Exception raised by each failed call
+        nonces: NonceManager that allocated the nonce; it is released when
+            another call failed, so a failed bundle leaves no nonce gap
+    """
+    allocated = None
+    for name in PREPARE_CALLS:
+        if name in errors:
+            prepared.errors[name] = errors[name]
+            continue
+        if name not in results:
+            continue  # not requested, e.g. gas price taken from a GasOracle
+        result = results[name]
+        if name == "nonce" and isinstance(result, int):
+            prepared.nonce = allocated = result  # allocated by a NonceManager
+            continue
+        try:
+            item = _first(result)
+        except OKXAPIError as e:
+            prepared.errors[name] = e
+            continue
+        if name == "sign_info":
+            prepared.sign_info = item
+        elif name == "gas_price":
+            prepared.gas_price = item
+        elif name == "gas_limit":
+            prepared.gas_limit = item.get("gasLimit")
+        else:
+            pending = item.get("pendingNonce")
+            prepared.nonce = _int(pending if pending not in (None, "") else item.get("nonce"))
+
+    released = allocated is not None and bool(prepared.errors) and nonces is not None
+    if released:
+        nonces.release(prepared.chain_index, prepared.from_addr, allocated)
+        prepared.nonce = None
+
+    sign_info = prepared.sign_info
+    if sign_info is not None:
+        if prepared.gas_price is None:
+            prepared.gas_price = sign_info.get("gasPrice")
+        if prepared.gas_limit is None:
+            prepared.gas_limit = sign_info.get("gasLimit")
+        if prepared.nonce is None and not released:
+            prepared.nonce = _int(sign_info.get("nonce"))
+    return prepared
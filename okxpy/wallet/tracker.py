@@ -0,0 +1,350 @@
+"""
+OKX Transaction Tracker
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Follow broadcasted orders until they succeed or fail. Pending orders are
+grouped per (chainIndex, address) and each group is polled with one
+paginated ``post-transaction/orders`` query, so polling cost grows with the
+number of active addresses rather than with transactions in flight. Orders
+the paged scan cannot reach are looked up by orderId.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions import check_response
+from ..utils.concurrency import aiter_concurrent, iter_concurrent
+from ..utils.paginate import cursor_page
+
+# txStatus values of post-transaction/orders
+PENDING = "1"
+SUCCESS = "2"
+FAILED = "3"
+FINAL_STATUSES = (SUCCESS, FAILED)
+
+GroupKey = Tuple[str, str]
+OrderCallback = Callable[[Any], None]
+
+# Orders may be indexed slightly before the local submission time
+_CLOCK_SLACK_MS = 60000
+
+
+class _Tracked:
+    __slots__ = ("order_id", "future", "callback", "since", "submitted_ms", "status")
+
+    def __init__(self, order_id: str, callback: Optional[OrderCallback]):
+        self.order_id = order_id
+        self.future = Future()
+        self.callback = callback
+        self.since = time.monotonic()
+        self.submitted_ms = int(time.time() * 1000)
+        self.status: Optional[str] = None
+
+
+class _Group:
+    """Tracked orders of one (chainIndex, address) and their polling schedule"""
+
+    __slots__ = ("chain_index", "address", "orders", "interval", "due", "polling")
+
+    def __init__(self, chain_index: str, address: str, interval: float):
+        self.chain_index = chain_index
+        self.address = address
+        self.orders: Dict[str, _Tracked] = {}
+        self.interval = interval
+        self.due = 0.0
+        self.polling = False
+
+
+class TransactionTracker:
+    """
+    Resolve futures and callbacks when broadcasted orders reach a final state
+
+    :meth:`track` returns a :class:`concurrent.futures.Future` resolving to
+    the order payload once its ``txStatus`` is SUCCESS or FAILED (check the
+    status: a failed transaction resolves, it does not raise), or failing
+    with TimeoutError after ``expire_after`` seconds. Each group is polled
+    every ``min_interval`` seconds after an order was added or settled, and
+    backs off by ``backoff`` per poll without progress up to
+    ``max_interval``, so long-pending orders cost less and less. Run it in a
+    daemon thread with :meth:`start` (or as a context manager) for a
+    WalletClient, or as an asyncio task with :meth:`astart` for an
+    AsyncWalletClient (await futures with ``asyncio.wrap_future``).
+
+    Example::
+
+        with TransactionTracker(client.wallet) as tracker:
+            future = tracker.track(order_id, "1", address)
+            order = future.result(timeout=300)
+    """
+
+    def __init__(self, wallet, min_interval: float = 1.0, max_interval: float = 30.0,
+                 backoff: float = 1.5, expire_after: float = 3600.0, page_size: int = 100,
+                 max_concurrency: int = 8):
+        """
+        Args:
+            wallet: WalletClient or AsyncWalletClient used to poll
+            min_interval: Seconds between polls of a group with fresh activity
+            max_interval: Longest seconds between polls of a group
+            backoff: Interval growth factor per poll that settled nothing
+            expire_after: Seconds after which an unsettled order fails with TimeoutError
+            page_size: Orders per post-transaction/orders page
+            max_concurrency: Groups polled at the same time
+        """
+        if min_interval <= 0 or max_interval < min_interval or backoff < 1:
+            raise ValueError("need 0 < min_interval <= max_interval and backoff >= 1")
+        self.wallet = wallet
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.expire_after = expire_after
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.polls = 0
+        self.requests = 0
+        self.resolved = 0
+        self.expired = 0
+        self.callback_errors = 0
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task = None
+
+    def track(self, order_id: str, chain_index: str, address: str,
+              callback: Optional[OrderCallback] = None) -> Future:
+        """
+        Follow an order until it succeeds or fails
+
+        A group's pages are read back to about a minute before its oldest
+        tracked order; orders older than that (tracked late, or created
+        under clock skew) are then queried by orderId, one request each.
+
+        Args:
+            order_id: orderId returned by broadcast_transaction
+            chain_index: Chain index of the transaction
+            address: Sender address
+            callback: Optional callback(order) called on the final state
+
+        Returns:
+            Future resolving to the final order payload
+        """
+        key = (chain_index, address.lower())
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group(chain_index, address, self.min_interval)
+            tracked = group.orders.get(order_id)
+            if tracked is None:
+                tracked = group.orders[order_id] = _Tracked(order_id, callback)
+            # New activity: poll this group soon again
+            group.interval = self.min_interval
+            group.due = min(group.due, time.monotonic() + self.min_interval)
+        self._wake.set()
+        return tracked.future
+
+    def pending(self) -> int:
+        """Number of orders not settled yet"""
+        with self._lock:
+            return sum(len(group.orders) for group in self._groups.values())
+
+    def _claim_due(self) -> List[_Group]:
+        now = time.monotonic()
+        with self._lock:
+            due = [group for group in self._groups.values()
+                   if group.orders and not group.polling and group.due <= now]
+            for group in due:
+                group.polling = True
+            return due
+
+    def _wait_time(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            dues = [group.due for group in self._groups.values() if group.orders]
+        return max(0.0, min(dues) - now) if dues else self.max_interval
+
+    def _query(self, group: _Group) -> Tuple[Dict[str, int], Dict]:
+        """Page bounds of a group poll: wanted order ids and the request parameters"""
+        with self._lock:
+            wanted = {order_id: tracked.submitted_ms for order_id, tracked in group.orders.items()}
+        return wanted, {"address": group.address, "chain_index": group.chain_index,
+                        "limit": str(self.page_size)}
+
+    @staticmethod
+    def _scan(orders: List[Any], wanted: Dict[str, int], found: Dict[str, Any]) -> bool:
+        """Collect wanted orders from a page; True once further pages cannot hold any"""
+        oldest = min(wanted.values()) - _CLOCK_SLACK_MS
+        exhausted = False
+        for order in orders:
+            order_id = order.get("orderId")
+            if order_id in wanted:
+                found[order_id] = order
+            created = order.get("createdAt")
+            if created not in (None, "") and int(created) < oldest:
+                exhausted = True  # pages run newest first
+        return exhausted or len(found) == len(wanted)
+
+    @staticmethod
+    def _pick(response: Dict, order_id: str, found: Dict[str, Any]) -> None:
+        """Collect order_id from an orderId-filtered page"""
+        for order in cursor_page(check_response(response), "orders")[0]:
+            if order.get("orderId") == order_id:
+                found[order_id] = order
+
+    def _poll(self, group: _Group) -> Dict[str, Any]:
+        """Fetch the current state of a group's tracked orders"""
+        wanted, query = self._query(group)
+        found: Dict[str, Any] = {}
+        cursor = None
+        while True:
+            response = self.wallet.get_transaction_list(cursor=cursor, **query)
+            self.requests += 1
+            orders, cursor = cursor_page(check_response(response), "orders")
+            if self._scan(orders, wanted, found) or cursor is None:
+                break
+        if cursor is not None:
+            # The scan stopped at its time bound before reaching these
+            for order_id in wanted.keys() - found.keys():
+                response = self.wallet.get_transaction_list(order_id=order_id, **query)
+                self.requests += 1
+                self._pick(response, order_id, found)
+        return found
+
+    async def _apoll(self, group: _Group) -> Dict[str, Any]:
+        wanted, query = self._query(group)
+        found: Dict[str, Any] = {}
+        cursor = None
+        while True:
+            response = await self.wallet.get_transaction_list(cursor=cursor, **query)
+            self.requests += 1
+            orders, cursor = cursor_page(check_response(response), "orders")
+            if self._scan(orders, wanted, found) or cursor is None:
+                break
+        if cursor is not None:
+            for order_id in wanted.keys() - found.keys():
+                response = await self.wallet.get_transaction_list(order_id=order_id, **query)
+                self.requests += 1
+                self._pick(response, order_id, found)
+        return found
+
+    def _settle(self, group: _Group, found: Optional[Dict[str, Any]]) -> None:
+        """Resolve final orders of a polled group, expire old ones and reschedule it"""
+        now = time.monotonic()
+        settled: List[Tuple[_Tracked, Any, Optional[BaseException]]] = []
+        progressed = False
+        with self._lock:
+            group.polling = False
+            self.polls += 1
+            for order_id, tracked in list(group.orders.items()):
+                order = (found or {}).get(order_id)
+                status = order.get("txStatus") if order is not None else None
+                if status != tracked.status:
+                    # Newly indexed or changed status counts as progress too
+                    tracked.status = status
+                    progressed = True
+                if status in FINAL_STATUSES:
+                    settled.append((tracked, order, None))
+                elif now - tracked.since >= self.expire_after:
+                    settled.append((tracked, None, TimeoutError(
+                        f"order {order_id} not final after {self.expire_after:g}s")))
+                else:
+                    continue
+                del group.orders[order_id]
+            if progressed:
+                group.interval = self.min_interval
+            else:
+                group.interval = min(self.max_interval, group.interval * self.backoff)
+            group.due = now + group.interval
+            if not group.orders:
+                self._groups.pop((group.chain_index, group.address.lower()), None)
+
+        for tracked, order, error in settled:
+            if not tracked.future.set_running_or_notify_cancel():
+                continue  # cancelled by the caller
+            if error is not None:
+                self.expired += 1
+                tracked.future.set_exception(error)
+                continue
+            self.resolved += 1
+            tracked.future.set_result(order)
+            if tracked.callback is not None:
+                try:
+                    tracked.callback(order)
+                except Exception:
+                    # A failing callback must not stop the polling loop
+                    self.callback_errors += 1
+
+    def poll(self) -> None:
+        """Poll every due group once, concurrently"""
+        groups = self._claim_due()
+        if not groups:
+            return
+        for _, group, found, error in iter_concurrent(self._poll, groups,
+                                                      max_concurrency=self.max_concurrency):
+            # A failed poll leaves the orders pending and backs the group off
+            self._settle(group, None if error is not None else found)
+
+    async def apoll(self) -> None:
+        """Async variant of poll() for an AsyncWalletClient"""
+        groups = self._claim_due()
+        if not groups:
+            return
+        async for _, group, found, error in aiter_concurrent(self._apoll, groups,
+                                                             max_concurrency=self.max_concurrency):
+            self._settle(group, None if error is not None else found)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.poll()
+            self._wake.wait(self._wait_time())
+            self._wake.clear()
+
+    def start(self) -> "TransactionTracker":
+        """Poll in a daemon thread until stop()"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="okxpy-tx-tracker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread or task; tracked futures stay pending"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        """Polling loop for an AsyncWalletClient; runs until cancelled or stop()"""
+        import asyncio
+        while not self._stop.is_set():
+            await self.apoll()
+            # Wake at least every min_interval so newly tracked orders are noticed
+            await asyncio.sleep(min(self._wait_time(), self.min_interval))
+
+    def astart(self):
+        """Schedule run() as an asyncio task on the running loop and return it"""
+        import asyncio
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            groups = len(self._groups)
+        return {"groups": groups, "pending": self.pending(), "polls": self.polls,
+                "requests": self.requests, "resolved": self.resolved, "expired": self.expired,
+                "callback_errors": self.callback_errors}
+
+    def __enter__(self) -> "TransactionTracker":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
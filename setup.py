@@ -30,6 +30,18 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "otel": [
+            "opentelemetry-api>=1.0.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
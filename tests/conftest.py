@@ -0,0 +1,18 @@
+import pytest
+
+from okxpy import OKXClient
+from okxpy.emulator import Emulator
+
+EVM_ADDRESS = "0x52908400098527886E0F7030069857D2E4169EE7"
+
+
+@pytest.fixture
+def emulator():
+    with Emulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def client(emulator):
+    with OKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+        yield client
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.wallet.address import AddressValidator, check_address, keccak256, to_checksum_address
+
+VALIDATE_PATH = "/api/v5/wallet/pre-transaction/validate-address"
+
+# EIP-55 test vectors
+CHECKSUMMED = [
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+
+def test_keccak256():
+    assert keccak256(b"").hex() == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+
+
+@pytest.mark.parametrize("address", CHECKSUMMED)
+def test_eip55_checksum(address):
+    assert to_checksum_address(address.lower()) == address
+    assert check_address("1", address) is None
+    assert check_address("1", address.lower()) is None
+    assert check_address("1", address.swapcase().replace("0X", "0x")) == "invalid EIP-55 checksum"
+
+
+@pytest.mark.parametrize("chain_index, address, reason", [
+    ("1", "0x1234", "expected 0x followed by 40 hex characters"),
+    ("195", "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", None),
+    ("195", "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6u", "invalid base58check checksum"),
+    ("501", "So11111111111111111111111111111111111111112", None),
+    ("501", "So1111111111111111111111111111111111111111O", "invalid base58 character 'O'"),
+    ("999999", "anything", None),
+])
+def test_local_checks(chain_index, address, reason):
+    assert check_address(chain_index, address) == reason
+
+
+def test_validate_many(emulator, client):
+    addresses = [("1", CHECKSUMMED[0]), ("1", "0xbad"), ("1", CHECKSUMMED[1]), ("1", CHECKSUMMED[0].lower())]
+    validator = AddressValidator(client.wallet)
+    verdicts = sorted(validator.validate_many(addresses), key=lambda verdict: verdict.index)
+
+    assert [verdict.index for verdict in verdicts] == [0, 1, 2, 3]
+    assert [verdict.valid for verdict in verdicts] == [True, False, True, True]
+    assert verdicts[1].source == "local"
+    # The lowercase duplicate is served from the cache or the shared call
+    assert emulator.requests[VALIDATE_PATH] == validator.stats()["api_calls"] == 2
+
+
+def test_duplicate_lookups_share_one_call(emulator, client):
+    emulator.route_latency[VALIDATE_PATH] = 0.2
+    validator = AddressValidator(client.wallet, max_concurrency=4)
+    verdicts = list(validator.validate_many([("1", CHECKSUMMED[0])] * 4))
+
+    assert all(verdict.usable for verdict in verdicts)
+    assert emulator.requests[VALIDATE_PATH] == 1
+    assert validator.stats()["api_calls"] == 1
+    assert validator.stats()["coalesced"] == 3
+
+
+def test_async_duplicate_lookups_share_one_call(emulator):
+    emulator.route_latency[VALIDATE_PATH] = 0.2
+
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            validator = AddressValidator(client.wallet, max_concurrency=4)
+            return [verdict async for verdict in validator.avalidate_many([("1", CHECKSUMMED[2])] * 4)]
+
+    verdicts = asyncio.run(run())
+    assert sorted(verdict.index for verdict in verdicts) == [0, 1, 2, 3]
+    assert all(verdict.usable for verdict in verdicts)
+    assert emulator.requests[VALIDATE_PATH] == 1
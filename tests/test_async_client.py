@@ -0,0 +1,43 @@
+import asyncio
+
+from okxpy import AsyncOKXClient, OKXAuth
+from okxpy.defi.client import AsyncDefiClient
+from okxpy.utils.http import AsyncHTTPTransport
+from okxpy.wallet.client import AsyncWalletClient
+
+from .conftest import EVM_ADDRESS
+
+
+def test_async_client_against_emulator(emulator):
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            responses = await asyncio.gather(*(client.wallet.get_nonce("1", EVM_ADDRESS) for _ in range(5)))
+        return responses, client.transport
+
+    responses, transport = asyncio.run(run())
+    assert [response["code"] for response in responses] == ["0"] * 5
+    assert transport.client.is_closed
+
+
+def test_standalone_clients_close_their_own_transport():
+    auth = OKXAuth("key", "secret", "passphrase", "project")
+
+    async def run():
+        async with AsyncWalletClient(auth) as wallet, AsyncDefiClient(auth) as defi:
+            pass
+        return wallet.transport, defi.transport
+
+    for transport in asyncio.run(run()):
+        assert transport.client.is_closed
+
+
+def test_shared_transport_is_left_open():
+    auth = OKXAuth("key", "secret", "passphrase", "project")
+
+    async def run():
+        async with AsyncHTTPTransport() as transport:
+            async with AsyncWalletClient(auth, transport):
+                pass
+            return transport.client.is_closed
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1,28 @@
+from okxpy import OKXClient
+from okxpy.auth import encode_request
+
+from .conftest import EVM_ADDRESS
+
+QUOTE_PATH = "/api/v5/dex/aggregator/quote"
+
+
+def test_encoding_is_canonical():
+    request_path, body = encode_request(QUOTE_PATH, {"b": "1,2", "a": "x y"}, {"z": 1, "memo": "café"})
+    assert request_path == f"{QUOTE_PATH}?a=x+y&b=1,2"
+    assert body == '{"memo":"café","z":1}'.encode("utf-8")
+
+
+def test_emulator_accepts_signed_requests(emulator, client):
+    ext_json = {"inputData": "0x", "memo": "café ü"}
+    assert client.wallet.get_sign_info("1", EVM_ADDRESS, EVM_ADDRESS, "0", ext_json)["code"] == "0"
+    assert client.dex.get_quote("1", "1000000", EVM_ADDRESS, EVM_ADDRESS)["code"] == "0"
+    assert emulator.auth_failures == 0
+
+
+def test_wrong_secret_is_rejected(emulator):
+    credentials = dict(emulator.credentials(), secret_key="not-the-secret")
+    with OKXClient(base_url=emulator.url, **credentials) as client:
+        response = client.dex.get_quote("1", "1000000", EVM_ADDRESS, EVM_ADDRESS)
+
+    assert response["code"] == "401" and "50113" in response["msg"]
+    assert emulator.auth_failures == 1
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.exceptions import OKXAPIError
+from okxpy.wallet.broadcast import AsyncBroadcastQueue, BroadcastDropped, BroadcastQueue
+from okxpy.wallet.nonce import NonceManager
+
+from .conftest import EVM_ADDRESS
+
+BROADCAST_PATH = "/api/v5/wallet/pre-transaction/broadcast-transaction"
+
+
+def test_broadcasts_are_sent_in_order(emulator, client):
+    with BroadcastQueue(client.wallet, workers=4) as broadcasts:
+        futures = [broadcasts.submit(f"0xsigned{i}", "1", EVM_ADDRESS) for i in range(5)]
+        order_ids = [future.result(timeout=5) for future in futures]
+    assert order_ids == sorted(order_ids)
+    assert broadcasts.stats()["sent"] == 5
+    assert emulator.fixtures.nonces[("1", EVM_ADDRESS.lower())] == 5
+
+
+def test_failure_drops_the_rest_of_the_lane(emulator, client):
+    emulator.fail_next(BROADCAST_PATH, status=200, response={"code": "81001", "msg": "insufficient funds"})
+    nonces = NonceManager(client.wallet)
+    with BroadcastQueue(client.wallet, workers=1, nonces=nonces) as broadcasts:
+        futures = [broadcasts.submit(f"0xsigned{i}", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+                   for i in range(3)]
+        broadcasts.join(timeout=5)
+
+    with pytest.raises(OKXAPIError) as failed:
+        futures[0].result()
+    for future in futures[1:]:
+        with pytest.raises(BroadcastDropped) as dropped:
+            future.result()
+        assert dropped.value.cause is failed.value
+    assert broadcasts.stats()["failed"] == 1
+    assert broadcasts.stats()["dropped"] == 2
+    # A rejection unrelated to the nonce hands every nonce of the lane back
+    assert nonces.resyncs == 0
+    assert [nonces.next("1", EVM_ADDRESS) for _ in range(3)] == [0, 1, 2]
+
+
+def test_cancelled_broadcast_releases_its_nonce(emulator, client):
+    emulator.route_latency[BROADCAST_PATH] = 0.3
+    nonces = NonceManager(client.wallet)
+    with BroadcastQueue(client.wallet, workers=1, nonces=nonces) as broadcasts:
+        first = broadcasts.submit("0xfirst", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+        time.sleep(0.1)
+        cancelled = broadcasts.submit("0xcancelled", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+        last = broadcasts.submit("0xlast", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+        assert cancelled.cancel()
+        broadcasts.join(timeout=5)
+
+    assert first.result()
+    with pytest.raises(CancelledError):
+        cancelled.result()
+    with pytest.raises(BroadcastDropped) as dropped:
+        last.result()
+    assert isinstance(dropped.value.cause, CancelledError)
+    assert broadcasts.stats()["sent"] == 1
+    assert broadcasts.stats()["cancelled"] == 1
+    assert nonces.next("1", EVM_ADDRESS) == 1
+
+
+def test_async_queue(emulator):
+    async def run():
+        emulator.fail_next(BROADCAST_PATH, status=200, response={"code": "81001", "msg": "insufficient funds"})
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            async with AsyncBroadcastQueue(client.wallet, workers=1) as broadcasts:
+                futures = [await broadcasts.submit(f"0xsigned{i}", "1", EVM_ADDRESS) for i in range(2)]
+                futures.append(await broadcasts.submit("0xother", "1", EVM_ADDRESS.replace("E7", "E8")))
+                results = await asyncio.gather(*futures, return_exceptions=True)
+        return results, broadcasts.stats()
+
+    (failed, dropped, sent), stats = asyncio.run(run())
+    assert isinstance(failed, OKXAPIError)
+    assert isinstance(dropped, BroadcastDropped) and dropped.cause is failed
+    assert isinstance(sent, str)
+    assert (stats["sent"], stats["failed"], stats["dropped"]) == (1, 1, 1)
+
+
+def test_close_without_wait_cancels_queued_broadcasts(emulator, client):
+    emulator.route_latency[BROADCAST_PATH] = 0.3
+    nonces = NonceManager(client.wallet)
+    broadcasts = BroadcastQueue(client.wallet, workers=1, nonces=nonces)
+    first = broadcasts.submit("0xfirst", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+    time.sleep(0.1)
+    queued = [broadcasts.submit(f"0xqueued{i}", "1", EVM_ADDRESS, nonce=nonces.next("1", EVM_ADDRESS))
+              for i in range(2)]
+    broadcasts.close(wait=False)
+
+    assert all(future.cancelled() for future in queued)
+    assert broadcasts.join(timeout=5)
+    assert first.result(timeout=0)
+    assert broadcasts.stats()["cancelled"] == 2
+    assert nonces.next("1", EVM_ADDRESS) == 1
+
+
+def test_async_close_without_wait_settles_every_broadcast(emulator):
+    async def run():
+        emulator.route_latency[BROADCAST_PATH] = 0.3
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            nonces = NonceManager(client.wallet)
+            broadcasts = AsyncBroadcastQueue(client.wallet, workers=1, nonces=nonces)
+            futures = [await broadcasts.submit(f"0xsigned{i}", "1", EVM_ADDRESS,
+                                               nonce=await nonces.anext("1", EVM_ADDRESS))
+                       for i in range(3)]
+            await asyncio.sleep(0.1)
+            await broadcasts.close(wait=False)
+            await asyncio.wait_for(broadcasts.join(), 1)
+            return futures, broadcasts.stats(), await nonces.anext("1", EVM_ADDRESS)
+
+    futures, stats, nonce = asyncio.run(run())
+    assert all(future.cancelled() for future in futures)
+    assert (stats["pending"], stats["cancelled"]) == (0, 3)
+    # The in-flight broadcast may have gone out; only the queued nonces come back
+    assert nonce == 1
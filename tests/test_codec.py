@@ -0,0 +1,38 @@
+from okxpy import OKXClient
+from okxpy.dex.constants import CHAINS
+from okxpy.dex.models import Quote
+from okxpy.utils.codec import ApiResponse
+
+ETHEREUM = CHAINS["Ethereum"]["Addr"]
+
+
+def test_to_dict_round_trips_unknown_keys():
+    payload = {"chainId": "1", "toTokenAmount": "42",
+               "toToken": {"tokenSymbol": "USDC", "isHoneyPot": False}, "newField": [1, 2]}
+    quote = Quote.from_dict(payload)
+
+    assert quote.to_dict() == payload
+    assert quote["newField"] == [1, 2]
+    assert quote.to_token["isHoneyPot"] is False
+
+
+def test_absent_fields_are_not_keys():
+    quote = Quote.from_dict({"chainId": "1"})
+
+    assert quote.to_token_amount is None
+    assert "toTokenAmount" not in quote
+    assert quote.get("toTokenAmount", "0") == "0"
+    assert list(quote.keys()) == ["chainId"]
+    quote.to_token_amount = "5"
+    assert "toTokenAmount" in quote
+
+
+def test_client_models_match_raw_payload(emulator):
+    usdt, usdc = ETHEREUM["USDT_ADDR"], ETHEREUM["USDC_ADDR"]
+    with OKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+        raw = client.dex.get_quote("1", "1000000", usdt, usdc)
+    with OKXClient(base_url=emulator.url, models=True, **emulator.credentials()) as client:
+        typed = client.dex.get_quote("1", "1000000", usdt, usdc)
+
+    assert isinstance(typed, ApiResponse) and isinstance(typed["data"][0], Quote)
+    assert typed.to_dict() == raw
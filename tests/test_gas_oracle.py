@@ -0,0 +1,142 @@
+import asyncio
+import time
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.exceptions import OKXAPIError
+from okxpy.wallet.gas import GasOracle
+
+from .conftest import EVM_ADDRESS
+
+GAS_PRICE_PATH = "/api/v5/wallet/pre-transaction/gas-price"
+
+
+def _price(emulator, *prices):
+    for price in prices:
+        emulator.fail_next(GAS_PRICE_PATH, status=200,
+                           response={"code": "0", "msg": "", "data": [{"normal": str(price)}]})
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_refresh_fetches_each_chain_once(emulator, client):
+    oracle = GasOracle(client.wallet, ["1", "56"])
+    assert oracle.latest("1") is None and oracle.age("1") is None
+
+    oracle.refresh()
+    assert emulator.requests[GAS_PRICE_PATH] == 2
+    assert oracle.price("1") == int(oracle.latest("1")["normal"])
+    assert oracle.age("56") >= 0
+
+    # Nothing is due again before min_interval
+    oracle.refresh()
+    assert emulator.requests[GAS_PRICE_PATH] == 2
+
+
+def test_failed_refresh_keeps_the_last_price(emulator, client):
+    oracle = GasOracle(client.wallet, ["1"], min_interval=1.0, max_interval=10.0)
+    emulator.fail_next(GAS_PRICE_PATH, status=500)
+    oracle.refresh(["1"])
+    assert oracle.latest("1") is None
+
+    _price(emulator, 100)
+    oracle.refresh(["1"])
+    emulator.fail_next(GAS_PRICE_PATH, status=None)
+    emulator.fail_next(GAS_PRICE_PATH, status=200, response={"code": "50011", "msg": "Too frequent"})
+    oracle.refresh(["1"])
+    oracle.refresh(["1"])
+
+    chain = oracle.stats()["chains"]["1"]
+    assert oracle.price("1") == 100
+    assert chain["refreshes"] == 4 and chain["errors"] == 3
+    assert isinstance(oracle._chains["1"].last_error, OKXAPIError)
+    # Failures back off like a flat price
+    assert chain["interval"] == 1.0 * 1.5 ** 4
+
+
+def test_interval_adapts_to_price_movement(emulator, client):
+    oracle = GasOracle(client.wallet, ["1"], min_interval=1.0, max_interval=2.0, volatility=0.05)
+    intervals = []
+    for price in (100, 101, 200, 150, 150, 150):
+        _price(emulator, price)
+        oracle.refresh(["1"])
+        intervals.append(oracle.stats()["chains"]["1"]["interval"])
+
+    assert intervals == [1.5, 2.0, 1.0, 1.0, 1.5, 2.0]
+
+
+def test_subscribers_are_notified_of_cumulative_moves(emulator, client):
+    oracle = GasOracle(client.wallet, ["1", "56"])
+    moves, other = [], []
+
+    def record(chain, old, new):
+        moves.append((chain, old["normal"], new["normal"]))
+
+    def broken(chain, old, new):
+        raise RuntimeError("subscriber failed")
+
+    unsubscribe = oracle.subscribe(record, chains=["1"], threshold=0.1)
+    oracle.subscribe(lambda chain, old, new: other.append(chain), threshold=0.0)
+    oracle.subscribe(broken, threshold=0.0)
+
+    for price in (100, 105, 112, 113):
+        _price(emulator, price)
+        oracle.refresh(["1"])
+    unsubscribe()
+    _price(emulator, 500)
+    oracle.refresh(["1"])
+
+    assert moves == [("1", "105", "112")]
+    assert other == ["1"] * 4
+    assert oracle.stats()["callback_errors"] == 4
+
+
+def test_background_thread_and_chain_changes(emulator, client):
+    with GasOracle(client.wallet, ["1"], min_interval=0.05, max_interval=0.1) as oracle:
+        _wait_until(lambda: oracle.latest("1") is not None)
+        oracle.add_chain("56")
+        _wait_until(lambda: oracle.latest("56") is not None)
+        oracle.remove_chain("1")
+
+    assert oracle.latest("56") is not None and oracle.chains == ["56"]
+    assert oracle._thread is None
+
+
+def test_prepare_transaction_uses_the_oracle_price(emulator, client):
+    oracle = GasOracle(client.wallet, ["1"])
+    oracle.refresh()
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, gas_oracle=oracle)
+
+    assert prepared.ok and prepared.gas_price is oracle.latest("1")
+    assert emulator.requests[GAS_PRICE_PATH] == 1
+
+
+def test_async_oracle(emulator):
+    emulator.fail_next(GAS_PRICE_PATH, status=503)
+
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            oracle = GasOracle(client.wallet, ["1"], min_interval=0.05, max_interval=0.1)
+            oracle.astart()
+            for _ in range(100):
+                if oracle.latest("1") is not None:
+                    break
+                await asyncio.sleep(0.01)
+            oracle.stop()
+            return oracle
+
+    oracle = asyncio.run(run())
+    assert oracle.latest("1") is not None
+    assert oracle.stats()["chains"]["1"]["errors"] == 1
+
+
+def test_invalid_intervals_are_rejected(client):
+    with pytest.raises(ValueError):
+        GasOracle(client.wallet, min_interval=0)
+    with pytest.raises(ValueError):
+        GasOracle(client.wallet, min_interval=5, max_interval=1)
@@ -0,0 +1,89 @@
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from okxpy import AsyncOKXClient, OKXClient
+from okxpy.emulator import Emulator
+from okxpy.utils.retry import RetryPolicy
+
+from .conftest import EVM_ADDRESS
+
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+@pytest.fixture
+def h2_emulator():
+    pytest.importorskip("h2")
+    from okxpy.emulator.h2 import H2Emulator
+    with H2Emulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def h2_client(h2_emulator):
+    with OKXClient(base_url=h2_emulator.url, transport="http2", max_streams=8,
+                   **h2_emulator.credentials()) as client:
+        yield client
+
+
+@pytest.mark.skipif(HAS_H2, reason="h2 is installed")
+def test_http2_requires_h2():
+    with pytest.raises(ImportError, match="okxpy\\[http2\\]"):
+        OKXClient(transport="http2", **Emulator().credentials())
+    with pytest.raises(ImportError, match="okxpy\\[http2\\]"):
+        AsyncOKXClient(transport="http2", **Emulator().credentials())
+    with pytest.raises(ImportError, match="okxpy\\[http2\\]"):
+        from okxpy.emulator.h2 import H2Emulator
+        H2Emulator()
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError, match="Unknown transport"):
+        OKXClient(transport="spdy", **Emulator().credentials())
+    with pytest.raises(ValueError, match="Unknown transport"):
+        AsyncOKXClient(transport="spdy", **Emulator().credentials())
+
+
+def test_concurrent_requests_share_one_connection(h2_emulator, h2_client):
+    h2_emulator.route_latency[NONCE_PATH] = 0.02
+    with ThreadPoolExecutor(16) as pool:
+        responses = list(pool.map(lambda _: h2_client.wallet.get_nonce("1", EVM_ADDRESS), range(32)))
+
+    assert [response["code"] for response in responses] == ["0"] * 32
+    assert h2_emulator.connections == 1
+    assert h2_client.pipeline.names() == ["concurrency", "auth", "decode"]
+
+
+def test_reset_stream_and_server_errors(h2_emulator, h2_client):
+    h2_emulator.fail_next(NONCE_PATH, status=None)
+    h2_emulator.fail_next(NONCE_PATH, status=503)
+
+    assert h2_client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "500"
+    assert h2_client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "503"
+    # A reset stream leaves the connection usable
+    assert h2_client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+
+
+def test_failed_streams_are_retried(h2_emulator):
+    h2_emulator.fail_next(NONCE_PATH, status=None, times=2)
+    with OKXClient(base_url=h2_emulator.url, transport="http2",
+                   retry=RetryPolicy(backoff=0.01, jitter=False),
+                   **h2_emulator.credentials()) as client:
+        assert client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+    assert h2_emulator.requests[NONCE_PATH] == 3
+
+
+def test_async_http2_transport(h2_emulator):
+    h2_emulator.fail_next(NONCE_PATH, status=500)
+
+    async def run():
+        async with AsyncOKXClient(base_url=h2_emulator.url, transport="http2",
+                                  **h2_emulator.credentials()) as client:
+            return await asyncio.gather(*(client.wallet.get_nonce("1", EVM_ADDRESS) for _ in range(10)))
+
+    codes = sorted(response["code"] for response in asyncio.run(run()))
+    assert codes == ["0"] * 9 + ["500"]
+    assert h2_emulator.connections == 1
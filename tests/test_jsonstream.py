@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import pytest
+
+from okxpy import AsyncOKXClient, OKXClient
+from okxpy.emulator import Emulator
+from okxpy.emulator.fixtures import Fixtures
+from okxpy.exceptions import OKXAPIError
+from okxpy.utils.jsonstream import ArrayStream
+
+TOKENS_PATH = "/api/v5/dex/aggregator/all-tokens"
+
+
+def _feed_bytewise(parser, body):
+    records = []
+    for i in range(len(body)):
+        records += parser.feed(body[i:i + 1])
+    return records
+
+
+def test_records_split_across_chunks():
+    payload = {"code": "0", "meta": {"tags": ["a", "b"], "data": [9]},
+               "data": [{"name": "café \"quoted\" \\ [x]"}, 1.5e-3, -12, [1, [2]], None, "s"],
+               "msg": "ok"}
+    parser = ArrayStream("data")
+
+    assert _feed_bytewise(parser, json.dumps(payload, ensure_ascii=False).encode("utf-8")) == payload["data"]
+    assert parser.close() == dict(payload, data=[])
+
+
+def test_truncated_and_malformed_bodies_are_rejected():
+    truncated = ArrayStream("data")
+    assert truncated.feed(b'{"code": "0", "data": [{"a": 1}]') == [{"a": 1}]
+    with pytest.raises(ValueError, match="Truncated"):
+        truncated.close()
+
+    cut_record = ArrayStream("data")
+    cut_record.feed(b'{"code": "0", "data": [{"a": 1}, {"b"')
+    with pytest.raises(ValueError):
+        cut_record.close()
+
+    malformed = ArrayStream("data")
+    with pytest.raises(ValueError):
+        malformed.feed(b'{"code": "0", "data": [1 2]}')
+
+
+def test_stream_tokens_matches_get_tokens():
+    with Emulator(fixtures=Fixtures(extra_tokens=300)) as emulator:
+        with OKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            streamed = list(client.dex.stream_tokens("1", chunk_size=256))
+            tokens = client.dex.get_tokens("1")["data"]
+
+    assert len(streamed) > 300
+    assert streamed == tokens
+
+
+def test_api_error_code_raises_after_the_body(emulator, client):
+    with pytest.raises(OKXAPIError) as excinfo:
+        list(client.dex.stream_tokens(""))
+    assert excinfo.value.code == "51000"
+
+
+def test_http_and_connection_errors_raise(emulator, client):
+    emulator.fail_next(TOKENS_PATH, status=503)
+    emulator.fail_next(TOKENS_PATH, status=None)
+
+    with pytest.raises(OKXAPIError) as excinfo:
+        list(client.dex.stream_tokens("1"))
+    assert excinfo.value.code == "503"
+    with pytest.raises(OKXAPIError) as excinfo:
+        list(client.dex.stream_tokens("1"))
+    assert excinfo.value.code == "500"
+
+
+def test_async_stream(emulator):
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            streamed = [token async for token in client.dex.stream_liquidity("1", chunk_size=32)]
+            emulator.fail_next("/api/v5/dex/aggregator/get-liquidity", status=500)
+            with pytest.raises(OKXAPIError):
+                async for _ in client.dex.stream_liquidity("1"):
+                    pass
+            return streamed, (await client.dex.get_liquidity("1"))["data"]
+
+    streamed, liquidity = asyncio.run(run())
+    assert streamed == liquidity
@@ -0,0 +1,83 @@
+import importlib
+import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from okxpy import OKXClient
+from okxpy._lazy import SubClient
+
+from .conftest import EVM_ADDRESS
+
+FEATURE_MODULES = ["okxpy.utils.cache", "okxpy.utils.metrics", "okxpy.utils.ratelimit",
+                   "okxpy.utils.retry", "okxpy.utils.singleflight", "okxpy.utils.snapshot"]
+
+
+def _loaded(code):
+    """Modules of interest loaded by running code in a fresh interpreter"""
+    script = code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    return set(json.loads(output.stdout))
+
+
+def test_importing_the_client_loads_no_transport_or_features():
+    loaded = _loaded("from okxpy import OKXClient, AsyncOKXClient")
+    assert not {"requests", "urllib3", "httpx", *FEATURE_MODULES} & loaded
+
+
+def test_client_only_loads_configured_features():
+    loaded = _loaded("from okxpy import OKXClient\n"
+                     "OKXClient(api_key='k', secret_key='s', passphrase='p', project_id='i', "
+                     "quote_cache=True)")
+    assert {"requests", "okxpy.utils.cache"} <= loaded
+    assert not {"httpx", *FEATURE_MODULES[1:]} & loaded
+
+
+def test_every_lazy_export_resolves():
+    for name in ("okxpy", "okxpy.dex", "okxpy.wallet", "okxpy.defi", "okxpy.marketplace", "okxpy.utils"):
+        package = importlib.import_module(name)
+        for export in package.__all__:
+            assert getattr(package, export) is vars(package)[export]
+        assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_export_raises_attribute_error():
+    import okxpy
+    with pytest.raises(AttributeError, match="no attribute 'DexClient'"):
+        okxpy.DexClient
+    with pytest.raises(ImportError):
+        from okxpy.dex import Missing  # noqa: F401
+
+
+def test_service_modules_load_on_first_access(emulator):
+    loaded = _loaded("from okxpy import OKXClient\n"
+                     f"client = OKXClient(base_url={emulator.url!r}, "
+                     f"**{emulator.credentials()!r})\n"
+                     "assert client.dex.get_supported_chains()['code'] == '0'")
+    assert "okxpy.dex.client" in loaded
+    assert not {"okxpy.wallet.client", "okxpy.defi.client", "okxpy.marketplace.client"} & loaded
+
+
+def test_sub_client_is_built_once_per_client(emulator):
+    with OKXClient(base_url=emulator.url, **emulator.credentials()) as client, \
+            OKXClient(base_url=emulator.url, **emulator.credentials()) as other:
+        with ThreadPoolExecutor(8) as pool:
+            wallets = set(pool.map(lambda _: id(client.wallet), range(32)))
+        assert len(wallets) == 1
+        assert other.wallet is not client.wallet
+        assert client.wallet.transport is client.transport
+        assert client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+    assert isinstance(OKXClient.wallet, SubClient)
+
+
+def test_missing_credentials_fail_before_loading_services():
+    loaded = _loaded("from okxpy import OKXClient\n"
+                     "try:\n"
+                     "    OKXClient(api_key='k')\n"
+                     "except ValueError:\n"
+                     "    pass\n"
+                     "else:\n"
+                     "    raise SystemExit('no error')")
+    assert not {"requests", "okxpy.wallet.client", "okxpy.dex.client"} & loaded
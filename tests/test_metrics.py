@@ -0,0 +1,123 @@
+import asyncio
+import importlib.util
+
+import pytest
+
+from okxpy import AsyncOKXClient, OKXClient
+from okxpy.utils.metrics import Histogram, Instrumentation
+from okxpy.utils.retry import RetryPolicy
+
+from .conftest import EVM_ADDRESS
+
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+
+
+def _client(emulator, instrumentation, **kwargs):
+    return OKXClient(base_url=emulator.url, instrumentation=instrumentation, **kwargs,
+                     **emulator.credentials())
+
+
+def test_requests_are_recorded_per_endpoint_and_code(emulator):
+    metrics = Instrumentation()
+    seen = []
+    metrics.before_request(lambda info: seen.append(("before", info.path)))
+    metrics.after_request(lambda info, response: seen.append(("after", info.code, response["code"])))
+    with _client(emulator, metrics) as client:
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        client.wallet.get_nonce("1", "")
+
+    assert seen == [("before", NONCE_PATH), ("after", "0", "0"),
+                    ("before", NONCE_PATH), ("after", "51000", "51000")]
+    assert metrics.requests[(NONCE_PATH, "GET", "0")] == 1
+    assert metrics.errors == {(NONCE_PATH, "51000"): 1}
+    assert metrics.bytes_in[NONCE_PATH] > 0
+    assert {"sign", "ttfb", "decode", "total"} <= set(metrics.summary()[NONCE_PATH])
+    assert metrics.summary()[NONCE_PATH]["total"]["count"] == 2
+
+
+def test_http_and_transport_errors_are_counted(emulator):
+    metrics = Instrumentation()
+    responses = []
+    metrics.after_request(lambda info, response: responses.append((info.code, info.error, response)))
+    emulator.fail_next(NONCE_PATH, status=503)
+    emulator.fail_next(NONCE_PATH, status=None)
+    with _client(emulator, metrics) as client:
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+
+    assert metrics.errors == {(NONCE_PATH, "503"): 1, (NONCE_PATH, "error"): 1}
+    code, error, response = responses[1]
+    assert code == "error" and error is not None and response is None
+
+
+def test_every_retry_attempt_is_recorded(emulator):
+    metrics = Instrumentation()
+    emulator.fail_next(NONCE_PATH, status=500, times=2)
+    with _client(emulator, metrics, retry=RetryPolicy(backoff=0.01, jitter=False)) as client:
+        assert client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+
+    assert metrics.requests[(NONCE_PATH, "GET", "500")] == 2
+    assert metrics.requests[(NONCE_PATH, "GET", "0")] == 1
+
+
+def test_prometheus_text(emulator):
+    metrics = Instrumentation(buckets=(0.5, 10.0))
+    emulator.fail_next(NONCE_PATH, status=500)
+    with _client(emulator, metrics) as client:
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+    text = metrics.prometheus_text()
+
+    endpoint = f'endpoint="{NONCE_PATH}"'
+    assert "# TYPE okxpy_request_duration_seconds histogram" in text
+    assert f'okxpy_request_duration_seconds_bucket{{{endpoint},phase="total",le="+Inf"}} 2' in text
+    assert f'okxpy_request_duration_seconds_count{{{endpoint},phase="total"}} 2' in text
+    assert f'okxpy_requests_total{{{endpoint},method="GET",code="0"}} 1' in text
+    assert f'okxpy_request_errors_total{{{endpoint},code="500"}} 1' in text
+    assert f'okxpy_bytes_total{{{endpoint},direction="in"}}' in text
+    assert text.endswith("\n")
+
+    metrics.reset()
+    assert "okxpy_requests_total{" not in metrics.prometheus_text()
+
+
+def test_label_values_are_escaped():
+    metrics = Instrumentation()
+    info = metrics.begin("GET", 'odd"path\\', 'odd"path\\', b"")
+    metrics.end(info, status=200, response={"code": "0"})
+
+    assert 'endpoint="odd\\"path\\\\"' in metrics.prometheus_text()
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    assert histogram.quantile(0.5) is None
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == float("inf")
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("opentelemetry") is not None,
+                    reason="opentelemetry-api is installed")
+def test_opentelemetry_requires_its_package():
+    with pytest.raises(ImportError, match="okxpy\\[otel\\]"):
+        Instrumentation(opentelemetry=True)
+
+
+def test_async_transport_is_instrumented(emulator):
+    metrics = Instrumentation()
+    emulator.fail_next(NONCE_PATH, status=None)
+
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, instrumentation=metrics,
+                                  **emulator.credentials()) as client:
+            await client.wallet.get_nonce("1", EVM_ADDRESS)
+            await client.wallet.get_nonce("1", EVM_ADDRESS)
+
+    asyncio.run(run())
+    assert metrics.requests[(NONCE_PATH, "GET", "error")] == 1
+    assert metrics.requests[(NONCE_PATH, "GET", "0")] == 1
+    assert metrics.summary()[NONCE_PATH]["total"]["count"] == 2
@@ -0,0 +1,84 @@
+import pytest
+import requests
+
+from okxpy.exceptions import OKXAPIError
+from okxpy.utils.codec import ApiResponse
+from okxpy.wallet.nonce import NonceManager
+
+from .conftest import EVM_ADDRESS
+
+
+@pytest.fixture
+def nonces(emulator, client):
+    emulator.fixtures.nonces[("1", EVM_ADDRESS.lower())] = 5
+    return NonceManager(client.wallet)
+
+
+def test_nonces_are_allocated_locally(nonces):
+    assert [nonces.next("1", EVM_ADDRESS) for _ in range(3)] == [5, 6, 7]
+    assert nonces.fetches == 1
+
+
+@pytest.mark.parametrize("response", [
+    {"code": "0", "data": [{"orderId": "1"}]},
+    ApiResponse.parse({"code": "0", "data": [{"orderId": "1"}]}),
+])
+def test_successful_broadcast_keeps_nonce(nonces, response):
+    nonce = nonces.next("1", EVM_ADDRESS)
+    assert nonces.report("1", EVM_ADDRESS, nonce, response) is True
+    assert nonces.next("1", EVM_ADDRESS) == 6
+
+
+@pytest.mark.parametrize("failure", [
+    {"response": {"code": "50011", "msg": "Too Many Requests"}},
+    {"response": ApiResponse.parse({"code": "429", "msg": "Client-side rate limit exceeded"})},
+    {"response": {"code": "81001", "msg": "insufficient funds"}},
+    {"error": requests.exceptions.ConnectTimeout()},
+    {"error": OKXAPIError("81001", "insufficient funds")},
+])
+def test_rejected_broadcast_releases_nonce(nonces, failure):
+    nonce = nonces.next("1", EVM_ADDRESS)
+    nonces.next("1", EVM_ADDRESS)
+    assert nonces.report("1", EVM_ADDRESS, nonce, **failure) is False
+    assert nonces.next("1", EVM_ADDRESS) == 5
+    assert nonces.resyncs == 0
+
+
+@pytest.mark.parametrize("failure", [
+    {"response": {"code": "500", "msg": "Internal Server Error"}},
+    {"error": requests.exceptions.ReadTimeout()},
+])
+def test_possibly_sent_broadcast_keeps_nonce(nonces, failure):
+    nonce = nonces.next("1", EVM_ADDRESS)
+    assert nonces.report("1", EVM_ADDRESS, nonce, **failure) is False
+    assert nonces.next("1", EVM_ADDRESS) == 6
+    assert nonces.resyncs == 0
+
+
+@pytest.mark.parametrize("failure", [
+    {"response": ApiResponse.parse({"code": "81001", "msg": "nonce too low"})},
+    {"error": OKXAPIError("81001", "Nonce gap detected")},
+])
+def test_nonce_error_resyncs(nonces, failure):
+    nonce = nonces.next("1", EVM_ADDRESS)
+    assert nonces.report("1", EVM_ADDRESS, nonce, **failure) is False
+    assert nonces.peek("1", EVM_ADDRESS) is None
+    assert nonces.next("1", EVM_ADDRESS) == 5
+    assert nonces.resyncs == 1
+    assert nonces.fetches == 2
+
+
+def test_reserve_releases_nonce_when_signing_fails(nonces):
+    with pytest.raises(RuntimeError):
+        with nonces.reserve("1", EVM_ADDRESS):
+            raise RuntimeError("signer unavailable")
+    assert nonces.next("1", EVM_ADDRESS) == 5
+    assert nonces.resyncs == 0
+
+
+def test_reserve_keeps_reported_outcome(nonces):
+    with pytest.raises(RuntimeError):
+        with nonces.reserve("1", EVM_ADDRESS) as nonce:
+            nonces.report("1", EVM_ADDRESS, nonce, {"code": "0", "data": [{"orderId": "1"}]})
+            raise RuntimeError("bookkeeping failed")
+    assert nonces.next("1", EVM_ADDRESS) == 6
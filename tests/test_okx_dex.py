@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from okx_dex import OkxDEX
+from okxpy.dex.constants import CHAINS
+from okxpy.utils.http import HTTPTransport
+
+
+@pytest.fixture
+def dex(emulator, tmp_path):
+    credentials = emulator.credentials()
+    path = tmp_path / "okx_credentials.json"
+    path.write_text(json.dumps({
+        "access_key": credentials["api_key"],
+        "secret_key": credentials["secret_key"],
+        "passphrase": credentials["passphrase"],
+        "access_project": credentials["project_id"],
+        "solana_wallet_addr": "So11111111111111111111111111111111111111112",
+    }))
+    with HTTPTransport(emulator.url) as transport:
+        yield OkxDEX(str(path), transport)
+
+
+@pytest.mark.parametrize("chain_name, token_key", [("Solana", "BTC_MINT_ADDR"), ("Ethereum", "WBTC_ADDR")])
+def test_usdt_quotes_resolve_through_the_registry(dex, chain_name, token_key):
+    chain = CHAINS[chain_name]
+    response = dex.sell_token_to_usdt(chain_name, chain["Addr"][token_key], "1000")
+
+    assert response["code"] == "0"
+    assert response["data"][0]["fromToken"]["tokenContractAddress"] == \
+        dex.tokens.address_of(chain["chain_id"], "USDT")
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.exceptions import OKXAPIError
+
+from .conftest import EVM_ADDRESS
+
+SUI_PATH = "/api/v5/wallet/pre-transaction/sui-object"
+PRODUCTS_PATH = "/api/v5/defi/explore/product/list"
+SUI_TOKEN = "0x2::sui::SUI"
+
+
+def test_cursor_pages_are_walked_to_the_end(emulator, client):
+    objects = list(client.wallet.iter_sui_objects("784", EVM_ADDRESS, SUI_TOKEN, limit="10"))
+
+    assert len(objects) == 25
+    assert len({obj["objectId"] for obj in objects}) == 25
+    assert emulator.requests[SUI_PATH] == 3
+
+
+def test_offset_pages_stop_at_total(emulator, client):
+    products = list(client.defi.explore.iter_products("ETH", "1", limit="10"))
+
+    assert len(products) == 24
+    assert emulator.requests[PRODUCTS_PATH] == 3
+
+
+def test_failed_page_raises_after_earlier_items(emulator, client):
+    first_page = {"code": "0", "msg": "",
+                  "data": [{"cursor": "2", "data": [{"objectId": "a"}, {"objectId": "b"}]}]}
+    emulator.fail_next(SUI_PATH, status=200, response=first_page)
+    emulator.fail_next(SUI_PATH, status=500)
+
+    seen = []
+    with pytest.raises(OKXAPIError) as excinfo:
+        for obj in client.wallet.iter_sui_objects("784", EVM_ADDRESS, SUI_TOKEN, limit="2"):
+            seen.append(obj["objectId"])
+
+    assert seen == ["a", "b"]
+    assert excinfo.value.code == "500"
+
+
+def test_api_error_on_first_page(emulator, client):
+    # network is required by product/list
+    with pytest.raises(OKXAPIError) as excinfo:
+        list(client.defi.explore.iter_products("", "1"))
+    assert excinfo.value.code == "51000"
+
+
+def test_abandoned_iterator_stops_prefetching(emulator, client):
+    emulator.route_latency[SUI_PATH] = 0.02
+    for _ in client.wallet.iter_sui_objects("784", EVM_ADDRESS, SUI_TOKEN, limit="5", max_buffered_pages=1):
+        break
+    time.sleep(0.3)
+
+    # Consumed page, one buffered page and at most one fetch blocked on the full buffer
+    assert emulator.requests[SUI_PATH] <= 3
+
+
+def test_async_paginator_raises_page_errors(emulator):
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            products = [product async for product in client.defi.explore.iter_products("ETH", "1", limit="10")]
+            emulator.fail_next(PRODUCTS_PATH, status=None)
+            with pytest.raises(OKXAPIError):
+                async for _ in client.defi.explore.iter_products("ETH", "1"):
+                    pass
+            return products
+
+    assert len(asyncio.run(run())) == 24
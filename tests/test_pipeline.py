@@ -0,0 +1,176 @@
+import asyncio
+import gc
+
+import pytest
+
+from okxpy import AsyncOKXClient, OKXClient
+from okxpy.utils.cache import ResponseCache
+from okxpy.utils.metrics import Instrumentation
+from okxpy.utils.pipeline import (CacheMiddleware, ConcurrencyMiddleware, Middleware, Pipeline, Request,
+                                  SnapshotMiddleware)
+from okxpy.utils.ratelimit import RateLimiter
+from okxpy.utils.retry import RetryPolicy
+from okxpy.utils.snapshot import SnapshotStore
+
+from .conftest import EVM_ADDRESS
+
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+TOKENS_PATH = "/api/v5/dex/aggregator/all-tokens"
+
+
+def test_concurrency_limit_works_across_event_loops():
+    middleware = ConcurrencyMiddleware(1)
+
+    async def call_next():
+        await asyncio.sleep(0)
+        return {"code": "0"}
+
+    async def run():
+        return await asyncio.gather(*(middleware.ahandle(None, call_next) for _ in range(3)))
+
+    assert asyncio.run(run()) == asyncio.run(run()) == [{"code": "0"}] * 3
+
+
+def test_failed_background_refresh_is_retrieved_and_released():
+    cache = ResponseCache(ttls={"/api/v5/dex/aggregator/all-tokens": 0}, stale_ttl=60)
+    middleware = CacheMiddleware(cache)
+    request = Request("GET", "/api/v5/dex/aggregator/all-tokens", {"chainId": "1"})
+    key = cache.key(request.method, request.path, request.params)
+    cache.store(key, {"code": "0", "data": ["stale"]})
+
+    async def call_next():
+        raise ConnectionError("refresh failed")
+
+    async def run():
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        response = await middleware.ahandle(request, call_next)
+        await asyncio.sleep(0.01)
+        gc.collect()
+        return response, unhandled
+
+    response, unhandled = asyncio.run(run())
+    assert response["data"] == ["stale"]
+    assert unhandled == []
+    assert cache.begin_refresh(key)
+
+
+def test_failed_snapshot_recheck_is_retrieved_and_released():
+    store = SnapshotStore(":memory:", max_age=0)
+    middleware = SnapshotMiddleware(store)
+    request = Request("GET", "/api/v5/dex/aggregator/all-tokens", {"chainId": "1"})
+    key = store.key(request.method, request.path, request.params)
+    store.store(key, {"code": "0", "data": [{"tokenSymbol": "USDT"}]})
+
+    async def call_next():
+        raise ConnectionError("re-check failed")
+
+    async def run():
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        response = await middleware.ahandle(request, call_next)
+        await asyncio.sleep(0.01)
+        gc.collect()
+        return response, unhandled
+
+    response, unhandled = asyncio.run(run())
+    assert response["data"] == [{"tokenSymbol": "USDT"}]
+    assert unhandled == []
+    assert store.begin_refresh(key)
+
+
+class Recorder(Middleware):
+    name = "recorder"
+
+    def __init__(self):
+        self.attempts = []
+
+    def after(self, request, response):
+        self.attempts.append(response["code"])
+        return response
+
+
+class ShortCircuit(Middleware):
+    name = "short_circuit"
+
+    def before(self, request):
+        if request.path == NONCE_PATH:
+            return {"code": "0", "data": [{"nonce": "42"}]}
+        return None
+
+
+def test_default_stage_order(emulator):
+    with OKXClient(base_url=emulator.url, cache=True, quote_cache=True, single_flight=True,
+                   retry=RetryPolicy(), rate_limiter=RateLimiter({"dex": (10, 10)}),
+                   instrumentation=Instrumentation(), snapshot=":memory:",
+                   **emulator.credentials()) as client:
+        assert client.pipeline.names() == ["snapshot", "cache", "quote_cache", "single_flight", "retry",
+                                           "rate_limit", "metrics", "auth", "decode"]
+    with OKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+        assert client.pipeline.names() == ["auth", "decode"]
+
+
+def test_stage_inside_retry_sees_every_attempt(emulator):
+    recorder = Recorder()
+    emulator.fail_next(NONCE_PATH, status=500, times=2)
+    with OKXClient(base_url=emulator.url, retry=RetryPolicy(backoff=0.01, jitter=False),
+                   **emulator.credentials()) as client:
+        client.pipeline.add(recorder, after="retry")
+        assert client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+
+        # Moved outside the retry stage it only sees the final response
+        client.pipeline.reorder(["recorder", "retry", "auth", "decode"])
+        emulator.fail_next(NONCE_PATH, status=500)
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+
+    assert recorder.attempts == ["500", "500", "0", "0"]
+
+
+def test_short_circuit_never_reaches_the_api(emulator, client):
+    client.pipeline.add(ShortCircuit(), before="auth")
+    assert client.wallet.get_nonce("1", EVM_ADDRESS)["data"][0]["nonce"] == "42"
+    assert emulator.requests[NONCE_PATH] == 0
+
+    client.pipeline.remove("short_circuit")
+    assert client.wallet.get_nonce("1", EVM_ADDRESS)["data"][0]["nonce"] == "0"
+
+
+def test_async_pipeline_runs_sync_stages(emulator):
+    recorder = Recorder()
+
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            client.pipeline.add(recorder, before="auth")
+            client.pipeline.add(ShortCircuit(), before="recorder")
+            await client.wallet.get_nonce("1", EVM_ADDRESS)
+            emulator.fail_next(TOKENS_PATH, status=None)
+            return await client.dex.get_tokens("1")
+
+    assert asyncio.run(run())["code"] == "500"
+    # The short-circuited call never got to the recorder
+    assert recorder.attempts == ["500"]
+
+
+def test_stage_errors_reach_the_caller(client):
+    class Broken(Middleware):
+        name = "broken"
+
+        def before(self, request):
+            raise RuntimeError("stage failed")
+
+    client.pipeline.add(Broken(), before="auth")
+    with pytest.raises(RuntimeError, match="stage failed"):
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+
+
+def test_invalid_pipeline_edits_are_rejected():
+    pipeline = Pipeline([Recorder(), ShortCircuit()])
+    with pytest.raises(ValueError):
+        pipeline.add(Recorder())
+    with pytest.raises(ValueError):
+        pipeline.add(Middleware(), before="missing")
+    with pytest.raises(ValueError):
+        pipeline.reorder(["recorder"])
+    with pytest.raises(KeyError):
+        pipeline.remove("missing")
+    assert repr(pipeline) == "Pipeline(recorder -> short_circuit)"
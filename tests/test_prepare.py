@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.exceptions import OKXAPIError
+from okxpy.wallet.nonce import NonceManager
+from okxpy.wallet.prepare import PreparationError
+
+from .conftest import EVM_ADDRESS
+
+SIGN_INFO_PATH = "/api/v5/wallet/pre-transaction/sign-info"
+GAS_PRICE_PATH = "/api/v5/wallet/pre-transaction/gas-price"
+GAS_LIMIT_PATH = "/api/v5/wallet/pre-transaction/gas-limit"
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+
+
+def test_bundle_merges_every_call(emulator, client):
+    emulator.fixtures.nonces[("1", EVM_ADDRESS.lower())] = 7
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, "1000")
+
+    assert prepared.ok and prepared.complete
+    assert prepared.nonce == 7 and prepared.gas_limit == "21000"
+    assert prepared.gas_price["normal"] and prepared.sign_info["gasLimit"] == "21000"
+    assert prepared.raise_for_errors() is prepared
+    for path in (SIGN_INFO_PATH, GAS_PRICE_PATH, GAS_LIMIT_PATH, NONCE_PATH):
+        assert emulator.requests[path] == 1
+
+
+def test_failed_calls_fall_back_to_sign_info(emulator, client):
+    emulator.fixtures.nonces[("1", EVM_ADDRESS.lower())] = 3
+    emulator.fail_next(GAS_LIMIT_PATH, status=500)
+    emulator.fail_next(GAS_PRICE_PATH, status=None)
+    emulator.fail_next(NONCE_PATH, status=200, response={"code": "0", "msg": "", "data": []})
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS)
+
+    assert not prepared.ok and prepared.complete
+    assert prepared.failed == ["gas_price", "gas_limit", "nonce"]
+    assert all(isinstance(error, OKXAPIError) for error in prepared.errors.values())
+    assert prepared.gas_limit == "21000" and prepared.nonce == 3
+    assert prepared.gas_price is prepared.sign_info["gasPrice"]
+    assert set(prepared.to_dict()["errors"]) == {"gas_price", "gas_limit", "nonce"}
+    with pytest.raises(PreparationError) as excinfo:
+        prepared.raise_for_errors()
+    assert excinfo.value.errors is prepared.errors
+
+
+def test_failed_sign_info_leaves_the_dedicated_results(emulator, client):
+    emulator.fail_next(SIGN_INFO_PATH, status=200, response={"code": "50014", "msg": "Parameter error"})
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS)
+
+    assert prepared.failed == ["sign_info"] and prepared.sign_info is None
+    assert prepared.complete
+    assert prepared.errors["sign_info"].code == "50014"
+
+
+def test_incomplete_bundle(emulator, client):
+    emulator.fail_next(SIGN_INFO_PATH, status=500)
+    emulator.fail_next(GAS_LIMIT_PATH, status=500)
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS)
+
+    assert not prepared.complete and prepared.gas_limit is None
+    assert "failed=['sign_info', 'gas_limit']" in repr(prepared)
+
+
+def test_failed_bundle_releases_its_nonce(emulator, client):
+    emulator.fail_next(GAS_LIMIT_PATH, status=200, response={"code": "81001", "msg": "execution reverted"})
+    nonces = NonceManager(client.wallet)
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, nonces=nonces)
+
+    assert prepared.failed == ["gas_limit"]
+    assert prepared.nonce is None
+    assert nonces.next("1", EVM_ADDRESS) == 0
+
+
+def test_nonce_manager_errors_are_recorded(emulator, client):
+    emulator.fail_next(NONCE_PATH, status=503)
+    nonces = NonceManager(client.wallet)
+    prepared = client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, nonces=nonces)
+
+    assert prepared.failed == ["nonce"]
+    assert prepared.errors["nonce"].code == "503"
+    # Falls back to sign-info since no nonce was allocated
+    assert prepared.nonce == 0
+    assert nonces.next("1", EVM_ADDRESS) == 0
+
+
+def test_async_bundle_with_failures(emulator):
+    emulator.fail_next(GAS_LIMIT_PATH, status=500)
+
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            nonces = NonceManager(client.wallet)
+            failed = await client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, nonces=nonces)
+            prepared = await client.wallet.prepare_transaction("1", EVM_ADDRESS, EVM_ADDRESS, nonces=nonces)
+            return failed, prepared
+
+    failed, prepared = asyncio.run(run())
+    assert failed.failed == ["gas_limit"] and failed.nonce is None
+    assert prepared.ok and prepared.nonce == 0
@@ -0,0 +1,41 @@
+from decimal import ROUND_DOWN, Decimal
+
+from okxpy import OKXClient
+from okxpy.dex.constants import CHAINS
+from okxpy.utils.cache import QuoteCache
+
+ETHEREUM = CHAINS["Ethereum"]["Addr"]
+USDT, USDC = ETHEREUM["USDT_ADDR"], ETHEREUM["USDC_ADDR"]
+QUOTE_PATH = "/api/v5/dex/aggregator/quote"
+
+
+def _client(emulator, quote_cache):
+    return OKXClient(base_url=emulator.url, quote_cache=quote_cache, **emulator.credentials())
+
+
+def test_only_exact_amounts_hit_by_default(emulator):
+    with _client(emulator, True) as client:
+        first = client.dex.get_quote("1", "1000000", USDT, USDC)
+        again = client.dex.get_quote("1", "1000000", USDT, USDC)
+        nearby = client.dex.get_quote("1", "1000001", USDT, USDC)
+
+    assert (first["cached"], again["cached"], nearby["cached"]) == (False, True, False)
+    assert nearby["data"][0]["fromTokenAmount"] == "1000001"
+    assert emulator.requests[QUOTE_PATH] == 2
+
+
+def test_bucket_hits_scale_every_amount(emulator):
+    with _client(emulator, QuoteCache(bucket=0.01)) as client:
+        fetched = client.dex.get_quote("1", "1000000", USDT, USDC)["data"][0]
+        scaled = client.dex.get_quote("1", "1005000", USDT, USDC)
+
+    quote = scaled["data"][0]
+    assert scaled["cached"] is True
+    assert quote["fromTokenAmount"] == "1005000"
+    assert quote["toTokenAmount"] == str(int(fetched["toTokenAmount"]) * 1005000 // 1000000)
+    # amountOut is a decimal token amount; scaled values keep its precision
+    assert [item["amountOut"] for item in quote["quoteCompareList"]] == \
+        [str((Decimal(item["amountOut"]) * Decimal("1.005")).quantize(Decimal("0.000001"), ROUND_DOWN))
+         for item in fetched["quoteCompareList"]]
+    assert quote["priceImpactPercentage"] == fetched["priceImpactPercentage"]
+    assert emulator.requests[QUOTE_PATH] == 1
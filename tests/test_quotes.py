@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from okxpy import AsyncOKXClient
+from okxpy.dex.constants import CHAINS
+
+ETHEREUM = CHAINS["Ethereum"]["Addr"]
+USDT, USDC = ETHEREUM["USDT_ADDR"], ETHEREUM["USDC_ADDR"]
+QUOTE_PATH = "/api/v5/dex/aggregator/quote"
+
+
+def test_get_quotes_returns_results_in_input_order(emulator, client):
+    emulator.route_latency[QUOTE_PATH] = 0.02
+    amounts = [str(10 ** 6 * (i + 1)) for i in range(6)]
+    results = client.dex.get_quotes([("1", amount, USDT, USDC) for amount in amounts], max_concurrency=3)
+
+    assert [result.index for result in results] == list(range(6))
+    assert all(result.ok for result in results)
+    assert [result.response["data"][0]["fromTokenAmount"] for result in results] == amounts
+    assert emulator.requests[QUOTE_PATH] == 6
+
+
+def test_failed_items_do_not_fail_the_batch(emulator, client):
+    emulator.fail_next(QUOTE_PATH, status=500)
+    requests = [
+        dict(chain_id="1", amount="1000000", from_token_address=USDT, to_token_address=USDC),
+        ("1", "", USDT, USDC),
+        dict(chain_id="1", amount="1000000", from_token_address=USDT, unknown="x"),
+    ]
+    first, second, third = client.dex.get_quotes(requests, max_concurrency=1)
+
+    # Injected server error, API parameter error and a bad call, each kept on its own item
+    assert not first.ok and first.error is None and first.response["code"] == "500"
+    assert not second.ok and second.response["code"] == "51000"
+    assert not third.ok and isinstance(third.error, TypeError) and third.response is None
+
+
+def test_iter_quotes_rejects_zero_concurrency(client):
+    with pytest.raises(ValueError):
+        list(client.dex.iter_quotes([("1", "1000000", USDT, USDC)], max_concurrency=0))
+
+
+def test_async_get_quotes_keeps_errors_per_item(emulator):
+    async def run():
+        async with AsyncOKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            return await client.dex.get_quotes([("1", "1000000", USDT, USDC),
+                                                ("1", "1000000", USDT),
+                                                ("1", "2000000", USDT, USDC)])
+
+    results = asyncio.run(run())
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, TypeError)
@@ -0,0 +1,35 @@
+from okxpy import OKXClient
+from okxpy.emulator import Emulator
+from okxpy.utils.ratelimit import RateLimiter
+
+from .conftest import EVM_ADDRESS
+
+
+def _quotes(client, count):
+    return [client.dex.get_quote("1", "1000000", EVM_ADDRESS, EVM_ADDRESS)["code"] for _ in range(count)]
+
+
+def test_server_rejects_bursts_over_the_limit():
+    with Emulator(rate_limits={"dex": (5, 1)}) as emulator:
+        with OKXClient(base_url=emulator.url, **emulator.credentials()) as client:
+            codes = _quotes(client, 3)
+    assert codes[0] == "0" and "429" in codes
+    assert emulator.throttled >= 1
+
+
+def test_client_limiter_stays_under_the_server_limit():
+    limiter = RateLimiter({"dex": (4, 1)})
+    with Emulator(rate_limits={"dex": (5, 1)}) as emulator:
+        with OKXClient(base_url=emulator.url, rate_limiter=limiter, **emulator.credentials()) as client:
+            codes = _quotes(client, 4)
+    assert codes == ["0"] * 4
+    assert emulator.throttled == 0
+
+
+def test_server_rejection_pauses_the_bucket(emulator):
+    limiter = RateLimiter({"dex": 100}, penalty=0.2)
+    emulator.fail_next("/api/v5/dex/aggregator/quote", status=429,
+                       response={"code": "50011", "msg": "Requests too frequent"})
+    with OKXClient(base_url=emulator.url, rate_limiter=limiter, **emulator.credentials()) as client:
+        assert _quotes(client, 2) == ["429", "0"]
+    assert limiter.stats()["rejections"] == 1
@@ -0,0 +1,98 @@
+import time
+
+from okxpy import OKXClient
+from okxpy.utils.cache import ResponseCache
+
+from .conftest import EVM_ADDRESS
+
+CHAINS_PATH = "/api/v5/dex/aggregator/supported/chain"
+TOKENS_PATH = "/api/v5/dex/aggregator/all-tokens"
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+
+
+def _client(emulator, cache):
+    return OKXClient(base_url=emulator.url, cache=cache, **emulator.credentials())
+
+
+def _wait_for_refresh(cache, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_reference_data_is_served_from_cache(emulator):
+    cache = ResponseCache()
+    with _client(emulator, cache) as client:
+        first = client.dex.get_supported_chains()
+        second = client.dex.get_supported_chains()
+        client.dex.get_tokens("1")
+        client.dex.get_tokens("56")
+
+    assert first["code"] == "0" and second is first
+    assert emulator.requests[CHAINS_PATH] == 1
+    # Parameters are part of the key
+    assert emulator.requests[TOKENS_PATH] == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+
+
+def test_errors_are_not_cached(emulator):
+    cache = ResponseCache()
+    emulator.fail_next(CHAINS_PATH, status=500)
+    with _client(emulator, cache) as client:
+        assert client.dex.get_supported_chains()["code"] == "500"
+        assert client.dex.get_supported_chains()["code"] == "0"
+        assert client.dex.get_supported_chains()["code"] == "0"
+
+    assert emulator.requests[CHAINS_PATH] == 2
+
+
+def test_uncached_endpoints_always_reach_the_api(emulator):
+    with _client(emulator, True) as client:
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+
+    assert emulator.requests[NONCE_PATH] == 2
+
+
+def test_stale_entry_is_served_while_refreshing(emulator):
+    cache = ResponseCache(ttls={CHAINS_PATH: 0.0}, stale_ttl=60.0)
+    with _client(emulator, cache) as client:
+        first = client.dex.get_supported_chains()
+        assert client.dex.get_supported_chains() is first
+        _wait_for_refresh(cache)
+
+    assert emulator.requests[CHAINS_PATH] == 2
+    assert cache.stats()["stale_hits"] == 1 and cache.stats()["refreshes"] == 1
+
+
+def test_failed_refresh_keeps_the_stale_entry(emulator):
+    cache = ResponseCache(ttls={CHAINS_PATH: 0.0}, stale_ttl=60.0)
+    with _client(emulator, cache) as client:
+        first = client.dex.get_supported_chains()
+        emulator.fail_next(CHAINS_PATH, status=None)
+        client.dex.get_supported_chains()
+        _wait_for_refresh(cache)
+        assert client.dex.get_supported_chains() is first
+
+
+def test_expired_entry_is_refetched(emulator):
+    cache = ResponseCache(ttls={CHAINS_PATH: 0.0}, stale_ttl=0.0)
+    with _client(emulator, cache) as client:
+        client.dex.get_supported_chains()
+        client.dex.get_supported_chains()
+
+    assert emulator.requests[CHAINS_PATH] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_invalidate_and_eviction(emulator):
+    cache = ResponseCache(maxsize=1)
+    with _client(emulator, cache) as client:
+        client.dex.get_tokens("1")
+        client.dex.get_tokens("56")
+        client.dex.get_tokens("1")
+        cache.invalidate(TOKENS_PATH)
+        client.dex.get_tokens("1")
+
+    assert emulator.requests[TOKENS_PATH] == 4
+    assert cache.stats()["evictions"] == 2
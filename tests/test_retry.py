@@ -0,0 +1,49 @@
+import pytest
+
+from okxpy import OKXClient
+from okxpy.utils.retry import RetryPolicy
+
+from .conftest import EVM_ADDRESS
+
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+BROADCAST_PATH = "/api/v5/wallet/pre-transaction/broadcast-transaction"
+
+
+@pytest.fixture
+def retry():
+    return RetryPolicy(backoff=0.01, jitter=False)
+
+
+@pytest.fixture
+def retrying_client(emulator, retry):
+    with OKXClient(base_url=emulator.url, retry=retry, **emulator.credentials()) as client:
+        yield client
+
+
+def test_get_is_retried_on_server_error(emulator, retry, retrying_client):
+    emulator.fail_next(NONCE_PATH, status=500, times=2)
+    assert retrying_client.wallet.get_nonce("1", EVM_ADDRESS)["code"] == "0"
+    assert emulator.requests[NONCE_PATH] == 3
+    assert retry.stats()["recovered"] == 1
+
+
+def test_broadcast_is_not_resent_after_server_error(emulator, retry, retrying_client):
+    emulator.fail_next(BROADCAST_PATH, status=500)
+    assert retrying_client.wallet.broadcast_transaction("0xsigned", "1", EVM_ADDRESS)["code"] == "500"
+    assert emulator.requests[BROADCAST_PATH] == 1
+    assert retry.stats()["retries"] == 0
+
+
+def test_rate_limited_broadcast_is_resent(emulator, retry, retrying_client):
+    emulator.fail_next(BROADCAST_PATH, status=429, response={"code": "50011", "msg": "Requests too frequent"})
+    assert retrying_client.wallet.broadcast_transaction("0xsigned", "1", EVM_ADDRESS)["code"] == "0"
+    assert emulator.requests[BROADCAST_PATH] == 2
+    assert emulator.fixtures.nonces[("1", EVM_ADDRESS.lower())] == 1
+
+
+def test_retry_unsafe_false_never_resends(emulator):
+    retry = RetryPolicy(backoff=0.01, jitter=False, retry_unsafe=False)
+    emulator.fail_next(BROADCAST_PATH, status=429, response={"code": "50011", "msg": "Requests too frequent"})
+    with OKXClient(base_url=emulator.url, retry=retry, **emulator.credentials()) as client:
+        assert client.wallet.broadcast_transaction("0xsigned", "1", EVM_ADDRESS)["code"] != "0"
+    assert emulator.requests[BROADCAST_PATH] == 1
@@ -0,0 +1,42 @@
+import asyncio
+import threading
+
+from okxpy import OKXClient
+from okxpy.utils.singleflight import SingleFlight
+
+
+def test_identical_requests_share_one_call(emulator):
+    emulator.route_latency["/api/v5/dex/aggregator/supported/chain"] = 0.2
+    with OKXClient(base_url=emulator.url, single_flight=True, **emulator.credentials()) as client:
+        threads = [threading.Thread(target=client.dex.get_supported_chains) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert emulator.requests["/api/v5/dex/aggregator/supported/chain"] == 1
+
+
+def test_async_calls_are_shared_per_event_loop():
+    single_flight = SingleFlight()
+    started = threading.Barrier(2)
+    results = {}
+
+    async def call(name):
+        await asyncio.sleep(0.1)
+        return name
+
+    async def run(name):
+        started.wait()
+        # Both loops use the key at the same time; each must await its own task
+        results[name] = await asyncio.gather(single_flight.do_async("key", lambda: call(name)),
+                                             single_flight.do_async("key", lambda: call(name)))
+
+    threads = [threading.Thread(target=asyncio.run, args=(run(name),)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"a": ["a", "a"], "b": ["b", "b"]}
+    assert single_flight.calls == 2
+    assert single_flight.stats()["in_flight"] == 0
@@ -0,0 +1,97 @@
+import time
+
+from okxpy import OKXClient
+from okxpy.utils.snapshot import SnapshotStore, diff_records
+
+from .conftest import EVM_ADDRESS
+
+TOKENS_PATH = "/api/v5/dex/aggregator/all-tokens"
+NONCE_PATH = "/api/v5/wallet/pre-transaction/nonce"
+
+
+def _client(emulator, snapshot):
+    return OKXClient(base_url=emulator.url, snapshot=snapshot, **emulator.credentials())
+
+
+def _wait_for_recheck(store, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while store._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_snapshot_survives_a_restart(emulator, tmp_path):
+    path = str(tmp_path / "reference.db")
+    store = SnapshotStore(path)
+    with _client(emulator, store) as client:
+        tokens = client.dex.get_tokens("1")
+        # Stored in this process, so not re-checked before max_age
+        assert client.dex.get_tokens("1") is tokens
+    store.close()
+    assert emulator.requests[TOKENS_PATH] == 1
+
+    restarted = SnapshotStore(path)
+    assert restarted.get(TOKENS_PATH, {"chainId": "1"}).version == 1
+    with _client(emulator, restarted) as client:
+        assert client.dex.get_tokens("1") == tokens
+        _wait_for_recheck(restarted)
+
+    # Served from disk, then re-checked once in the background
+    assert emulator.requests[TOKENS_PATH] == 2
+    assert restarted.get(TOKENS_PATH, {"chainId": "1"}).version == 1
+    assert restarted.stats()["hits"] == 1 and restarted.stats()["changes"] == 0
+
+
+def test_changed_dataset_gets_a_new_version(emulator):
+    store = SnapshotStore(":memory:", max_age=0)
+    changes = []
+    store.subscribe(lambda snapshot, diff: changes.append((snapshot.version, diff)))
+    with _client(emulator, store) as client:
+        first = client.dex.get_tokens("1")
+        emulator.fixtures.extra_tokens = 2
+        # The stored version is served while the re-check runs
+        assert client.dex.get_tokens("1") is first
+        _wait_for_recheck(store)
+
+    assert changes == [(1, {"added": len(first["data"]), "updated": 0, "removed": 0}),
+                       (2, {"added": 2, "updated": 0, "removed": 0})]
+    snapshot = store.get(TOKENS_PATH, {"chainId": "1"})
+    assert snapshot.records == len(snapshot.response["data"])
+
+
+def test_failed_recheck_keeps_the_snapshot(emulator):
+    store = SnapshotStore(":memory:", max_age=0)
+    with _client(emulator, store) as client:
+        tokens = client.dex.get_tokens("1")
+        emulator.fail_next(TOKENS_PATH, status=500)
+        assert client.dex.get_tokens("1") is tokens
+        _wait_for_recheck(store)
+        emulator.fail_next(TOKENS_PATH, status=None)
+        assert client.dex.get_tokens("1") is tokens
+        _wait_for_recheck(store)
+
+    assert emulator.requests[TOKENS_PATH] == 3
+    assert store.get(TOKENS_PATH, {"chainId": "1"}).version == 1
+    assert store.stats()["changes"] == 1
+
+
+def test_errors_and_untracked_endpoints_are_not_stored(emulator):
+    store = SnapshotStore(":memory:")
+    emulator.fail_next(TOKENS_PATH, status=503)
+    with _client(emulator, store) as client:
+        assert client.dex.get_tokens("1")["code"] == "503"
+        assert client.dex.get_tokens("")["code"] == "51000"
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        client.wallet.get_nonce("1", EVM_ADDRESS)
+        assert client.dex.get_tokens("1")["code"] == "0"
+
+    assert len(store) == 1
+    assert emulator.requests[NONCE_PATH] == 2
+
+
+def test_diff_records():
+    old = [{"id": "1", "v": 1}, {"id": "2", "v": 1}]
+    new = [{"id": "2", "v": 2}, {"id": "3", "v": 1}]
+
+    assert diff_records(old, new, "id") == {"added": 1, "updated": 1, "removed": 1}
+    # Without an id field an edited record counts as removed and added
+    assert diff_records(old, new) == {"added": 2, "updated": 0, "removed": 2}
@@ -0,0 +1,50 @@
+import time
+
+from okxpy.wallet.tracker import SUCCESS, TransactionTracker
+
+from .conftest import EVM_ADDRESS
+
+
+def _broadcast(client, signed_tx):
+    return client.wallet.broadcast_transaction(signed_tx, "1", EVM_ADDRESS)["data"][0]["orderId"]
+
+
+def test_orders_of_one_address_share_a_paged_poll(emulator, client):
+    emulator.fixtures.confirm_after = 0
+    order_ids = [_broadcast(client, f"0xsigned{i}") for i in range(3)]
+    tracker = TransactionTracker(client.wallet, page_size=10)
+    futures = [tracker.track(order_id, "1", EVM_ADDRESS) for order_id in order_ids]
+    tracker.poll()
+
+    assert [future.result(timeout=0)["txStatus"] for future in futures] == [SUCCESS] * 3
+    assert tracker.stats()["requests"] == 1
+
+
+def test_order_beyond_the_scan_bound_is_looked_up_by_id(emulator, client):
+    emulator.fixtures.confirm_after = 0
+    late = _broadcast(client, "0xlate")
+    _broadcast(client, "0xolder")
+    # Both orders predate tracking by far more than the scan's clock slack
+    old = str(int((time.time() - 600) * 1000))
+    for order in emulator.fixtures.orders:
+        order["createdAt"] = old
+
+    tracker = TransactionTracker(client.wallet, page_size=1)
+    future = tracker.track(late, "1", EVM_ADDRESS)
+    tracker.poll()
+
+    assert future.result(timeout=0)["orderId"] == late
+    assert tracker.stats()["requests"] == 2
+
+
+def test_cancelled_future_does_not_block_the_others(emulator, client):
+    emulator.fixtures.confirm_after = 0
+    first, second = _broadcast(client, "0xa"), _broadcast(client, "0xb")
+    tracker = TransactionTracker(client.wallet)
+    cancelled = tracker.track(first, "1", EVM_ADDRESS)
+    future = tracker.track(second, "1", EVM_ADDRESS)
+    assert cancelled.cancel()
+    tracker.poll()
+
+    assert future.result(timeout=0)["orderId"] == second
+    assert tracker.pending() == 0